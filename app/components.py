@@ -1,23 +1,69 @@
+from collections import Counter
+from functools import cache, lru_cache
 from pathlib import Path
-import os
-from typing import List
+from typing import Dict, List, Optional
 import streamlit as st
 
 from core import registry
+from infra.config_loader import load_config
+from utils.path_utils import iter_target_names
 
 def _normalize_exts(exts: List[str]) -> List[str]:
-    return sorted({(e if e.startswith(".") else f".{e}").lower() for e in exts})
+    return list(_normalize_exts_cached(tuple(exts)))
 
-def sidebar_extension_selector(root: Path) -> List[str]:
+@cache
+def _normalize_exts_cached(exts: tuple[str, ...]) -> tuple[str, ...]:
+    # Same small selection on every rerun -> memoized on the (hashable) tuple
+    return tuple(sorted({(e if e.startswith(".") else f".{e}").lower() for e in exts}))
+
+def _count_suffixes(
+    root_str: str,
+    supported: frozenset[str] | set[str],
+    ignore_dirs: tuple[str, ...] = (),
+) -> Counter:
     """
-    Render a sidebar multiselect for supported file extensions present in `root`.
+    Count files under `root_str` per supported extension (present ones only).
 
-    Returns the selected extensions (dot-prefixed, lowercase). If none are present,
-    shows an informational message and returns [].
+    Walks with utils.path_utils.iter_target_names and the config's ignore_dirs,
+    i.e. the same folder pruning (hidden and ignored names, symlinks) as the scan,
+    so the selector and the discovery count see the files the orchestrator will.
+    """
+    counts: Counter = Counter()
+    if not supported:
+        return counts
+    for name in iter_target_names(root_str, supported, ignore_dirs or None):
+        lname = name.lower()
+        counts[lname[lname.rfind("."):]] += 1
+    return counts
 
-    If the user selects nothing, treat as 'no filters' upstream (scan all supported types).
+# The root folder's mtime only changes when its direct children do, so changes deeper
+# in the tree are picked up by the TTL (or at once via the sidebar's refresh button).
+_DISCOVERY_TTL_S = 30
+
+@st.cache_data(show_spinner=False, ttl=_DISCOVERY_TTL_S)
+def _discover_present_exts(
+    root_str: str,
+    root_mtime_ns: int,
+    supported: frozenset[str],
+    ignore_dirs: tuple[str, ...],
+) -> tuple[tuple[str, ...], Dict[str, int]]:
+    """
+    Single cached walk returning (present extensions, file count per extension),
+    so the selector and the discovery count don't traverse the folder twice.
+    `root_mtime_ns` is only part of the cache key (folder path + mtime); entries
+    also expire after _DISCOVERY_TTL_S seconds, since subfolder changes don't
+    touch the root's mtime.
+    """
+    counts = _count_suffixes(root_str, supported, ignore_dirs)
+    return tuple(sorted(counts)), dict(counts)
+
+@lru_cache(maxsize=1)
+def _supported_exts() -> frozenset[str]:
+    """
+    Dot-prefixed, lowercase extensions handled by the registered processors.
+    Processors register once at import and never change at runtime, so this is
+    computed once per process instead of on every Streamlit rerun.
     """
-    # Compute supported extensions from registered processors
     supported: set[str] = set()
     for proc in registry.processors():
         try:
@@ -27,17 +73,36 @@ def sidebar_extension_selector(root: Path) -> List[str]:
         except Exception:
             # Defensive: skip misbehaving processors
             continue
+    return frozenset(supported)
 
-    # Walk once to compute present extensions
-    present: set[str] = set()
-    root_str = str(root.resolve())
-    for dirpath, _dirnames, filenames in os.walk(root_str):
-        for fname in filenames:
-            ext = Path(fname).suffix.lower()
-            if ext and ext in supported:
-                present.add(ext)
+def _discover(root: Path) -> tuple[str, tuple[str, ...], Dict[str, int]]:
+    """Return (resolved root string, present extensions, counts per extension)."""
+    root_path = root.resolve()
+    root_str = str(root_path)
+    try:
+        root_mtime_ns = root_path.stat().st_mtime_ns
+    except OSError:
+        root_mtime_ns = 0
+    # Same ignore list the scan gets (run_scan_v2 reads it from the config snapshot)
+    ignore_dirs = tuple(load_config().get("ignore_dirs", []))
+    present, counts = _discover_present_exts(root_str, root_mtime_ns, _supported_exts(), ignore_dirs)
+    return root_str, present, counts
 
-    options = sorted(present)
+def sidebar_extension_selector(root: Path) -> List[str]:
+    """
+    Render a sidebar multiselect for supported file extensions present in `root`.
+
+    Returns the selected extensions (dot-prefixed, lowercase). If none are present,
+    shows an informational message and returns [].
+
+    If the user selects nothing, treat as 'no filters' upstream (scan all supported types).
+    """
+    if st.sidebar.button("Refresh file list", help="Re-scan the folder for file types and counts now"):
+        _discover_present_exts.clear()
+
+    # Walk once (cached) to compute present extensions
+    root_str, present, _counts = _discover(root)
+    options = list(present)
     state_key = f"ext_selection::{root_str}"
     if not options:
         st.sidebar.info("No supported file types found in the selected folder.")
@@ -57,6 +122,14 @@ def sidebar_extension_selector(root: Path) -> List[str]:
     st.session_state[state_key] = selected
     return _normalize_exts(selected)
 
+def discovered_file_count(root: Path, exts: Optional[List[str]] = None) -> int:
+    """
+    Number of supported files under `root`, limited to `exts` when given.
+    Reuses the cached walk from sidebar_extension_selector (no second traversal).
+    """
+    _root_str, _present, counts = _discover(root)
+    return sum(counts.get(e, 0) for e in (exts or counts))
+
 def sidebar_discovery_summary(count: int):
     """Optional helper to display discovery count."""
     st.sidebar.caption(f"Discovered files: {count}")
@@ -5,7 +5,7 @@ XRay Builder — Streamlit UI entry point.
 Flow:
 1) Configure logging + load config.
 2) Let user pick a folder and (optionally) a cutoff date/time.
-3) Import processors/checks (self-register into the registry).
+3) Lazily import processors/checks (self-register into the registry) on first use.
 4) Run orchestrator with a progress callback.
 5) Show summary + table; allow CSV/JSON export.
 
@@ -24,38 +24,63 @@ if str(ROOT) not in sys.path:
 
 
 
+import importlib
 import logging
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
 import streamlit as st
 
+from core import registry
 from infra.config_loader import load_config
 from infra.logging_config import configure_logging
 from ui.components import folder_picker, cutoff_input, run_controls, summary_panel, results_table, downloads, progress_widgets, yellow_cells_drilldown
-from app.components import sidebar_extension_selector, sidebar_discovery_summary
-from utils.path_utils import iter_target_files
-from services.orchestrator import Orchestrator
+from app.components import sidebar_extension_selector, sidebar_discovery_summary, discovered_file_count
+from services.orchestrator import Orchestrator, default_workers
 
 
-# Import processors/checks so they self-register with the registry on import.
+# Processor/check modules self-register with the registry on import.
 # (Dependency Inversion: the app never references their internals.)
-import processors.docx_processor  # noqa: F401
-import processors.pptx_processor  # noqa: F401
-import processors.pdf_processor   # noqa: F401
-import processors.xlsx_processor  # noqa: F401
-
-import checks.base_checks         # noqa: F401
-import checks.docx_checks         # noqa: F401
-import checks.pptx_checks         # noqa: F401
-import checks.pdf_checks          # noqa: F401
-import checks.xlsx_checks         # noqa: F401
-import checks.spelling_checks     # noqa: F401  # Minimal wiring: enable SpellingCheck via self-registration
+# They pull in python-docx, pypdf, python-pptx, openpyxl and spelling dictionaries,
+# so they are imported lazily the first time the app actually needs them.
+_PLUGIN_MODULES = (
+    "processors.docx_processor",
+    "processors.pptx_processor",
+    "processors.pdf_processor",
+    "processors.xlsx_processor",
+    "checks.base_checks",
+    "checks.docx_checks",
+    "checks.pptx_checks",
+    "checks.pdf_checks",
+    "checks.xlsx_checks",
+    "checks.spelling_checks",  # Minimal wiring: enable SpellingCheck via self-registration
+)
+
+
+def _register_processors_and_checks() -> None:
+    """Import the plugin modules once per process (later calls are a no-op)."""
+    if registry.is_populated():
+        return
+    for mod in _PLUGIN_MODULES:
+        importlib.import_module(mod)
+
 
 from checks.settings import set_modified_cutoff, clear_modified_cutoff
 from services.orchestrator import Orchestrator
 from ui.components import folder_picker, cutoff_input, run_controls, summary_panel, results_table, downloads, progress_widgets
-from utils.path_utils import iter_target_files
+
+
+def _on_primary_click(root) -> None:
+    """
+    Primary button callback. Streamlit runs it before the script reruns, so the
+    first click flips the state before the button label and the sidebar are drawn.
+    """
+    if st.session_state.extensions_populated:
+        return
+    if root and Path(root).is_dir():
+        st.session_state.extensions_populated = True
+        st.session_state.just_populated = True
 
 
 def main():
@@ -85,26 +110,15 @@ def main():
     
     # Change button label based on state
     button_label = "Select file types" if not st.session_state.extensions_populated else "Scan folder"
-    run_clicked = colA.button(button_label, type="primary", use_container_width=True)
+    run_clicked = colA.button(
+        button_label, type="primary", use_container_width=True, on_click=_on_primary_click, args=(root,)
+    )
     reset_clicked = colB.button("Reset cutoff", use_container_width=True, help="Clears the configured cutoff date")
 
     if reset_clicked:
         clear_modified_cutoff()
         st.success("Cutoff cleared for this session.")
 
-    # Show extension selector in sidebar after first click
-    enabled_exts = []
-    if root and st.session_state.extensions_populated:
-        root_path = Path(root)
-        enabled_exts = sidebar_extension_selector(root_path)
-        
-        # Show discovery count for current selection
-        ext_filter = enabled_exts if enabled_exts else None
-        discovery_count = 0
-        for _ in iter_target_files(root_path, exts=ext_filter):
-            discovery_count += 1
-        sidebar_discovery_summary(discovery_count)
-
     if run_clicked:
         if not root:
             st.error("Please enter a folder path.")
@@ -115,12 +129,24 @@ def main():
             st.error("Folder does not exist or is not a directory.")
             return
 
-        # First click: populate extensions in sidebar
-        if not st.session_state.extensions_populated:
-            st.session_state.extensions_populated = True
-            st.rerun()  # Rerun to show the extension selector
-            return
+    # First click: the callback already populated the state, so the selector is drawn
+    # in this same run (no st.rerun(), which would re-execute the whole script)
+    first_click = st.session_state.pop("just_populated", False)
+
+    # Show extension selector in sidebar after first click
+    enabled_exts = []
+    if root and st.session_state.extensions_populated:
+        # Selector and scan both need the registered processors/checks
+        _register_processors_and_checks()
+        root_path = Path(root)
+        enabled_exts = sidebar_extension_selector(root_path)
+        
+        # Show discovery count for current selection
+        ext_filter = enabled_exts if enabled_exts else None
+        discovery_count = discovered_file_count(root_path, ext_filter)
+        sidebar_discovery_summary(discovery_count)
 
+    if run_clicked and not first_click:
         # Second click: perform actual scan
         # Apply cutoff setting for this run
         set_modified_cutoff(cutoff_dt)
@@ -132,7 +158,14 @@ def main():
         ext_filter = enabled_exts if enabled_exts else None
 
         # Run scan
-        orchestrator = Orchestrator(on_progress=on_progress)
+        orchestrator = Orchestrator(
+            on_progress=on_progress,
+            workers=default_workers(),
+            # Workers are separate processes: re-apply the cutoff there too
+            worker_init=partial(set_modified_cutoff, cutoff_dt),
+        )
+        # No total_hint: the sidebar count is cached per root mtime and can be stale,
+        # so the scan counts its own walk for progress and pool sizing
         report = orchestrator.run_scan_v2(root_path, config_snapshot=cfg, exts=ext_filter)
 
         # Show results
@@ -147,7 +180,7 @@ def main():
 
     st.sidebar.header("Config")
     st.sidebar.write("**Target extensions:**", ", ".join(cfg.get("target_extensions", [])))
-    st.sidebar.write("**Ignored folders:**", ", ".join(cfg.get("ignore_dirs", [])))
+    st.sidebar.write("**Ignored folders:**", ", ".join(cfg.get("ignore_dirs", [])) + " (and hidden folders)")
     st.sidebar.write("**Log level:**", cfg.get("log_level", "INFO"))
 
     st.sidebar.markdown(
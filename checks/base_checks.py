@@ -20,15 +20,18 @@ Timezones:
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from core.interfaces import Check
 from core.models import CheckResult, Severity, FileArtifact
-from core.registry import register_check
+from core.registry import register
 
 from .settings import get_modified_cutoff
 
+# Machine local tz, resolved once at import (naive document times are read as local).
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+
 #Modified Before cut off check.. takes the modified cut off from the settings.py module and
 """
 Modified Before cut off check.. takes the modified cut off from the settings.py module and
@@ -42,15 +45,13 @@ and lastly the pass variable is given a bool value and the true condition is if
 cutoff_DT.  
 """
 
+@register
 class ModifiedBeforeCutoffCheck(Check):
     """All files must be modified on/before the configured cutoff."""
 
-    def name(self) -> str:
-        return "Modified on or before cutoff"
-
-    def applies_to(self):
-        # Applies to all supported file types in this app.
-        return ["*"]
+    name = "Modified on or before cutoff"
+    # Applies to all supported file types in this app.
+    applies_to = ("*",)
 
     def run(self, artifact: FileArtifact) -> CheckResult:
         cutoff_utc = get_modified_cutoff()
@@ -58,7 +59,7 @@ class ModifiedBeforeCutoffCheck(Check):
             # No policy configured -> pass with INFO
             return CheckResult(
                 file=artifact.path,
-                check_name=self.name(),
+                check_name=self.name,
                 severity=Severity.INFO,
                 passed=True,
                 message="No cutoff configured",
@@ -71,11 +72,11 @@ class ModifiedBeforeCutoffCheck(Check):
             # Could not determine any modified time at all
             return CheckResult(
                 file=artifact.path,
-                check_name=self.name(),
+                check_name=self.name,
                 severity=Severity.WARNING,
                 passed=False,
                 message="Unable to determine last modified time",
-                extra={"source": None, "cutoff_utc": cutoff_utc.isoformat()},
+                extra={"source": None, "cutoff_utc": _cutoff_iso(cutoff_utc)},
             )
 
         observed_utc = observed_dt.astimezone(timezone.utc)
@@ -83,7 +84,7 @@ class ModifiedBeforeCutoffCheck(Check):
 
         return CheckResult(
             file=artifact.path,
-            check_name=self.name(),
+            check_name=self.name,
             severity=Severity.INFO if passed else Severity.ERROR,
             passed=passed,
             message=(
@@ -94,7 +95,7 @@ class ModifiedBeforeCutoffCheck(Check):
             extra={
                 "observed_source": source,
                 "observed_utc": observed_utc.isoformat(),
-                "cutoff_utc": cutoff_utc.isoformat(),
+                "cutoff_utc": _cutoff_iso(cutoff_utc),
             },
         )
 
@@ -110,20 +111,20 @@ def _choose_modified_datetime(artifact: FileArtifact) -> Tuple[Optional[datetime
     """
     ext = (artifact.extension or "").lower()
 
-    # 1) Prefer document metadata
+    # 1) Prefer document metadata (skip the parse entirely when the field is absent)
     if ext in {".docx", ".pptx"}:
-        iso = _safe_str(artifact.metadata.get("core_modified"))
-        dt = _parse_iso_to_aware(iso)
-        if dt:
-            return dt, "doc_property"
+        if (iso := artifact.metadata.get("core_modified")) is not None and iso != "":
+            dt = _parse_iso_to_aware(str(iso))
+            if dt:
+                return dt, "doc_property"
     elif ext == ".pdf":
-        iso = _safe_str(artifact.metadata.get("mod_date"))
-        dt = _parse_iso_to_aware(iso)
-        if dt:
-            return dt, "pdf_mod_date"
+        if (iso := artifact.metadata.get("mod_date")) is not None and iso != "":
+            dt = _parse_iso_to_aware(str(iso))
+            if dt:
+                return dt, "pdf_mod_date"
 
     # 2) Fallback to filesystem modified time
-    dt_fs = _fs_mtime_to_aware(artifact.path)
+    dt_fs = _fs_mtime_to_aware(artifact)
     if dt_fs:
         return dt_fs, "fs_mtime"
 
@@ -154,24 +155,32 @@ def _parse_iso_to_aware(s: Optional[str]) -> Optional[datetime]:
     return dt
 
 
-def _fs_mtime_to_aware(path: Path) -> Optional[datetime]:
-    """Filesystem mtime as a timezone-aware datetime in local tz."""
-    try:
-        mtime = path.stat().st_mtime
-    except OSError:
-        return None
+def _fs_mtime_to_aware(artifact: FileArtifact) -> Optional[datetime]:
+    """
+    Filesystem mtime as a timezone-aware datetime in local tz.
+    Uses the mtime carried on the artifact from discovery when available.
+    """
+    if artifact.mtime_ns is not None:
+        mtime = artifact.mtime_ns / 1e9
+    else:
+        try:
+            mtime = artifact.path.stat().st_mtime
+        except OSError:
+            return None
     local = datetime.fromtimestamp(mtime).astimezone()  # attaches local tz
     return local
 
 
 def _attach_local_tz(dt: datetime) -> datetime:
     """Attach the machine's local tz to a naive datetime (no conversion)."""
-    return dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
+    return dt.replace(tzinfo=_LOCAL_TZ)
 
 
-def _safe_str(value) -> Optional[str]:
-    return str(value) if value is not None else None
+@lru_cache(maxsize=8)
+def _cutoff_iso(cutoff_utc: datetime) -> str:
+    """ISO string of the cutoff; identical for every file in a run, so format it once."""
+    return cutoff_utc.isoformat()
 
 
-# Register this check on import
-register_check(ModifiedBeforeCutoffCheck())
+def _safe_str(value) -> Optional[str]:
+    return str(value) if value is not None else None
@@ -14,9 +14,37 @@ Each check:
 #Imports
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from core.interfaces import Check
 from core.models import CheckResult, Severity, FileArtifact
-from core.registry import register_check
+from core.registry import register
+
+from .metadata_views import as_int, per_artifact
+
+#Typed view of the DOCX metadata, built once per artifact and shared by all DOCX checks
+@dataclass(frozen=True)
+class DocxMetadata:
+    comments_count: int
+    tracked_changes_count: int
+    highlight_run_count: int
+    shading_highlight_count: int
+    # Counts stopped at the first hit (presence-only scan): report them as "N+"
+    count_suffix: str
+    unreadable: CheckResult | None
+
+
+@per_artifact
+def _docx_view(artifact: FileArtifact) -> DocxMetadata:
+    meta = artifact.metadata
+    return DocxMetadata(
+        comments_count=as_int(meta.get("comments_count")),
+        tracked_changes_count=as_int(meta.get("tracked_changes_count")),
+        highlight_run_count=as_int(meta.get("highlight_run_count")),
+        shading_highlight_count=as_int(meta.get("shading_highlight_count")),
+        count_suffix="+" if meta.get("counts_presence_only") else "",
+        unreadable=_unreadable(artifact),
+    )
 
 #If Unreadable
 def _unreadable(artifact: FileArtifact) -> CheckResult | None:
@@ -36,81 +64,75 @@ def _unreadable(artifact: FileArtifact) -> CheckResult | None:
     return None
 
 #Checks for no comments
+@register
 class DocxNoCommentsCheck(Check):
-    def name(self) -> str:
-        return "DOCX: no comments"
-
-    def applies_to(self):
-        return [".docx"]
+    name = "DOCX: no comments"
+    applies_to = (".docx",)
 
     def run(self, artifact: FileArtifact) -> CheckResult:
         # Guard: unreadable file
-        unreadable = _unreadable(artifact)
-        if unreadable:
-            return unreadable
+        view = _docx_view(artifact)
+        if view.unreadable:
+            return view.unreadable
 
-        count = int(artifact.metadata.get("comments_count", 0) or 0)
+        count = view.comments_count
         passed = count == 0
         return CheckResult(
             file=artifact.path,
-            check_name=self.name(),
+            check_name=self.name,
             severity=Severity.ERROR if not passed else Severity.INFO,
             passed=passed,
-            message="OK: no comments" if passed else f"Found {count} comment(s)",
+            message="OK: no comments" if passed else f"Found {count}{view.count_suffix} comment(s)",
             extra={"comments_count": count},
         )
 
 #Checks for track changes
+@register
 class DocxNoTrackedChangesCheck(Check):
-    def name(self) -> str:
-        return "DOCX: no tracked changes"
-
-    def applies_to(self):
-        return [".docx"]
+    name = "DOCX: no tracked changes"
+    applies_to = (".docx",)
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        unreadable = _unreadable(artifact)
-        if unreadable:
-            return unreadable
+        view = _docx_view(artifact)
+        if view.unreadable:
+            return view.unreadable
 
-        count = int(artifact.metadata.get("tracked_changes_count", 0) or 0)
+        count = view.tracked_changes_count
         passed = count == 0
         return CheckResult(
             file=artifact.path,
-            check_name=self.name(),
+            check_name=self.name,
             severity=Severity.ERROR if not passed else Severity.INFO,
             passed=passed,
-            message="OK: no tracked changes" if passed else f"Found {count} tracked change(s)",
+            message="OK: no tracked changes" if passed else f"Found {count}{view.count_suffix} tracked change(s)",
             extra={"tracked_changes_count": count},
         )
 
 #Checks for highlights
+@register
 class DocxNoHighlightsCheck(Check):
-    def name(self) -> str:
-        return "DOCX: no highlights"
-
-    def applies_to(self):
-        return [".docx"]
+    name = "DOCX: no highlights"
+    applies_to = (".docx",)
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        unreadable = _unreadable(artifact)
-        if unreadable:
-            return unreadable
+        view = _docx_view(artifact)
+        if view.unreadable:
+            return view.unreadable
 
-        explicit_h = int(artifact.metadata.get("highlight_run_count", 0) or 0)
-        shading_h = int(artifact.metadata.get("shading_highlight_count", 0) or 0)
+        explicit_h = view.highlight_run_count
+        shading_h = view.shading_highlight_count
         total = explicit_h + shading_h
         passed = total == 0
 
         return CheckResult(
             file=artifact.path,
-            check_name=self.name(),
+            check_name=self.name,
             severity=Severity.ERROR if not passed else Severity.INFO,
             passed=passed,
             message=(
                 "OK: no highlights"
                 if passed
-                else f"Found {total} highlighted region(s) "
+                else f"Found {total}{view.count_suffix} highlighted region(s) "
                      f"(explicit={explicit_h}, shading={shading_h})"
             ),
             extra={
@@ -119,9 +141,3 @@ class DocxNoHighlightsCheck(Check):
                 "total_highlight_like": total,
             },
         )
-
-
-# Register all on import
-register_check(DocxNoCommentsCheck())
-register_check(DocxNoTrackedChangesCheck())
-register_check(DocxNoHighlightsCheck())
@@ -0,0 +1,46 @@
+# checks/metadata_views.py
+"""
+Typed, read-only views over FileArtifact.metadata for check modules.
+
+Why:
+- Several checks for the same file type read the same metadata keys and each
+  re-coerce them (int(meta.get(...) or 0)). A view does that coercion once per
+  artifact and the checks read plain attributes.
+
+How:
+- per_artifact(builder) wraps a `builder(artifact) -> view` function with a
+  one-slot cache keyed on artifact identity. The orchestrator runs all checks
+  for one artifact before moving to the next, so checks 2..N hit the cache.
+- The slot holds a strong reference to the artifact, so identity can't be
+  confused with a new object that reuses the same id().
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+from typing import Callable, Optional, Tuple, TypeVar
+
+from core.models import FileArtifact
+
+V = TypeVar("V")
+
+
+def per_artifact(builder: Callable[[FileArtifact], V]) -> Callable[[FileArtifact], V]:
+    """Cache the view built for the most recent artifact (by identity)."""
+    slot: list[Optional[Tuple[FileArtifact, V]]] = [None]
+
+    @wraps(builder)
+    def get(artifact: FileArtifact) -> V:
+        last = slot[0]  # read once: safe if another thread swaps the slot
+        if last is not None and last[0] is artifact:
+            return last[1]
+        view = builder(artifact)
+        slot[0] = (artifact, view)
+        return view
+
+    return get
+
+
+def as_int(value) -> int:
+    """Coerce a metadata count (int, numeric str, None) to int; 0 when missing."""
+    return int(value or 0)
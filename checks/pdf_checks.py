@@ -17,11 +17,17 @@ Relies on PdfProcessor to provide:
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Dict
 
 from core.interfaces import Check
 from core.models import CheckResult, Severity, FileArtifact
-from core.registry import register_check
+from core.registry import register
+
+from .metadata_views import per_artifact
+
+# Annotation subtypes that count as comments (handled by PdfNoCommentsCheck)
+_COMMENT_SUBTYPES = frozenset({"Text", "FreeText"})
 
 #Unreadable checks
 def _unreadable_or_encrypted(artifact: FileArtifact) -> CheckResult | None:
@@ -53,26 +59,40 @@ def _get_annots(meta: Dict) -> Dict[str, int]:
     return {str(k): int(v) for k, v in ann.items()}
 
 
+#Typed view shared by both PDF checks: the guard and the annotation summary are computed once
+@dataclass(frozen=True)
+class PdfMetadata:
+    annots: Dict[str, int]
+    unreadable: CheckResult | None
+
+
+@per_artifact
+def _pdf_view(artifact: FileArtifact) -> PdfMetadata:
+    early = _unreadable_or_encrypted(artifact)
+    return PdfMetadata(
+        annots={} if early else _get_annots(artifact.metadata),
+        unreadable=early,
+    )
+
+
 #checks for any comments
+@register
 class PdfNoCommentsCheck(Check):
-    def name(self) -> str:
-        return "PDF: no comments"
-
-    def applies_to(self):
-        return [".pdf"]
+    name = "PDF: no comments"
+    applies_to = (".pdf",)
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        early = _unreadable_or_encrypted(artifact)
-        if early:
-            return early
+        view = _pdf_view(artifact)
+        if view.unreadable:
+            return view.unreadable
 
-        ann = _get_annots(artifact.metadata)
+        ann = view.annots
         comment_count = ann.get("Text", 0) + ann.get("FreeText", 0)
         passed = comment_count == 0
 
         return CheckResult(
             file=artifact.path,
-            check_name=self.name(),
+            check_name=self.name,
             severity=Severity.ERROR if not passed else Severity.INFO,
             passed=passed,
             message="OK: no comments" if passed else f"Found {comment_count} comment annotation(s)",
@@ -80,37 +100,29 @@ class PdfNoCommentsCheck(Check):
         )
 
 #Checks for any highlights
+@register
 class PdfNoHighlightsCheck(Check):
-    def name(self) -> str:
-        return "PDF: no highlights/markups/annotations"
-
-    def applies_to(self):
-        return [".pdf"]
+    name = "PDF: no highlights/markups/annotations"
+    applies_to = (".pdf",)
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        early = _unreadable_or_encrypted(artifact)
-        if early:
-            return early
+        view = _pdf_view(artifact)
+        if view.unreadable:
+            return view.unreadable
 
-        ann = _get_annots(artifact.metadata)
+        ann = view.annots
 
         # Treat ALL annotation subtypes as disallowed for this rule,
         # EXCEPT Text/FreeText (which are handled by the comments check).
-        disallowed = 0
-        details = {}
-
-        for subtype, count in ann.items():
-            if subtype in {"Text", "FreeText"}:
-                continue  # counted by PdfNoCommentsCheck
-            if count:
-                disallowed += count
-                details[subtype] = count
+        # (Text/FreeText are counted by PdfNoCommentsCheck.)
+        details = {k: v for k, v in ann.items() if v and k not in _COMMENT_SUBTYPES}
+        disallowed = sum(details.values())
 
         passed = disallowed == 0
 
         return CheckResult(
             file=artifact.path,
-            check_name=self.name(),
+            check_name=self.name,
             severity=Severity.ERROR if not passed else Severity.INFO,
             passed=passed,
             message=(
@@ -120,7 +132,3 @@ class PdfNoHighlightsCheck(Check):
             ),
             extra={"disallowed_annotations": details, "all_annotations": ann},
         )
-
-# Register on import
-register_check(PdfNoCommentsCheck())
-register_check(PdfNoHighlightsCheck())
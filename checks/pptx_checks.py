@@ -14,7 +14,7 @@ from __future__ import annotations
 
 from core.interfaces import Check
 from core.models import CheckResult, Severity, FileArtifact
-from core.registry import register_check
+from core.registry import register
 
 #Unreadable
 def _unreadable(artifact: FileArtifact) -> CheckResult | None:
@@ -30,12 +30,10 @@ def _unreadable(artifact: FileArtifact) -> CheckResult | None:
     return None
 
 #Checks for any comments
+@register
 class PptxNoCommentsCheck(Check):
-    def name(self) -> str:
-        return "PPTX: no comments"
-
-    def applies_to(self):
-        return [".pptx"]
+    name = "PPTX: no comments"
+    applies_to = (".pptx",)
 
     def run(self, artifact: FileArtifact) -> CheckResult:
         unreadable = _unreadable(artifact)
@@ -46,12 +44,9 @@ class PptxNoCommentsCheck(Check):
         passed = count == 0
         return CheckResult(
             file=artifact.path,
-            check_name=self.name(),
+            check_name=self.name,
             severity=Severity.ERROR if not passed else Severity.INFO,
             passed=passed,
             message="OK: no comments" if passed else f"Found {count} comment(s)",
             extra={"comments_count": count},
         )
-
-# Register on import
-register_check(PptxNoCommentsCheck())
@@ -9,6 +9,10 @@ Design:
 - Single responsibility: hold values checks need (not UI logic).
 - Dependency inversion: Streamlit (or any UI) sets values here; checks read them.
 - Values are stored as timezone-aware UTC datetimes for consistent comparisons.
+- Process-level state: it survives Streamlit reruns (each rerun runs on a new
+  script thread) and is shared by every session served by the same process.
+  The app sets it right before each scan; pool workers are separate processes
+  and get it via the orchestrator's worker_init.
 
 API:
 - set_modified_cutoff(value)  -> None
@@ -26,6 +30,12 @@ from typing import Optional, Union
 # Always an aware UTC datetime or None.
 __modified_cutoff_utc: Optional[datetime] = None
 
+# Machine local tz, resolved once at import (naive cutoffs are read as local time).
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+# A bare date means "end of that day".
+_END_OF_DAY = time(23, 59, 59, 999_999)
+
 
 def set_modified_cutoff(value: Optional[Union[datetime, date, str]]) -> None:
     """
@@ -76,13 +86,16 @@ def _coerce_to_datetime(value: Union[datetime, date, str]) -> datetime:
     """
     Convert supported input types to a datetime (may be naive).
     - date -> end of day (23:59:59.999999)
-    - str  -> datetime.fromisoformat(...)
+    - str  -> datetime.fromisoformat(...); a date-only string ('YYYY-MM-DD')
+              means midnight at the start of that day, unlike a date object.
+              (datetime.fromisoformat is C-implemented and handles both forms,
+              so there is no separate date-only parse path.)
     """
     if isinstance(value, datetime):
         return value
     if isinstance(value, date):
         # End of the given day
-        return datetime.combine(value, time(23, 59, 59, 999_999))
+        return datetime.combine(value, _END_OF_DAY)
     if isinstance(value, str):
         try:
             # Supports 'YYYY-MM-DD' and 'YYYY-MM-DDTHH:MM:SS[.ffff][±HH:MM]'
@@ -100,8 +113,4 @@ def _ensure_aware_in_local_tz(dt: datetime) -> datetime:
     If dt is naive, assume it is in the machine's local timezone.
     Return a timezone-aware datetime in that local timezone.
     """
-    if dt.tzinfo is not None:
-        return dt
-    # Derive local tzinfo by asking 'now' for its zone.
-    local_tz = datetime.now().astimezone().tzinfo
-    return dt.replace(tzinfo=local_tz)
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=_LOCAL_TZ)
@@ -22,14 +22,17 @@ How it works:
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from heapq import nsmallest
+from typing import Dict, Any, FrozenSet, Tuple
 
 from core.interfaces import Check
 from core.models import FileArtifact, CheckResult, Severity
-from core.registry import register_check
+from core.registry import register
 
 from infra.config_loader import load_config
-from utils.text_extract import tokenize_words
+from utils.text_extract import count_words, unique_words
 
 try:
     # pyspellchecker is a small, pure-Python dependency
@@ -37,24 +40,30 @@ try:
 except Exception:
     SpellChecker = None  # We will handle missing dependency gracefully
 
+# Severity members bound once (plain global loads in run() bodies)
+_INFO, _WARN, _ERR = Severity.INFO, Severity.WARNING, Severity.ERROR
+
+_SPELLING_EXTS: Tuple[str, ...] = (".docx", ".pptx", ".xlsx", ".pdf")
+
+# How many of the most frequent dictionary words to keep in the known-words prefilter
+_COMMON_WORDS_N = 20_000
 
-class SpellingCheck(Check):
-    def name(self) -> str:
-        return "spelling"
 
-    def applies_to(self) -> List[str]:
-        # Applies to all current text-bearing types
-        return [".docx", ".pptx", ".xlsx", ".pdf"]
+@register
+class SpellingCheck(Check):
+    name = "spelling"
+    # Applies to all current text-bearing types
+    applies_to = _SPELLING_EXTS
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        cfg = load_config()
+        cfg = _spelling_settings()
 
         # 1) Feature toggle: allow disabling via config without code changes.
-        if not cfg.get("enable_spelling", True):
+        if not cfg.enabled:
             return CheckResult(
                 file=artifact.path,
-                check_name=self.name(),
-                severity=Severity.INFO,
+                check_name=self.name,
+                severity=_INFO,
                 passed=True,
                 message="Spelling check disabled by config",
                 extra={"reason": "disabled"},
@@ -64,8 +73,8 @@ class SpellingCheck(Check):
         if SpellChecker is None:
             return CheckResult(
                 file=artifact.path,
-                check_name=self.name(),
-                severity=Severity.WARNING,
+                check_name=self.name,
+                severity=_WARN,
                 passed=False,
                 message="Spelling engine unavailable (pyspellchecker not installed)",
                 extra={"reason": "missing_dependency"},
@@ -79,8 +88,8 @@ class SpellingCheck(Check):
         if not text:
             return CheckResult(
                 file=artifact.path,
-                check_name=self.name(),
-                severity=Severity.WARNING,
+                check_name=self.name,
+                severity=_WARN,
                 passed=False,
                 message="No text available for spelling check",
                 extra={
@@ -90,50 +99,60 @@ class SpellingCheck(Check):
                 },
             )
 
+        # Too little text to be worth a dictionary load/lookup (configurable floor)
+        if text_len < cfg.min_text_length:
+            return CheckResult(
+                file=artifact.path,
+                check_name=self.name,
+                severity=_INFO,
+                passed=True,
+                message="Skipped: text below threshold",
+                extra={"text_length": text_len, "min_text_length": cfg.min_text_length},
+            )
+
         # 3) Tokenize and find misspellings
-        tokens = tokenize_words(text)  # lowercased word-ish tokens for English
-        unique_tokens = set(tokens)
-
-        language_code = (cfg.get("language_code") or "en").strip() or "en"
-        try:
-            sp = SpellChecker(language=language_code)
-        except Exception:
-            # If the requested language is not available, fall back to English
-            sp = SpellChecker(language="en")
-            language_code = "en"
-
-        misspelled = sp.unknown(unique_tokens)  # set of unknown words among unique tokens
+        unique_tokens = unique_words(text)  # lowercased word-ish tokens for English
+        # Processors already counted the tokens of this same sample
+        token_count = meta.get("token_count")
+        total_tokens = int(token_count) if token_count is not None else count_words(text)
+
+        sp, language_code = _get_spellchecker(cfg.language_code)
+
+        # Most tokens are common words: drop those with one C-level set difference
+        # so the spellchecker only looks up the rest.
+        candidates = unique_tokens - _common_words(language_code)
+        misspelled = sp.unknown(candidates)  # set of unknown words among unique tokens
         misspelling_count = len(misspelled)
 
         # 4) Severity policy (configurable thresholds)
-        threshold = int(cfg.get("spelling_fail_threshold", 10) or 10)
-        max_list = int(cfg.get("max_misspellings_reported", 100) or 100)
+        threshold = cfg.fail_threshold
+        max_list = cfg.max_reported
 
         if misspelling_count == 0:
-            severity = Severity.INFO
+            severity = _INFO
             passed = True
             msg = "OK: no misspellings"
         elif misspelling_count <= threshold:
-            severity = Severity.WARNING
+            severity = _WARN
             passed = False
             msg = f"Found {misspelling_count} misspelling(s)"
         else:
-            severity = Severity.ERROR
+            severity = _ERR
             passed = False
             msg = f"Found {misspelling_count} misspelling(s) (over threshold={threshold})"
 
         # Keep the payload small and stable
-        sample_misspellings = sorted(list(misspelled))[:max_list]
+        sample_misspellings = nsmallest(max_list, misspelled)  # == sorted(...)[:max_list]
 
         return CheckResult(
             file=artifact.path,
-            check_name=self.name(),
+            check_name=self.name,
             severity=severity,
             passed=passed,
             message=msg,
             extra={
                 "language_code": language_code,
-                "total_tokens": len(tokens),
+                "total_tokens": total_tokens,
                 "unique_misspellings_count": misspelling_count,
                 "sample_misspellings": sample_misspellings,
                 "text_length": text_len,
@@ -142,5 +161,56 @@ class SpellingCheck(Check):
         )
 
 
-# Register on import so the orchestrator discovers it via the registry.
-register_check(SpellingCheck())
\ No newline at end of file
+@dataclass(frozen=True)
+class _SpellingSettings:
+    """Config values SpellingCheck needs, already defaulted and coerced."""
+    enabled: bool
+    language_code: str
+    fail_threshold: int
+    max_reported: int
+    min_text_length: int
+
+
+@lru_cache(maxsize=1)
+def _spelling_settings() -> _SpellingSettings:
+    """
+    Read the spelling settings from config once per process instead of per file.
+    (Config comes from defaults + environment, which don't change during a scan.)
+    """
+    cfg = load_config()
+    return _SpellingSettings(
+        enabled=bool(cfg.get("enable_spelling", True)),
+        language_code=(cfg.get("language_code") or "en").strip() or "en",
+        fail_threshold=int(cfg.get("spelling_fail_threshold", 10) or 10),
+        max_reported=int(cfg.get("max_misspellings_reported", 100) or 100),
+        min_text_length=int(cfg.get("min_text_length_for_spelling", 0) or 0),
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_spellchecker(language_code: str) -> Tuple["SpellChecker", str]:
+    """
+    Return (SpellChecker, effective language code), built once per language.
+    Loading the word-frequency dictionary dominates a SpellChecker's cost, so
+    every file in a scan (and every later scan) reuses the same instance.
+    """
+    try:
+        return SpellChecker(language=language_code), language_code
+    except Exception:
+        # If the requested language is not available, fall back to English
+        return SpellChecker(language="en"), "en"
+
+
+@lru_cache(maxsize=8)
+def _common_words(language_code: str) -> FrozenSet[str]:
+    """
+    The _COMMON_WORDS_N most frequent words of the cached SpellChecker's dictionary.
+    Every word here is known by definition, so removing them before sp.unknown()
+    never changes the result; it only shrinks the set the spellchecker walks.
+    """
+    sp, _ = _get_spellchecker(language_code)
+    try:
+        return frozenset(w for w, _count in sp.word_frequency.most_common(_COMMON_WORDS_N))
+    except Exception:
+        # Older/other pyspellchecker versions: no prefilter, same results
+        return frozenset()
@@ -3,24 +3,88 @@
 XLSX checks: small, single-purpose rules for .xlsx files.
 
 Each class implements the Check interface and inspects fields in
-artifact.metadata that were populated by the XLSX processor.
+artifact.metadata that were populated by the XLSX processor. All rules read
+one shared XlsxMetadata view, built once per artifact (see _xlsx_view).
 
 Design goals:
 - SRP: one rule per class; easy to reason about and test.
-- OCP: add/remove checks by adding/removing classes; no central branching.
+- OCP: add/remove checks by adding/removing classes.
 - LSP/DIP: the orchestrator calls these via the Check interface (not concrete types).
 - ISP: checks depend only on the Check interface & FileArtifact (no UI or IO).
 """
 
 from __future__ import annotations
 
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple
 
 # These imports assume the same locations/interfaces as your existing checks.
 # If your project’s module paths differ, adjust the imports accordingly.
 from core.interfaces import Check
 from core.models import FileArtifact, CheckResult, Severity
-from core.registry import register_check
+from core.registry import register
+
+from .metadata_views import as_int, per_artifact
+
+# Severity members bound once (plain global loads in run() bodies)
+_INFO, _WARN, _ERR = Severity.INFO, Severity.WARNING, Severity.ERROR
+
+# Shared, immutable applies_to for every XLSX check
+_XLSX_ONLY: Tuple[str, ...] = (".xlsx",)
+
+
+@dataclass(frozen=True, slots=True)
+class XlsxMetadata:
+    """
+    Typed view of the XLSX metadata, built once per artifact and shared by all
+    XLSX checks (each check used to re-coerce its own keys).
+    """
+    read_error: bool
+    hidden_sheet_count: int
+    very_hidden_sheet_count: int
+    formula_count: int
+    error_cell_count: int
+    formula_ref_error_count: int
+    other_error_token_count: int
+    # Formula/error scan stopped at the first error (presence-only): counts are lower bounds
+    counts_presence_only: bool
+    external_links_count: int
+    data_connections_count: int
+    password_encrypted_workbook: bool
+    workbook_structure_protected: bool
+    comments_count: int
+    threaded_comments_count: int
+    has_vba_project: bool
+    yellow_cell_count: int
+    yellow_tab_sheet_count: int
+    yellow_tab_sheets: List[str]
+
+
+@per_artifact
+def _xlsx_view(artifact: FileArtifact) -> XlsxMetadata:
+    meta = artifact.metadata or {}
+    yellow_tabs = as_int(meta.get("yellow_tab_sheet_count"))
+    return XlsxMetadata(
+        read_error=bool(meta.get("read_error")),
+        hidden_sheet_count=as_int(meta.get("hidden_sheet_count")),
+        very_hidden_sheet_count=as_int(meta.get("very_hidden_sheet_count")),
+        formula_count=as_int(meta.get("formula_count")),
+        error_cell_count=as_int(meta.get("error_cell_count")),
+        formula_ref_error_count=as_int(meta.get("formula_ref_error_count")),
+        other_error_token_count=as_int(meta.get("other_error_token_count")),
+        counts_presence_only=bool(meta.get("counts_presence_only")),
+        external_links_count=as_int(meta.get("external_links_count")),
+        data_connections_count=as_int(meta.get("data_connections_count")),
+        password_encrypted_workbook=bool(meta.get("password_encrypted_workbook", False)),
+        workbook_structure_protected=bool(meta.get("workbook_structure_protected", False)),
+        comments_count=as_int(meta.get("comments_count")),
+        threaded_comments_count=as_int(meta.get("threaded_comments_count")),
+        has_vba_project=bool(meta.get("has_vba_project", False)),
+        yellow_cell_count=as_int(meta.get("yellow_cell_count")),
+        yellow_tab_sheet_count=yellow_tabs,
+        # Only a failing yellow-tab result reports the sheet names
+        yellow_tab_sheets=(meta.get("yellow_tab_sheets") or []) if yellow_tabs else [],
+    )
 
 
 def _unreadable_result(artifact: FileArtifact, name: str, message: str, meta: Dict[str, Any]) -> CheckResult:
@@ -31,7 +95,7 @@ def _unreadable_result(artifact: FileArtifact, name: str, message: str, meta: Di
     return CheckResult(
         file=artifact.path,
         check_name=name,
-        severity=Severity.WARNING,
+        severity=_WARN,
         passed=False,
         message=message,
         extra={
@@ -41,42 +105,64 @@ def _unreadable_result(artifact: FileArtifact, name: str, message: str, meta: Di
     )
 
 
+def _ok(artifact: FileArtifact, name: str, message: str, extra: Dict[str, Any]) -> CheckResult:
+    """
+    Helper: passing INFO result, the common path for clean workbooks.
+    Messages are class-level constants; callers pass a fresh extra dict per
+    result, so no two results share a mutable container.
+    """
+    return CheckResult(
+        file=artifact.path,
+        check_name=name,
+        severity=_INFO,
+        passed=True,
+        message=message,
+        extra=extra,
+    )
+
+
+def _error(artifact: FileArtifact, name: str, message: str, extra: Dict[str, Any]) -> CheckResult:
+    """Helper: failing ERROR result with the finding's details."""
+    return CheckResult(
+        file=artifact.path,
+        check_name=name,
+        severity=_ERR,
+        passed=False,
+        message=message,
+        extra=extra,
+    )
+
+
 # ============== 1) Hidden & Very Hidden Sheets ================================
 
+@register
 class XlsxHiddenSheetsCheck(Check):
     """
     Fail if any sheet is hidden or very hidden.
     """
 
-    def name(self) -> str:
-        return "xlsx_hidden_sheets"
-
-    def description(self) -> str:
-        return "Workbook must not contain hidden or very hidden sheets."
-
-    def applies_to(self) -> List[str]:
-        return [".xlsx"]
+    name = "xlsx_hidden_sheets"
+    description = "Workbook must not contain hidden or very hidden sheets."
+    applies_to = _XLSX_ONLY
+    _OK_MESSAGE = "OK: no hidden/very hidden sheets"
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        meta = artifact.metadata or {}
-        if meta.get("read_error"):
-            return _unreadable_result(artifact, self.name(), "Unreadable XLSX (parse error)", meta)
-
-        hidden = int(meta.get("hidden_sheet_count") or 0)
-        very_hidden = int(meta.get("very_hidden_sheet_count") or 0)
-        passed = (hidden == 0 and very_hidden == 0)
+        view = _xlsx_view(artifact)
+        if view.read_error:
+            return _unreadable_result(artifact, self.name, "Unreadable XLSX (parse error)", artifact.metadata or {})
+
+        hidden = view.hidden_sheet_count
+        very_hidden = view.very_hidden_sheet_count
+        if hidden == 0 and very_hidden == 0:
+            return _ok(
+                artifact, self.name, self._OK_MESSAGE, {"hidden_sheet_count": 0, "very_hidden_sheet_count": 0}
+            )
 
-        return CheckResult(
-            file=artifact.path,
-            check_name=self.name(),
-            severity=Severity.INFO if passed else Severity.ERROR,
-            passed=passed,
-            message=(
-                "OK: no hidden/very hidden sheets"
-                if passed
-                else f"Found {hidden} hidden and {very_hidden} very hidden sheet(s)"
-            ),
-            extra={
+        return _error(
+            artifact,
+            self.name,
+            f"Found {hidden} hidden and {very_hidden} very hidden sheet(s)",
+            {
                 "hidden_sheet_count": hidden,
                 "very_hidden_sheet_count": very_hidden,
             },
@@ -85,6 +171,7 @@ class XlsxHiddenSheetsCheck(Check):
 
 # ============== 2) Formula Errors (formulas allowed, errors not) ==============
 
+@register
 class XlsxFormulaErrorsCheck(Check):
     """
     Formulas are allowed, but any error cells or error tokens should fail.
@@ -94,222 +181,179 @@ class XlsxFormulaErrorsCheck(Check):
       - other_error_token_count: other well-known error tokens in formulas/values
     """
 
-    def name(self) -> str:
-        return "xlsx_formula_errors"
-
-    def description(self) -> str:
-        return "Formulas are allowed, but no error cells or error tokens are permitted."
-
-    def applies_to(self) -> List[str]:
-        return [".xlsx"]
+    name = "xlsx_formula_errors"
+    description = "Formulas are allowed, but no error cells or error tokens are permitted."
+    applies_to = _XLSX_ONLY
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        meta = artifact.metadata or {}
-        if meta.get("read_error"):
-            return _unreadable_result(artifact, self.name(), "Unreadable XLSX (parse error)", meta)
-
-        error_cells = int(meta.get("error_cell_count") or 0)
-        ref_err = int(meta.get("formula_ref_error_count") or 0)
-        other_errs = int(meta.get("other_error_token_count") or 0)
-        formula_count = int(meta.get("formula_count") or 0)
-
-        passed = (error_cells == 0 and ref_err == 0 and other_errs == 0)
-
-        return CheckResult(
-            file=artifact.path,
-            check_name=self.name(),
-            severity=Severity.INFO if passed else Severity.ERROR,
-            passed=passed,
-            message=(
-                "OK: no formula errors"
-                if passed
-                else (
-                    f"Formula issues: error_cells={error_cells}, #REF!={ref_err}, other_errors={other_errs}"
-                )
-            ),
-            extra={
-                "formula_count": formula_count,
-                "error_cell_count": error_cells,
-                "formula_ref_error_count": ref_err,
-                "other_error_token_count": other_errs,
-            },
-        )
+        view = _xlsx_view(artifact)
+        if view.read_error:
+            return _unreadable_result(artifact, self.name, "Unreadable XLSX (parse error)", artifact.metadata or {})
+
+        error_cells = view.error_cell_count
+        ref_err = view.formula_ref_error_count
+        other_errs = view.other_error_token_count
+        formula_count = view.formula_count
+
+        extra = {
+            "formula_count": formula_count,
+            "error_cell_count": error_cells,
+            "formula_ref_error_count": ref_err,
+            "other_error_token_count": other_errs,
+        }
+        if view.counts_presence_only:
+            extra["counts_presence_only"] = True
+        if error_cells == 0 and ref_err == 0 and other_errs == 0:
+            return _ok(artifact, self.name, "OK: no formula errors", extra)
+
+        # Presence-only: the scan stopped at the first error, so hits are "N+"
+        # and the zero counts were not fully scanned either
+        def fmt(n: int) -> str:
+            return f"{n}+" if view.counts_presence_only and n else str(n)
+
+        message = f"Formula issues: error_cells={fmt(error_cells)}, #REF!={fmt(ref_err)}, other_errors={fmt(other_errs)}"
+        if view.counts_presence_only:
+            message += " (presence-only scan, stopped at the first error)"
+        return _error(artifact, self.name, message, extra)
 
 
 # ============== 3) External Links (fail if any) ===============================
 
+@register
 class XlsxExternalLinksCheck(Check):
     """
     Fail if the workbook contains external relationships (URLs/UNC/TargetMode=External)
     or externalLinks parts.
     """
 
-    def name(self) -> str:
-        return "xlsx_external_links"
-
-    def description(self) -> str:
-        return "Workbook must not contain external links."
-
-    def applies_to(self) -> List[str]:
-        return [".xlsx"]
+    name = "xlsx_external_links"
+    description = "Workbook must not contain external links."
+    applies_to = _XLSX_ONLY
+    _OK_MESSAGE = "OK: no external links"
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        meta = artifact.metadata or {}
-        if meta.get("read_error"):
-            return _unreadable_result(artifact, self.name(), "Unreadable XLSX (parse error)", meta)
+        view = _xlsx_view(artifact)
+        if view.read_error:
+            return _unreadable_result(artifact, self.name, "Unreadable XLSX (parse error)", artifact.metadata or {})
 
-        count = int(meta.get("external_links_count") or 0)
-        passed = (count == 0)
+        count = view.external_links_count
+        if count == 0:
+            return _ok(artifact, self.name, self._OK_MESSAGE, {"external_links_count": 0})
 
-        return CheckResult(
-            file=artifact.path,
-            check_name=self.name(),
-            severity=Severity.INFO if passed else Severity.ERROR,
-            passed=passed,
-            message=(
-                "OK: no external links" if passed else f"Found {count} external link(s)"
-            ),
-            extra={"external_links_count": count},
-        )
+        return _error(artifact, self.name, f"Found {count} external link(s)", {"external_links_count": count})
 
 
 # ============== 4) Data Connections (fail if any) ============================
 
+@register
 class XlsxDataConnectionsCheck(Check):
     """
     Fail if the workbook declares any data connections (Power Query / OLE DB / Web).
     """
 
-    def name(self) -> str:
-        return "xlsx_data_connections"
-
-    def description(self) -> str:
-        return "Workbook must not contain data connections."
-
-    def applies_to(self) -> List[str]:
-        return [".xlsx"]
+    name = "xlsx_data_connections"
+    description = "Workbook must not contain data connections."
+    applies_to = _XLSX_ONLY
+    _OK_MESSAGE = "OK: no data connections"
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        meta = artifact.metadata or {}
-        if meta.get("read_error"):
-            return _unreadable_result(artifact, self.name(), "Unreadable XLSX (parse error)", meta)
+        view = _xlsx_view(artifact)
+        if view.read_error:
+            return _unreadable_result(artifact, self.name, "Unreadable XLSX (parse error)", artifact.metadata or {})
 
-        count = int(meta.get("data_connections_count") or 0)
-        passed = (count == 0)
+        count = view.data_connections_count
+        if count == 0:
+            return _ok(artifact, self.name, self._OK_MESSAGE, {"data_connections_count": 0})
 
-        return CheckResult(
-            file=artifact.path,
-            check_name=self.name(),
-            severity=Severity.INFO if passed else Severity.ERROR,
-            passed=passed,
-            message=(
-                "OK: no data connections" if passed else f"Found {count} data connection(s)"
-            ),
-            extra={"data_connections_count": count},
-        )
+        return _error(artifact, self.name, f"Found {count} data connection(s)", {"data_connections_count": count})
 
 
 # ============== 5) Workbook Protection (fail if encrypted; warn if structure) =
 
+@register
 class XlsxWorkbookProtectionCheck(Check):
     """
     - Fail if the workbook is password-encrypted (file-level).
     - Flag (warning) if workbook structure/windows protection is set.
     """
 
-    def name(self) -> str:
-        return "xlsx_workbook_protection"
-
-    def description(self) -> str:
-        return "Fail if encrypted; warn if workbook structure/windows are protected."
-
-    def applies_to(self) -> List[str]:
-        return [".xlsx"]
+    name = "xlsx_workbook_protection"
+    description = "Fail if encrypted; warn if workbook structure/windows are protected."
+    applies_to = _XLSX_ONLY
+    _OK_MESSAGE = "OK: no workbook protection"
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        meta = artifact.metadata or {}
+        view = _xlsx_view(artifact)
         # Note: For encryption, we *want* to elevate to ERROR even if other reads failed.
-        encrypted = bool(meta.get("password_encrypted_workbook", False))
+        encrypted = view.password_encrypted_workbook
 
         if encrypted:
-            return CheckResult(
-                file=artifact.path,
-                check_name=self.name(),
-                severity=Severity.ERROR,
-                passed=False,
-                message="Encrypted workbook (password protected)",
-                extra={
+            return _error(
+                artifact,
+                self.name,
+                "Encrypted workbook (password protected)",
+                {
                     "password_encrypted_workbook": True,
-                    "workbook_structure_protected": bool(meta.get("workbook_structure_protected", False)),
-                    "read_error": bool(meta.get("read_error", True)),
-                    "read_error_detail": meta.get("read_error_detail"),
+                    "workbook_structure_protected": view.workbook_structure_protected,
+                    "read_error": bool((artifact.metadata or {}).get("read_error", True)),
+                    "read_error_detail": (artifact.metadata or {}).get("read_error_detail"),
                 },
             )
 
         # Not encrypted; if the artifact is otherwise unreadable, return a warning.
-        if meta.get("read_error"):
-            return _unreadable_result(artifact, self.name(), "Unreadable XLSX (parse error)", meta)
+        if view.read_error:
+            return _unreadable_result(artifact, self.name, "Unreadable XLSX (parse error)", artifact.metadata or {})
 
-        structure_protected = bool(meta.get("workbook_structure_protected", False))
-        passed = not structure_protected
+        if not view.workbook_structure_protected:
+            return _ok(
+                artifact, self.name, self._OK_MESSAGE, {"password_encrypted_workbook": False, "workbook_structure_protected": False}
+            )
 
         # This rule is intentionally a WARNING when structure protection exists (policy choice).
-        severity = Severity.INFO if passed else Severity.WARNING
-
         return CheckResult(
             file=artifact.path,
-            check_name=self.name(),
-            severity=severity,
-            passed=passed,
-            message=(
-                "OK: no workbook protection"
-                if passed
-                else "Workbook structure/windows protection enabled"
-            ),
+            check_name=self.name,
+            severity=_WARN,
+            passed=False,
+            message="Workbook structure/windows protection enabled",
             extra={
                 "password_encrypted_workbook": False,
-                "workbook_structure_protected": structure_protected,
+                "workbook_structure_protected": True,
             },
         )
 
 
 # ============== 6) Comments/Notes (fail if any) ==============================
 
+@register
 class XlsxCommentsCheck(Check):
     """
     Treat legacy notes and threaded comments as comments; fail if any exist.
     """
 
-    def name(self) -> str:
-        return "xlsx_comments"
-
-    def description(self) -> str:
-        return "Workbook must not contain comments or notes (threaded or legacy)."
-
-    def applies_to(self) -> List[str]:
-        return [".xlsx"]
+    name = "xlsx_comments"
+    description = "Workbook must not contain comments or notes (threaded or legacy)."
+    applies_to = _XLSX_ONLY
+    _OK_MESSAGE = "OK: no comments/notes"
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        meta = artifact.metadata or {}
-        if meta.get("read_error"):
-            return _unreadable_result(artifact, self.name(), "Unreadable XLSX (parse error)", meta)
+        view = _xlsx_view(artifact)
+        if view.read_error:
+            return _unreadable_result(artifact, self.name, "Unreadable XLSX (parse error)", artifact.metadata or {})
 
-        notes = int(meta.get("comments_count") or 0)
-        threaded = int(meta.get("threaded_comments_count") or 0)
+        notes = view.comments_count
+        threaded = view.threaded_comments_count
         total = notes + threaded
-        passed = (total == 0)
+        if total == 0:
+            return _ok(
+                artifact, self.name, self._OK_MESSAGE, {"comments_count": 0, "threaded_comments_count": 0, "total_comments": 0}
+            )
 
-        return CheckResult(
-            file=artifact.path,
-            check_name=self.name(),
-            severity=Severity.INFO if passed else Severity.ERROR,
-            passed=passed,
-            message=(
-                "OK: no comments/notes"
-                if passed
-                else f"Found {total} comment(s) (notes={notes}, threaded={threaded})"
-            ),
-            extra={
+        return _error(
+            artifact,
+            self.name,
+            f"Found {total} comment(s) (notes={notes}, threaded={threaded})",
+            {
                 "comments_count": notes,
                 "threaded_comments_count": threaded,
                 "total_comments": total,
@@ -319,129 +363,89 @@ class XlsxCommentsCheck(Check):
 
 # ============== 7) VBA project present in .xlsx (fail if found) ==============
 
+@register
 class XlsxVbaInXlsxCheck(Check):
     """
     .xlsx should not contain macros; presence of xl/vbaProject.bin indicates macro content.
     """
 
-    def name(self) -> str:
-        return "xlsx_vba_in_xlsx"
-
-    def description(self) -> str:
-        return "Workbook must not embed a VBA project when using .xlsx format."
-
-    def applies_to(self) -> List[str]:
-        return [".xlsx"]
+    name = "xlsx_vba_in_xlsx"
+    description = "Workbook must not embed a VBA project when using .xlsx format."
+    applies_to = _XLSX_ONLY
+    _OK_MESSAGE = "OK: no VBA project"
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        meta = artifact.metadata or {}
-        if meta.get("read_error"):
-            return _unreadable_result(artifact, self.name(), "Unreadable XLSX (parse error)", meta)
-
-        has_vba = bool(meta.get("has_vba_project", False))
-        passed = (not has_vba)
+        view = _xlsx_view(artifact)
+        if view.read_error:
+            return _unreadable_result(artifact, self.name, "Unreadable XLSX (parse error)", artifact.metadata or {})
 
-        return CheckResult(
-            file=artifact.path,
-            check_name=self.name(),
-            severity=Severity.INFO if passed else Severity.ERROR,
-            passed=passed,
-            message=(
-                "OK: no VBA project" if passed else "VBA project embedded in workbook"
-            ),
-            extra={"has_vba_project": has_vba},
-        )
+        if not view.has_vba_project:
+            return _ok(artifact, self.name, self._OK_MESSAGE, {"has_vba_project": False})
 
+        return _error(artifact, self.name, "VBA project embedded in workbook", {"has_vba_project": True})
 
-# Register on import so the orchestrator discovers these via the registry.
-register_check(XlsxHiddenSheetsCheck())
-register_check(XlsxFormulaErrorsCheck())
-register_check(XlsxExternalLinksCheck())
-register_check(XlsxDataConnectionsCheck())
-register_check(XlsxWorkbookProtectionCheck())
-register_check(XlsxCommentsCheck())
-register_check(XlsxVbaInXlsxCheck())
 
 # -------------------------------------------------------------------
 # 8) Yellow-highlighted Cells (fail if any yellow cell found)
 # 9) Yellow-highlighted Sheet Tabs (fail if any sheet tab is yellow)
 # -------------------------------------------------------------------
 
+@register
 class XlsxYellowCellsCheck(Check):
     """
     Fail if any cells are highlighted with standard yellow fill.
     Uses metadata['yellow_cell_count'] populated by the XLSX processor.
     """
 
-    def name(self) -> str:
-        return "xlsx_yellow_cells"
-
-    def description(self) -> str:
-        return "Workbook must not contain yellow-highlighted cells."
-
-    def applies_to(self) -> list[str]:
-        return [".xlsx"]
+    name = "xlsx_yellow_cells"
+    description = "Workbook must not contain yellow-highlighted cells."
+    applies_to = _XLSX_ONLY
+    _OK_MESSAGE = "OK: no yellow cells"
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        meta = artifact.metadata or {}
+        view = _xlsx_view(artifact)
 
-        if meta.get("read_error"):
+        if view.read_error:
             # FIX: pass artifact + explicit message
-            return _unreadable_result(artifact, self.name(), "Unreadable XLSX (parse error)", meta)
+            return _unreadable_result(artifact, self.name, "Unreadable XLSX (parse error)", artifact.metadata or {})
 
-        yellow_cells = int(meta.get("yellow_cell_count") or 0)
-        passed = yellow_cells == 0
+        yellow_cells = view.yellow_cell_count
+        if yellow_cells == 0:
+            return _ok(artifact, self.name, self._OK_MESSAGE, {"yellow_cell_count": 0})
 
-        return CheckResult(
-            file=artifact.path,
-            check_name=self.name(),
-            passed=passed,
-            severity=Severity.INFO if passed else Severity.ERROR,
-            message=(
-                "OK: no yellow cells" if passed else "Yellow cells are present in the workbook"
-            ),
-            extra={"yellow_cell_count": yellow_cells},
+        return _error(
+            artifact, self.name, "Yellow cells are present in the workbook", {"yellow_cell_count": yellow_cells}
         )
 
 
+@register
 class XlsxYellowSheetTabsCheck(Check):
     """
     Fail if any sheet tab is highlighted with standard yellow color.
     Uses metadata['yellow_tab_sheets'] and ['yellow_tab_sheet_count'].
     """
 
-    def name(self) -> str:
-        return "xlsx_yellow_sheet_tabs"
-
-    def description(self) -> str:
-        return "Workbook must not contain sheets with yellow tab color."
-
-    def applies_to(self) -> list[str]:
-        return [".xlsx"]
+    name = "xlsx_yellow_sheet_tabs"
+    description = "Workbook must not contain sheets with yellow tab color."
+    applies_to = _XLSX_ONLY
+    _OK_MESSAGE = "OK: no yellow tabs"
 
     def run(self, artifact: FileArtifact) -> CheckResult:
-        meta = artifact.metadata or {}
+        view = _xlsx_view(artifact)
 
-        if meta.get("read_error"):
+        if view.read_error:
             # FIX: pass artifact + explicit message
-            return _unreadable_result(artifact, self.name(), "Unreadable XLSX (parse error)", meta)
+            return _unreadable_result(artifact, self.name, "Unreadable XLSX (parse error)", artifact.metadata or {})
 
-        count = int(meta.get("yellow_tab_sheet_count") or 0)
-        sheets = meta.get("yellow_tab_sheets") or []
-        passed = count == 0
+        count = view.yellow_tab_sheet_count
+        if count == 0:
+            return _ok(
+                artifact, self.name, self._OK_MESSAGE, {"yellow_tab_sheet_count": 0, "yellow_tab_sheets": []}
+            )
 
-        return CheckResult(
-            file=artifact.path,
-            check_name=self.name(),
-            passed=passed,
-            severity=Severity.INFO if passed else Severity.ERROR,
-            message=(
-                "OK: no yellow tabs" if passed else "Yellow tabs are present in the workbook"
-            ),
-            extra={"yellow_tab_sheet_count": count, "yellow_tab_sheets": sheets},
+        return _error(
+            artifact,
+            self.name,
+            "Yellow tabs are present in the workbook",
+            {"yellow_tab_sheet_count": count, "yellow_tab_sheets": view.yellow_tab_sheets},
         )
-
-
-# Register the new checks so they’re picked up by the orchestrator
-register_check(XlsxYellowCellsCheck())
-register_check(XlsxYellowSheetTabsCheck())
\ No newline at end of file
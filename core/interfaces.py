@@ -14,9 +14,11 @@ Design notes (SOLID):
 
 from __future__ import annotations
 
+import os
+import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Iterable, Protocol
+from typing import ClassVar, Iterable, List, Optional, Protocol, Tuple
 from .models import FileArtifact, CheckResult, ScanReport
 
 __all__ = ["FileProcessor", "Check", "ResultWriter", "ScanReportWriter"]
@@ -28,6 +30,11 @@ class FileProcessor(ABC):
 
     Implementations should be fast and avoid heavy parsing unless the checks
     truly need it. Never mutate files — processors are read-only by design.
+
+    The Orchestrator may call build_artifact from several worker processes at
+    once (one file per call), each with its own instance created on import.
+    Keep instances free of per-file mutable state; settings snapshotted in
+    __init__ are fine.
     """
 
     @abstractmethod
@@ -41,10 +48,13 @@ class FileProcessor(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def build_artifact(self, path: Path) -> FileArtifact:
+    def build_artifact(self, path: Path, stat_result: Optional[os.stat_result] = None) -> FileArtifact:
         """
         Produce a FileArtifact with essential metadata for checks.
 
+        `stat_result` is the stat captured during discovery (if any); use it
+        instead of calling path.stat() again.
+
         Must not mutate the file. Raise a clear exception if the file
         cannot be read; callers may catch and convert that into a CheckResult.
         """
@@ -55,23 +65,29 @@ class Check(ABC):
     """
     A single read-only validation rule that inspects a FileArtifact
     and returns a CheckResult. Keep implementations side-effect free.
+
+    Class attributes (plain data, read on every result, so not methods):
+    - name: stable, human-friendly name (used by UI and exports).
+      Keep it short and descriptive, e.g., "PDF not encrypted".
+    - applies_to: the file extensions this check supports, e.g. (".pdf",).
+      Use ("*",) to indicate it applies to all supported file types.
+    - description: optional one-line explanation of the rule.
     """
 
-    @abstractmethod
-    def name(self) -> str:
-        """
-        Stable, human-friendly name (used by UI and exports).
-        Keep it short and descriptive, e.g., "PDF not encrypted".
-        """
-        raise NotImplementedError
-
-    @abstractmethod
-    def applies_to(self) -> Iterable[str]:
-        """
-        Return the file extensions this check supports.
-        Use ["*"] to indicate it applies to all supported file types.
-        """
-        raise NotImplementedError
+    name: ClassVar[str]
+    applies_to: ClassVar[Tuple[str, ...]]
+    description: ClassVar[str] = ""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Keep the contract the abstract methods used to enforce
+        if not isinstance(getattr(cls, "name", None), str):
+            raise TypeError(f"{cls.__name__} must define a class attribute `name: str`")
+        # Names like "DOCX: no comments" aren't identifier-like, so the compiler
+        # doesn't intern them; do it once so lookups by check name hit identity.
+        cls.name = sys.intern(cls.name)
+        if isinstance(getattr(cls, "applies_to", None), (str, type(None))) or callable(cls.applies_to):
+            raise TypeError(f"{cls.__name__} must define a class attribute `applies_to: tuple[str, ...]`")
 
     @abstractmethod
     def run(self, artifact: FileArtifact) -> CheckResult:
@@ -82,6 +98,14 @@ class Check(ABC):
         """
         raise NotImplementedError
 
+    def run_many(self, artifact: FileArtifact) -> List[CheckResult]:
+        """
+        All results this check produces for the artifact (what the orchestrator calls).
+        Default: [self.run(artifact)]. A check that bundles several related rules
+        overrides this to evaluate them in one pass, one result per rule.
+        """
+        return [self.run(artifact)]
+
 
 class ResultWriter(Protocol):
     """
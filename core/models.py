@@ -15,22 +15,27 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-class Severity(Enum):
+class Severity(str, Enum):
     """
     How serious a finding is. Enums give us a small, typo-proof vocabulary
     that the UI can style consistently (e.g., ERROR in red, WARNING in amber).
+
+    A str mixin: each member IS its value ("INFO" == Severity.INFO), so JSON/CSV
+    writers can emit it directly without going through `.value`.
     """
+    __str__ = str.__str__  # str(Severity.INFO) -> "INFO" (as csv/f-strings use)
+
     INFO = "INFO"
     WARNING = "WARNING"
     ERROR = "ERROR"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileArtifact:
     """
     Lightweight, read-only description of a file produced by a FileProcessor.
 
-    Why frozen=True?
+    Why frozen?
     - Processors build this once. Checks must not mutate it.
     - Immutability avoids bugs where one check silently changes data for another.
 
@@ -42,22 +47,29 @@ class FileArtifact:
         PDF: {"encrypted": True, "pages": 12}
         DOCX: {"has_tracked_changes": False}
         PPTX: {"slide_count": 20}
+    - mtime_ns: filesystem modification time (ns since epoch), carried from the
+      discovery stat so checks don't stat the file again; None if unknown.
     """
     path: Path
     extension: str
     size_bytes: int
     metadata: Dict[str, Any] = field(default_factory=dict)
+    mtime_ns: Optional[int] = None
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckResult:
     """
     Outcome of running a single Check on a single FileArtifact.
 
-    Why frozen=True?
+    Why frozen?
     - A result is historical truth; keep it immutable after creation.
 
+    Why slots=True?
+    - One result is created per (file, check); no per-instance __dict__ keeps
+      large scans lighter on memory and GC.
+
     Fields:
     - file: the file that was checked (Path for convenience).
     - check_name: stable, human-readable name (good for UI & exports).
@@ -73,23 +85,40 @@ class CheckResult:
     message: str
     extra: Dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def crashed(cls, file: Path, check_name: str, exc: Exception) -> "CheckResult":
+        """ERROR result recorded when a check raises instead of returning a result."""
+        return cls(
+            file=file,
+            check_name=check_name,
+            severity=Severity.ERROR,
+            passed=False,
+            message=f"Check raised exception: {exc}",
+            extra={"exception": exc.__class__.__name__},
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class AggregateReport:
     """
     Container for all results from a scan. Mutable is fine here because
     the orchestrator will append results as it processes files.
     """
     results: List[CheckResult] = field(default_factory=list)
+    # Size per discovered file, from the discovery stat (missing if that stat failed)
+    file_sizes: Dict[Path, int] = field(default_factory=dict)
+
 
+class FileVerdict(str, Enum):
+    """Per-file outcome; a str mixin like Severity ("PASS" == FileVerdict.PASS_)."""
+    __str__ = str.__str__
 
-class FileVerdict(Enum):
     PASS_ = "PASS"   # trailing underscore to avoid keyword conflicts if used as attr
     WARN = "WARN"
     FAIL = "FAIL"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileReport: 
     """
     All results related to a single file, plus a verdict and quick counts.
@@ -104,7 +133,7 @@ class FileReport:
     results: List["CheckResult"] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunHeader:
     """
     Metadata about a scan run to make exports self-describing.
@@ -123,7 +152,7 @@ class RunHeader:
     total_infos: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScanReport:
     """
     The new top-level report: header + file-centric details.
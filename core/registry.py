@@ -3,8 +3,9 @@
 Lightweight plugin registry for processors and checks.
 
 Usage pattern:
-- Each concrete processor/check module creates an instance and calls
-  register_processor(...) / register_check(...) at import time.
+- Each concrete processor module creates an instance and calls
+  register_processor(...) at import time; check classes are decorated with
+  @register and instantiated only when a scan first needs them.
 - The orchestrator asks this registry for all processors and checks,
   and then wires them together based on file extensions.
 
@@ -16,14 +17,25 @@ Why this design (SOLID):
 
 from __future__ import annotations
 
-from typing import List, Type
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Type
 
 from .interfaces import FileProcessor, Check
 
-# Internal stores (module-private): lists of SINGLETON-like instances.
+# Internal stores (module-private), keyed by concrete class: SINGLETON-like instances.
 # We keep instances stateless; multiple instances of the same class are unnecessary.
-_PROCESSORS: List[FileProcessor] = []
-_CHECKS: List[Check] = []
+# Dicts keep registration order.
+_PROCESSORS: Dict[Type[FileProcessor], FileProcessor] = {}
+# Extension (lowercase) -> processor; if several claim one, the last registered wins.
+_PROCESSORS_BY_EXT: Dict[str, FileProcessor] = {}
+
+# Checks are registered by class (name/applies_to are class attributes), with their
+# normalized applies_to targets read once at registration. Each class is
+# instantiated only when a scan first needs it.
+_CHECKS: Dict[Type[Check], FrozenSet[str]] = {}
+_CHECK_INSTANCES: Dict[Type[Check], Check] = {}
+
+# Lazily built dispatch table: extension -> checks that apply, in registration order.
+_CHECKS_BY_EXT: Dict[str, Tuple[Check, ...]] = {}
 
 
 def register_processor(p: FileProcessor) -> None:
@@ -32,17 +44,41 @@ def register_processor(p: FileProcessor) -> None:
     We consider processors unique by their concrete class to avoid duplicates
     when modules are imported more than once in some environments.
     """
-    if not any(isinstance(existing, type(p)) for existing in _PROCESSORS):
-        _PROCESSORS.append(p)
+    cls = type(p)
+    if cls in _PROCESSORS or any(issubclass(existing, cls) for existing in _PROCESSORS):
+        return
+    _PROCESSORS[cls] = p
+    for ext in p.supports():
+        _PROCESSORS_BY_EXT[ext.lower()] = p
 
 
-def register_check(c: Check) -> None:
+def register(cls: Type[Check]) -> Type[Check]:
     """
-    Register a check instance if not already present.
+    Class decorator: register a Check class (instantiated on first use).
+
+        @register
+        class PdfNoCommentsCheck(Check): ...
+
     Checks are unique by concrete class (one instance per check class).
     """
-    if not any(isinstance(existing, type(c)) for existing in _CHECKS):
-        _CHECKS.append(c)
+    _add_check_class(cls)
+    return cls
+
+
+def register_check(c: Check) -> None:
+    """
+    Register a ready-made check instance if its class is not already present.
+    """
+    register_checks((c,))
+
+
+def register_checks(cs: Iterable[Check]) -> None:
+    """
+    Register several check instances in order (same rules as register_check).
+    """
+    for c in cs:
+        if _add_check_class(type(c)):
+            _CHECK_INSTANCES[type(c)] = c
 
 
 def processors() -> List[FileProcessor]:
@@ -50,20 +86,78 @@ def processors() -> List[FileProcessor]:
     Return a shallow copy of registered processors to prevent accidental mutation
     of the internal list by callers.
     """
-    return list(_PROCESSORS)
+    return list(_PROCESSORS.values())
 
 
-def checks() -> List[Check]:
+def processor_for(ext: str) -> Optional[FileProcessor]:
+    """
+    Return the processor registered for `ext` (dot-prefixed, any case), or None.
     """
-    Return a shallow copy of registered checks.
+    return _PROCESSORS_BY_EXT.get(ext.lower())
+
+
+def check_classes() -> List[Type[Check]]:
+    """
+    Return the registered check classes (no instances are created).
     """
     return list(_CHECKS)
 
 
+def checks() -> List[Check]:
+    """
+    Return the registered checks as instances (creating any not yet built).
+    """
+    return [_instance(cls) for cls in _CHECKS]
+
+
+def checks_for(ext: str) -> Tuple[Check, ...]:
+    """
+    Return the checks that apply to `ext` (dot-prefixed), including '*' checks.
+    Resolved once per extension and cached, so per-file dispatch does no
+    applies_to lookups; only the checks a scan actually meets get instantiated.
+    """
+    key = ext.lower()
+    hit = _CHECKS_BY_EXT.get(key)
+    if hit is None:
+        hit = tuple(
+            _instance(cls) for cls, targets in _CHECKS.items()
+            if "*" in targets or key in targets
+        )
+        _CHECKS_BY_EXT[key] = hit
+    return hit
+
+
+def is_populated() -> bool:
+    """True once any processor or check has registered (plugins were imported)."""
+    return bool(_PROCESSORS or _CHECKS)
+
+
 def clear_registry() -> None:
     """
     Testing helper: wipe current registrations.
     Not intended for use in the running app.
     """
     _PROCESSORS.clear()
+    _PROCESSORS_BY_EXT.clear()
     _CHECKS.clear()
+    _CHECK_INSTANCES.clear()
+    _CHECKS_BY_EXT.clear()
+
+
+# ---------- helpers (module-internal) ----------
+
+def _add_check_class(cls: Type[Check]) -> bool:
+    """Add `cls` unless it (or a subclass) is registered; True if added."""
+    if cls in _CHECKS or any(issubclass(existing, cls) for existing in _CHECKS):
+        return False
+    _CHECKS[cls] = frozenset(str(t).lower() for t in cls.applies_to)
+    _CHECKS_BY_EXT.clear()
+    return True
+
+
+def _instance(cls: Type[Check]) -> Check:
+    """The single instance of a registered check class, built on first request."""
+    inst = _CHECK_INSTANCES.get(cls)
+    if inst is None:
+        inst = _CHECK_INSTANCES[cls] = cls()
+    return inst
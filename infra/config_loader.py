@@ -24,20 +24,28 @@ Spelling/Grammar (new):
 - XRAY_MAX_TEXT_CHARS             (int; cap for text extraction, default 5_000_000)
 - XRAY_SPELLING_FAIL_THRESHOLD    (int; default 10)
 - XRAY_MAX_MISSPELLINGS_REPORTED  (int; default 100)
+- XRAY_MIN_TEXT_LENGTH_FOR_SPELLING (int; default 0 = always check)
 - XRAY_GRAMMAR_FAIL_THRESHOLD     (int; default 5)
+
+DOCX:
+- XRAY_DOCX_PRESENCE_ONLY         ("1"/"true"/"yes" -> True; counts stop at the first hit)
+
+XLSX:
+- XRAY_XLSX_PRESENCE_ONLY         ("1"/"true"/"yes" -> True; worksheet error scans stop at the first hit)
 """
 
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 _DEFAULT: Dict[str, Any] = {
     # Core
     "max_filename_length": 120,
     "target_extensions": [".docx", ".pptx", ".pdf", ".xlsx"],
-    "ignore_dirs": [".git", "__pycache__", "venv"],
+    "ignore_dirs": [".git", "__pycache__", "venv", "ignore"],  # hidden (dot) folders are always skipped
     "log_level": "INFO",  # DEBUG/INFO/WARNING/ERROR
 
     # Spelling (basic phase 1 checks)
@@ -46,6 +54,13 @@ _DEFAULT: Dict[str, Any] = {
     "max_text_chars": 5_000_000,          # extraction cap to protect memory/CPU
     "spelling_fail_threshold": 10,        # >10 misspellings => ERROR (policy)
     "max_misspellings_reported": 100,     # cap list in CheckResult.extra
+    "min_text_length_for_spelling": 0,    # shorter text samples skip the spelling check
+
+    # DOCX audits: stop counting comments/tracked changes/highlights at the first hit
+    "docx_presence_only": False,
+
+    # XLSX audits: stop the formula-error scan at the first error of any kind
+    "xlsx_presence_only": False,
 
     # Grammar - disabled by default
     "enable_grammar": False,
@@ -65,6 +80,8 @@ def load_config() -> Dict[str, Any]:
     Booleans:
       - XRAY_ENABLE_SPELLING ("1"/"true"/"yes" -> True)
       - XRAY_ENABLE_GRAMMAR ("1"/"true"/"yes" -> True)
+      - XRAY_DOCX_PRESENCE_ONLY ("1"/"true"/"yes" -> True)
+      - XRAY_XLSX_PRESENCE_ONLY ("1"/"true"/"yes" -> True)
 
     Strings:
       - XRAY_LOG_LEVEL
@@ -76,25 +93,41 @@ def load_config() -> Dict[str, Any]:
       - XRAY_MAX_TEXT_CHARS
       - XRAY_SPELLING_FAIL_THRESHOLD
       - XRAY_MAX_MISSPELLINGS_REPORTED
+      - XRAY_MIN_TEXT_LENGTH_FOR_SPELLING
       - XRAY_GRAMMAR_FAIL_THRESHOLD
+
+    Environment variables are read once per process and cached; call
+    invalidate_config() after changing them. The returned dict is a fresh copy,
+    so callers may mutate it without affecting later calls.
+
+    Processors (at registration) and some checks (on first use) keep their own
+    snapshot of the values they need; those stay as they are for the process.
     """
-    cfg = dict(_DEFAULT)
+    return {k: list(v) if isinstance(v, list) else v for k, v in _cached_config().items()}
 
-    # Numeric overrides
-    _int_env(cfg, "max_filename_length", "XRAY_MAX_FILENAME_LENGTH")
-    _int_env(cfg, "max_text_chars", "XRAY_MAX_TEXT_CHARS")
-    _int_env(cfg, "spelling_fail_threshold", "XRAY_SPELLING_FAIL_THRESHOLD")
-    _int_env(cfg, "max_misspellings_reported", "XRAY_MAX_MISSPELLINGS_REPORTED")
-    _int_env(cfg, "grammar_fail_threshold", "XRAY_GRAMMAR_FAIL_THRESHOLD")
 
-    # Boolean overrides
-    _bool_env(cfg, "enable_spelling", "XRAY_ENABLE_SPELLING")
-    _bool_env(cfg, "enable_grammar", "XRAY_ENABLE_GRAMMAR")
+def invalidate_config() -> None:
+    """
+    Drop the cached config so the next load_config() re-reads the environment.
 
-    # String overrides
-    _str_upper_env(cfg, "log_level", "XRAY_LOG_LEVEL")
-    _str_env(cfg, "grammar_engine", "XRAY_GRAMMAR_ENGINE")
-    _str_env(cfg, "language_code", "XRAY_LANGUAGE_CODE")
+    Only load_config() itself is refreshed: settings already snapshotted by
+    registered processors or cached by checks are not re-read.
+    """
+    _cached_config.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _cached_config() -> Dict[str, Any]:
+    cfg = dict(_DEFAULT)
+
+    # Scalar overrides: one lookup per variable, parsers return None to keep the default
+    for key, env_key, parse in _SCALAR_ENV:
+        val = os.getenv(env_key)
+        if val is None:
+            continue
+        parsed = parse(val)
+        if parsed is not None:
+            cfg[key] = parsed
 
     # List overrides
     ig = os.getenv("XRAY_IGNORE_DIRS")
@@ -118,30 +151,39 @@ def _split_list(s: str) -> List[str]:
     return [part.strip() for part in s.split(",") if part.strip()]
 
 
-def _bool_env(cfg: Dict[str, Any], key: str, env_key: str) -> None:
-    val = os.getenv(env_key)
-    if val is None:
-        return
-    s = val.strip().lower()
-    cfg[key] = s in {"1", "true", "yes", "on"}
+def _parse_bool(val: str) -> bool:
+    return val.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _parse_int(val: str) -> Optional[int]:
+    s = val.strip()
+    return int(s) if s.isdecimal() else None
 
 
-def _int_env(cfg: Dict[str, Any], key: str, env_key: str) -> None:
-    val = os.getenv(env_key)
-    if val and val.strip().isdigit():
-        try:
-            cfg[key] = int(val)
-        except ValueError:
-            pass
+def _parse_str(val: str) -> str:
+    return val.strip()
 
 
-def _str_env(cfg: Dict[str, Any], key: str, env_key: str) -> None:
-    val = os.getenv(env_key)
-    if val is not None:
-        cfg[key] = val.strip()
+def _parse_str_upper(val: str) -> str:
+    return val.strip().upper()
 
 
-def _str_upper_env(cfg: Dict[str, Any], key: str, env_key: str) -> None:
-    val = os.getenv(env_key)
-    if val is not None:
-        cfg[key] = val.strip().upper()
\ No newline at end of file
+# (config key, environment variable, parser)
+_SCALAR_ENV: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    # Integers
+    ("max_filename_length", "XRAY_MAX_FILENAME_LENGTH", _parse_int),
+    ("max_text_chars", "XRAY_MAX_TEXT_CHARS", _parse_int),
+    ("spelling_fail_threshold", "XRAY_SPELLING_FAIL_THRESHOLD", _parse_int),
+    ("max_misspellings_reported", "XRAY_MAX_MISSPELLINGS_REPORTED", _parse_int),
+    ("min_text_length_for_spelling", "XRAY_MIN_TEXT_LENGTH_FOR_SPELLING", _parse_int),
+    ("grammar_fail_threshold", "XRAY_GRAMMAR_FAIL_THRESHOLD", _parse_int),
+    # Booleans
+    ("enable_spelling", "XRAY_ENABLE_SPELLING", _parse_bool),
+    ("enable_grammar", "XRAY_ENABLE_GRAMMAR", _parse_bool),
+    ("docx_presence_only", "XRAY_DOCX_PRESENCE_ONLY", _parse_bool),
+    ("xlsx_presence_only", "XRAY_XLSX_PRESENCE_ONLY", _parse_bool),
+    # Strings
+    ("log_level", "XRAY_LOG_LEVEL", _parse_str_upper),
+    ("grammar_engine", "XRAY_GRAMMAR_ENGINE", _parse_str),
+    ("language_code", "XRAY_LANGUAGE_CODE", _parse_str),
+)
@@ -10,47 +10,81 @@ Exports:
 Usage:
     from infra.exporters import JsonScanReportWriter, FilesCsvWriter, ChecksCsvWriter
     JsonScanReportWriter("scan.json").write(report)
+    JsonScanReportWriter("scan.json", compress=True).write(report)  # -> scan.json.gz
     FilesCsvWriter("files.csv").write(report)
     ChecksCsvWriter("checks.csv").write(report)
 """
 
 from __future__ import annotations
 
+import gzip
 import json
-from dataclasses import asdict, is_dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict
 
 import csv
 
-from core.interfaces import ScanReportWriter
-from core.models import ScanReport, CheckResult
-
+try:  # optional: much faster JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
-def _to_iso(obj):
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    return obj
+from core.interfaces import ScanReportWriter
+from core.models import FileReport, ScanReport
 
 
-def _result_to_plain(r: CheckResult) -> Dict[str, Any]:
+def _file_to_plain(f: FileReport) -> Dict[str, Any]:
+    # Every result under a FileReport is for that file: convert the Path once
+    fstr = str(f.file)
     return {
-        "file": str(r.file),
-        "check": r.check_name,
-        "severity": r.severity.value,
-        "passed": bool(r.passed),
-        "message": r.message,
-        "extra": r.extra,
+        "file": fstr,
+        "extension": f.extension,
+        "size_bytes": f.size_bytes,
+        "verdict": f.verdict,
+        "counts": {
+            "errors": f.errors,
+            "warnings": f.warnings,
+            "infos": f.infos,
+        },
+        "results": [
+            {
+                "file": fstr,
+                "check": r.check_name,
+                "severity": r.severity,  # str-valued enum
+                "passed": bool(r.passed),
+                "message": r.message,
+                "extra": r.extra,
+            }
+            for r in f.results
+        ],
     }
 
 
+def _dumps(obj: Any) -> bytes:
+    """UTF-8 JSON with a 2-space indent (orjson when installed, else the stdlib)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 class JsonScanReportWriter(ScanReportWriter):
-    def __init__(self, path: str | Path) -> None:
+    """
+    Writes the whole report as one JSON document.
+
+    The files[] array is streamed: each file is serialized and written on its own,
+    so neither the full payload dict nor the full JSON string is held in memory.
+
+    compress=True writes gzip (fast level 1; report JSON typically shrinks 10x+)
+    to `path` + ".gz", trading a little CPU for much less disk/network I/O.
+    """
+    def __init__(self, path: str | Path, compress: bool = False) -> None:
         self.path = Path(path)
+        self.compress = compress
+        if compress and self.path.suffix.lower() != ".gz":
+            self.path = self.path.with_name(self.path.name + ".gz")
 
     def write(self, report: ScanReport) -> None:
-        payload = {
+        head = {
             "schema_version": report.header.schema_version,
             "header": {
                 "run_id": report.header.run_id,
@@ -66,23 +100,26 @@ class JsonScanReportWriter(ScanReportWriter):
                     "infos": report.header.total_infos,
                 },
             },
-            "files": [
-                {
-                    "file": str(f.file),
-                    "extension": f.extension,
-                    "size_bytes": f.size_bytes,
-                    "verdict": f.verdict.value,
-                    "counts": {
-                        "errors": f.errors,
-                        "warnings": f.warnings,
-                        "infos": f.infos,
-                    },
-                    "results": [_result_to_plain(r) for r in f.results],
-                }
-                for f in report.files
-            ],
         }
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        with _open_output(self.path, self.compress) as fp:
+            # Reopen the header object ("...\n}") and append "files" to it
+            fp.write(_dumps(head)[:-2])
+            if not report.files:
+                fp.write(b',\n  "files": []\n}')
+                return
+            sep = b',\n  "files": [\n    '
+            for f in report.files:
+                fp.write(sep)
+                # Same layout as a nested dump: shift each line to the array's indent
+                fp.write(_dumps(_file_to_plain(f)).replace(b"\n", b"\n    "))
+                sep = b",\n    "
+            fp.write(b"\n  ]\n}")
+
+
+def _open_output(path: Path, compress: bool) -> BinaryIO:
+    if compress:
+        return gzip.open(path, "wb", compresslevel=1)
+    return path.open("wb")
 
 
 class FilesCsvWriter(ScanReportWriter):
@@ -97,8 +134,10 @@ class FilesCsvWriter(ScanReportWriter):
         with self.path.open("w", newline="", encoding="utf-8") as fp:
             w = csv.writer(fp)
             w.writerow(["File", "Extension", "SizeBytes", "Verdict", "Errors", "Warnings", "Infos"])
-            for f in report.files:
-                w.writerow([str(f.file), f.extension, f.size_bytes, f.verdict.value, f.errors, f.warnings, f.infos])
+            w.writerows(
+                (str(f.file), f.extension, f.size_bytes, f.verdict, f.errors, f.warnings, f.infos)
+                for f in report.files
+            )
 
 
 class ChecksCsvWriter(ScanReportWriter):
@@ -113,13 +152,18 @@ class ChecksCsvWriter(ScanReportWriter):
         with self.path.open("w", newline="", encoding="utf-8") as fp:
             w = csv.writer(fp)
             w.writerow(["File", "Check", "Severity", "Passed", "Message", "Extra"])
-            for f in report.files:
-                for r in f.results:
-                    w.writerow([
-                        str(r.file),
-                        r.check_name,
-                        r.severity.value,
-                        "TRUE" if r.passed else "FALSE",
-                        r.message,
-                        json.dumps(r.extra, ensure_ascii=False),
-                    ])
+            dumps = json.dumps
+            # Results are grouped per file: one str(Path) per file, not per row
+            w.writerows(
+                (
+                    fstr,
+                    r.check_name,
+                    r.severity,
+                    "TRUE" if r.passed else "FALSE",
+                    r.message,
+                    dumps(r.extra, ensure_ascii=False),
+                )
+                for f in report.files
+                for fstr in (str(f.file),)
+                for r in f.results
+            )
@@ -11,6 +11,10 @@ from pathlib import Path
 from typing import Optional
 
 
+# Set once handlers are installed; Streamlit reruns then only adjust levels.
+_CONFIGURED = False
+
+
 def configure_logging(level_name: str = "INFO", log_dir: Optional[Path] = None) -> None:
     """
     Configure console + rotating file logging.
@@ -18,8 +22,19 @@ def configure_logging(level_name: str = "INFO", log_dir: Optional[Path] = None)
     Args:
         level_name: "DEBUG" | "INFO" | "WARNING" | "ERROR"
         log_dir: optional custom log directory (defaults to ./logs)
+
+    Repeat calls (e.g. Streamlit reruns) only update handler levels: no
+    directory, formatter or handler is created again.
     """
+    global _CONFIGURED
     level = getattr(logging, level_name.upper(), logging.INFO)
+
+    root = logging.getLogger()
+    # Avoid duplicate handlers if user reruns the Streamlit script
+    if _CONFIGURED or root.handlers:
+        _update_levels(root, level)
+        return
+
     log_dir = log_dir or (Path.cwd() / "logs")
     log_dir.mkdir(parents=True, exist_ok=True)
 
@@ -35,13 +50,14 @@ def configure_logging(level_name: str = "INFO", log_dir: Optional[Path] = None)
     file_handler.setLevel(level)
     file_handler.setFormatter(fmt)
 
-    root = logging.getLogger()
-    # Avoid duplicate handlers if user reruns the Streamlit script
-    if not root.handlers:
-        root.setLevel(level)
-        root.addHandler(console)
-        root.addHandler(file_handler)
-    else:
-        # Update existing handler levels on rerun
-        for h in root.handlers:
+    root.setLevel(level)
+    root.addHandler(console)
+    root.addHandler(file_handler)
+    _CONFIGURED = True
+
+
+def _update_levels(root: logging.Logger, level: int) -> None:
+    """Update existing handler levels on rerun (no-op when unchanged)."""
+    for h in root.handlers:
+        if h.level != level:
             h.setLevel(level)
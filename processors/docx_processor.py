@@ -25,27 +25,33 @@ Design (SOLID):
 - DIP: Checks depend on abstract text (string in metadata), not concrete libraries like python-docx.
 
 Implementation notes:
-- Use python-docx for core props (simple & stable).
-- Use zipfile + iterparse to stream-read XML parts (fast, low memory) for existing counts.
-- Use utils.text_extract.extract_docx_text to build a single text sample (early-stopped at max_text_chars from config).
+- Stateless per file: files are parallelised by the Orchestrator's process pool, not here.
+- Read the file once; python-docx (core props) and zipfile both parse the in-memory bytes.
+- Use zipfile + iterparse to stream-read XML parts (fast, low memory) for existing counts
+  (utils.xml_utils: lxml with a parser-side tag filter when available, stdlib otherwise);
+  tracked changes and highlights are counted with a byte regex, one read per part.
+- Use utils.text_extract to build a single text sample (early-stopped at max_text_chars from config),
+  reusing the python-docx Document already opened for core props.
 """
 
 from __future__ import annotations
 
+import os
+import re
+from io import BytesIO
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional
 from zipfile import ZipFile, BadZipFile
-from xml.etree.ElementTree import iterparse
-
-from docx import Document
-from docx.opc.exceptions import PackageNotFoundError
 
 from core.interfaces import FileProcessor
 from core.models import FileArtifact
 from core.registry import register_processor
 
 # NEW: text extraction helpers and config
-from utils.text_extract import extract_docx_text, tokenize_words
+from utils.text_extract import extract_docx_document_text, extract_docx_text, count_words
+from utils.xml_utils import iter_elements
 from infra.config_loader import load_config
 
 
@@ -57,11 +63,20 @@ DOC_PARTS_TO_SCAN = (
 
 
 class DocxProcessor(FileProcessor):
+    def __init__(self) -> None:
+        # Snapshot the text-extraction settings once instead of per file
+        cfg = load_config()
+        self._extract_text = bool(cfg.get("enable_spelling", True) or cfg.get("enable_grammar", False))
+        self._max_text_chars = int(cfg.get("max_text_chars", 5_000_000))
+        # Presence-only audits stop each count at 1 (counts become "at least")
+        self._count_limit: Optional[int] = 1 if cfg.get("docx_presence_only", False) else None
+
     def supports(self):
         return [".docx"]
 
-    def build_artifact(self, path: Path) -> FileArtifact:
-        size = path.stat().st_size
+    def build_artifact(self, path: Path, stat_result: Optional[os.stat_result] = None) -> FileArtifact:
+        st = stat_result or path.stat()  # reuse the discovery stat when given
+        size = st.st_size
         metadata: Dict[str, Any] = {
             "kind": "docx",
             "paragraph_count": None,
@@ -74,6 +89,8 @@ class DocxProcessor(FileProcessor):
             "tracked_changes_count": 0,
             "highlight_run_count": 0,
             "shading_highlight_count": 0,
+            # True when counts were stopped at the first hit (config docx_presence_only)
+            "counts_presence_only": self._count_limit is not None,
             "read_error": False,
             # NEW: text extraction fields
             "text_sample": "",
@@ -85,9 +102,17 @@ class DocxProcessor(FileProcessor):
             # "text_extraction_error_detail": "...",
         }
 
+        # Read the package once: python-docx, the XML scan and the text sample all
+        # work from these bytes instead of each reopening the file.
+        try:
+            package: Optional[bytes] = path.read_bytes()
+        except OSError:
+            package = None  # each step reopens by path and reports its own error
+
         # 1) Core props via python-docx (graceful if it fails)
+        doc = None
         try:
-            doc = Document(str(path))
+            doc = _docx_document_class()(_package_source(path, package))
             metadata["paragraph_count"] = len(doc.paragraphs)
             metadata["table_count"] = len(doc.tables)
             core = doc.core_properties
@@ -101,77 +126,62 @@ class DocxProcessor(FileProcessor):
 
         # 2) XML scan inside the .docx (ZIP)
         try:
-            with ZipFile(str(path)) as zf:
+            limit = self._count_limit
+            with ZipFile(_package_source(path, package)) as zf:
+                names = zf.namelist()
+                name_set = set(names)
+
                 # Comments (legacy + modern)
                 c_count = 0
                 # legacy comments: /word/comments.xml with <w:comment>
-                if "word/comments.xml" in zf.namelist():
-                    c_count += _count_tags_in_zip(zf, "word/comments.xml", {"comment"})
+                if "word/comments.xml" in name_set:
+                    c_count += _count_tags_in_zip(zf, "word/comments.xml", _COMMENT_TAGS, limit)
                 # modern/extended comments: /word/commentsExtended.xml with w15:commentEx
-                if "word/commentsExtended.xml" in zf.namelist():
-                    c_count += _count_tags_in_zip(zf, "word/commentsExtended.xml", {"commentEx"})
+                if "word/commentsExtended.xml" in name_set and not _reached(limit, c_count):
+                    c_count += _count_tags_in_zip(zf, "word/commentsExtended.xml", _COMMENT_EX_TAGS, limit)
                 metadata["comments_count"] = c_count
                 metadata["comments_present"] = c_count > 0
 
-                # Tracked changes across main doc + headers/footers
-                tracked_tags = {
-                    "ins",
-                    "del",
-                    "moveFrom",
-                    "moveTo",
-                    "tblPrChange",
-                    "trPrChange",
-                    "tcPrChange",
-                    "pPrChange",
-                    "rPrChange",
-                }
-                tracked_total = 0
-
-                # Main document
-                if "word/document.xml" in zf.namelist():
-                    tracked_total += _count_tags_in_zip(zf, "word/document.xml", tracked_tags)
-
-                # Headers/footers (names vary: header1.xml, footer2.xml, etc.)
-                for name in zf.namelist():
-                    if name.startswith("word/header") and name.endswith(".xml"):
-                        tracked_total += _count_tags_in_zip(zf, name, tracked_tags)
-                    if name.startswith("word/footer") and name.endswith(".xml"):
-                        tracked_total += _count_tags_in_zip(zf, name, tracked_tags)
-
-                metadata["tracked_changes_count"] = tracked_total
+                # Tracked changes and highlights across main doc + headers/footers,
+                # counted in one pass per part (names vary: header1.xml, footer2.xml, etc.)
+                scan_targets = ["word/document.xml"]
+                scan_targets += [n for n in names if n.startswith(("word/header", "word/footer")) and n.endswith(".xml")]
 
-                # Highlights: explicit w:highlight, plus shading w:shd fill
+                tracked_total = 0
                 highlight_count = 0
                 shading_count = 0
-
-                scan_targets = ["word/document.xml"]
-                scan_targets += [n for n in zf.namelist() if n.startswith("word/header") and n.endswith(".xml")]
-                scan_targets += [n for n in zf.namelist() if n.startswith("word/footer") and n.endswith(".xml")]
-
                 for part in scan_targets:
-                    h, s = _count_highlights_in_part(zf, part)
+                    t, h, s = _scan_doc_part(zf, part, limit)
+                    tracked_total += t
                     highlight_count += h
                     shading_count += s
+                    if _reached(limit, tracked_total, highlight_count, shading_count):
+                        break
 
+                metadata["tracked_changes_count"] = tracked_total
+                # Highlights: explicit w:highlight, plus shading w:shd fill
                 metadata["highlight_run_count"] = highlight_count
                 metadata["shading_highlight_count"] = shading_count
 
-        except (PackageNotFoundError, KeyError, ValueError, OSError, Exception) as exc:
+        except (KeyError, ValueError, OSError, Exception) as exc:
             metadata["read_error"] = True
             metadata["read_error_detail"] = str(exc) or exc.__class__.__name__
 
         # 3) NEW: Plain-text sample extraction (for spelling/grammar checks)
         # We compute this even if earlier steps had issues, so downstream checks that only need text can still run.
         try:
-            cfg = load_config()
             # Only extract text when at least one of these features is enabled.
-            if cfg.get("enable_spelling", True) or cfg.get("enable_grammar", False):
-                max_chars = int(cfg.get("max_text_chars", 5_000_000))
-                sample = extract_docx_text(path, max_chars)
+            if self._extract_text:
+                max_chars = self._max_text_chars
+                # Reuse the Document parsed in step 1; reopen only if that failed
+                if doc is not None:
+                    sample = extract_docx_document_text(doc, max_chars)
+                else:
+                    sample = extract_docx_text(path, max_chars)
                 metadata["text_sample"] = sample
                 metadata["text_length"] = len(sample)
                 # Tokenization gives a rough word count for quick stats; checks will re-tokenize as needed.
-                metadata["token_count"] = len(tokenize_words(sample))
+                metadata["token_count"] = count_words(sample)
         except Exception as exc:
             # Important: text extraction failure should not mark the entire file unreadable.
             metadata["text_sample"] = ""
@@ -185,11 +195,25 @@ class DocxProcessor(FileProcessor):
             extension=".docx",
             size_bytes=size,
             metadata=metadata,
+            mtime_ns=st.st_mtime_ns,
         )
 
 
 # --- helpers ---
 
+@lru_cache(maxsize=1)
+def _docx_document_class():
+    """python-docx's Document, imported on first use (registering this processor stays cheap)."""
+    from docx import Document
+
+    return Document
+
+
+def _package_source(path: Path, package: Optional[bytes]):
+    """A fresh in-memory file over the package bytes, or the path if reading failed."""
+    return BytesIO(package) if package is not None else os.fspath(path)
+
+
 def _safe_iso(dt) -> Optional[str]:
     try:
         return dt.isoformat() if dt is not None else None
@@ -197,56 +221,95 @@ def _safe_iso(dt) -> Optional[str]:
         return None
 
 
-def _count_tags_in_zip(zf: ZipFile, member: str, localname_set: set[str]) -> int:
+_COMMENT_TAGS = frozenset({"comment"})
+_COMMENT_EX_TAGS = frozenset({"commentEx"})
+_TRACKED_TAGS = frozenset({
+    "ins",
+    "del",
+    "moveFrom",
+    "moveTo",
+    "tblPrChange",
+    "trPrChange",
+    "tcPrChange",
+    "pPrChange",
+    "rPrChange",
+})
+_SHADING_TAGS = frozenset({"shd"})
+_W_FILL = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}fill"
+
+# Start tag of a tracked-change or highlight element, any (or no) namespace prefix.
+# Group 1 is the local-name; the lookahead stops e.g. <w:del from matching <w:delText.
+_DOC_PART_TAG_RE = re.compile(
+    rb"<(?:[A-Za-z_][\w.-]*:)?("
+    + b"|".join(t.encode() for t in sorted(_TRACKED_TAGS | {"highlight"}))
+    + rb")(?=[\s/>])"
+)
+
+
+def _count_tags_in_zip(
+    zf: ZipFile, member: str, localname_set: FrozenSet[str], limit: Optional[int] = None
+) -> int:
     """
     Count elements whose tag's local-name is in localname_set.
     local-name = tag without namespace, e.g., '{ns}comment' -> 'comment'.
+    With a limit, parsing stops once that many have been found.
     """
-    count = 0
     with zf.open(member) as fp:
-        # 'events' = ("end",) is cheaper; clear elements as we go to save memory
-        for _event, elem in iterparse(fp, events=("end",)):
-            if _local_name(elem.tag) in localname_set:
-                count += 1
-            elem.clear()
-    return count
+        return sum(1 for _ in islice(iter_elements(fp, localname_set), limit))
 
 
-def _count_highlights_in_part(zf: ZipFile, member: str) -> tuple[int, int]:
+def _scan_doc_part(zf: ZipFile, member: str, limit: Optional[int] = None) -> tuple[int, int, int]:
     """
-    Return (highlight_count, shading_count) for a single XML part.
+    Return (tracked_count, highlight_count, shading_count) for a single XML part,
+    from one decompression of it.
+    - tracked_count: number of tracked-change elements (see _TRACKED_TAGS)
     - highlight_count: number of <w:highlight> occurrences
     - shading_count: number of <w:shd> with a non-empty/non-'auto' fill
+
+    Tracked changes and highlights are only counted, so a regex over the raw
+    bytes is enough; the XML parser runs only for parts containing w:shd,
+    whose fill attribute has to be inspected.
+
+    With a limit, each scan stops once its counts have reached it.
     """
+    data = zf.read(member)
+    t_count = 0
     h_count = 0
+    for m in _DOC_PART_TAG_RE.finditer(data):
+        if m.group(1) == b"highlight":
+            h_count += 1
+        else:
+            t_count += 1
+        if limit is not None and _reached(limit, t_count, h_count):
+            break
+
     s_count = 0
-    with zf.open(member) as fp:
-        for _event, elem in iterparse(fp, events=("end",)):
-            lname = _local_name(elem.tag)
-            if lname == "highlight":
-                h_count += 1
-            elif lname == "shd":
-                # Attributes may be namespaced; accept any attr ending with 'fill'
-                has_fill = False
-                for k, v in elem.attrib.items():
-                    if k.endswith("fill"):
-                        val = (v or "").strip().lower()
-                        if val and val not in {"auto", "none"}:
-                            has_fill = True
-                            break
-                if has_fill:
-                    s_count += 1
-            elem.clear()
-    return h_count, s_count
-
-
-def _local_name(tag: str) -> str:
-    """
-    Strip the XML namespace from a tag: '{namespace}name' -> 'name'.
-    """
-    if "}" in tag:
-        return tag.split("}", 1)[1]
-    return tag
+    if b"shd" in data:
+        for elem in iter_elements(BytesIO(data), _SHADING_TAGS):
+            if _has_fill(elem):
+                s_count += 1
+                if _reached(limit, s_count):
+                    break
+    return t_count, h_count, s_count
+
+
+def _reached(limit: Optional[int], *counts: int) -> bool:
+    """True if there is a count limit and every count has reached it."""
+    return limit is not None and min(counts) >= limit
+
+
+def _has_fill(shd) -> bool:
+    """True if a w:shd element carries a non-empty, non-'auto'/'none' fill."""
+    # Fast path: the standard w:fill attribute, read directly
+    if _is_real_fill(shd.get(_W_FILL)):
+        return True
+    # Attributes may be namespaced otherwise; accept any attr ending with 'fill'
+    return any(k.endswith("fill") and _is_real_fill(v) for k, v in shd.attrib.items())
+
+
+def _is_real_fill(value: Optional[str]) -> bool:
+    val = (value or "").strip().lower()
+    return bool(val) and val not in {"auto", "none"}
 
 
 # Register on import
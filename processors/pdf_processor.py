@@ -26,32 +26,42 @@ Design (SOLID):
 Notes:
 - We do not mark the entire file unreadable if text extraction fails; we set text_extraction_error instead.
 - For encrypted PDFs, pypdf reports reader.is_encrypted == True. We record 'encrypted' and skip annotation/page parsing.
+  An /Encrypt trailer entry in the first/last few KB is recognized without building a PdfReader at all.
 """
 
 from __future__ import annotations
 
+import os
+import re
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone, timedelta
 
-from pypdf import PdfReader
-from pypdf.errors import PdfReadError
 
 from core.interfaces import FileProcessor
 from core.models import FileArtifact
 from core.registry import register_processor
 
 # NEW: spelling/grammar helpers and config
-from utils.text_extract import extract_pdf_text, tokenize_words
+from utils.text_extract import extract_pdf_reader_text, extract_pdf_text, count_words
 from infra.config_loader import load_config
 
 
 class PdfProcessor(FileProcessor):
+    def __init__(self) -> None:
+        # Snapshot the text-extraction settings once instead of per file
+        cfg = load_config()
+        self._extract_text = bool(cfg.get("enable_spelling", True) or cfg.get("enable_grammar", False))
+        self._max_text_chars = int(cfg.get("max_text_chars", 5_000_000))
+
     def supports(self):
         return [".pdf"]
 
-    def build_artifact(self, path: Path) -> FileArtifact:
-        size = path.stat().st_size
+    def build_artifact(self, path: Path, stat_result: Optional[os.stat_result] = None) -> FileArtifact:
+        st = stat_result or path.stat()  # reuse the discovery stat when given
+        size = st.st_size
 
         metadata: Dict[str, Any] = {
             "kind": "pdf",
@@ -69,9 +79,15 @@ class PdfProcessor(FileProcessor):
         }
 
         # --- Core PDF parsing (annotations, pages, mod date) ---
+        reader = None
         try:
-            reader = PdfReader(str(path))
-            encrypted = bool(getattr(reader, "is_encrypted", False))
+            if _has_encrypt_marker(path, size):
+                # Nothing below can be read without the password; skip building the reader
+                encrypted = True
+            else:
+                PdfReader, IndirectObject = _pypdf()
+                reader = PdfReader(os.fspath(path))
+                encrypted = bool(getattr(reader, "is_encrypted", False))
             metadata["encrypted"] = encrypted
 
             if not encrypted:
@@ -82,15 +98,20 @@ class PdfProcessor(FileProcessor):
                     metadata["pages"] = None
 
                 # Annotations summary (all kinds)
-                annots: Dict[str, int] = {}
+                annots: Counter = Counter()
                 for page in reader.pages:
                     try:
                         raw_annots = page.get("/Annots", []) or []
+                        # The /Annots array itself may be an indirect reference
+                        if isinstance(raw_annots, IndirectObject):
+                            raw_annots = raw_annots.get_object() or []
                     except Exception:
                         raw_annots = []
+                    names = []
                     for ref in raw_annots:
                         try:
-                            obj = ref.get_object()
+                            # Inline annotation dicts need no xref lookup
+                            obj = ref.get_object() if isinstance(ref, IndirectObject) else ref
                             subtype = obj.get("/Subtype")
                             if subtype is None:
                                 continue
@@ -98,11 +119,12 @@ class PdfProcessor(FileProcessor):
                             name = str(subtype)
                             if name.startswith("/"):
                                 name = name[1:]
-                            annots[name] = annots.get(name, 0) + 1
+                            names.append(name)
                         except Exception:
                             # Ignore malformed annotations; continue
                             continue
-                metadata["annots_summary"] = annots
+                    annots.update(names)
+                metadata["annots_summary"] = dict(annots)
 
                 # Modified date from document info (if present)
                 try:
@@ -114,20 +136,25 @@ class PdfProcessor(FileProcessor):
                 except Exception:
                     metadata["mod_date"] = None
 
-        except (PdfReadError, OSError, ValueError, Exception) as exc:
+        except (OSError, ValueError, Exception) as exc:
             metadata["read_error"] = True
             metadata["read_error_detail"] = str(exc) or exc.__class__.__name__
 
         # --- NEW: Plain-text sample extraction (for spelling/grammar) ---
         # Keep this separate from core metadata parsing. If it fails, do not set read_error.
         try:
-            cfg = load_config()
-            if cfg.get("enable_spelling", True) or cfg.get("enable_grammar", False):
-                max_chars = int(cfg.get("max_text_chars", 5_000_000))
-                sample = extract_pdf_text(path, max_chars)
+            if self._extract_text:
+                max_chars = self._max_text_chars
+                # Reuse the reader parsed above; reopen only if that failed
+                if reader is not None:
+                    sample = extract_pdf_reader_text(reader, max_chars)
+                elif metadata["encrypted"]:
+                    raise ValueError("Encrypted PDF: cannot extract text")
+                else:
+                    sample = extract_pdf_text(path, max_chars)
                 metadata["text_sample"] = sample
                 metadata["text_length"] = len(sample)
-                metadata["token_count"] = len(tokenize_words(sample))
+                metadata["token_count"] = count_words(sample)
         except Exception as exc:
             metadata["text_sample"] = ""
             metadata["text_length"] = 0
@@ -140,11 +167,54 @@ class PdfProcessor(FileProcessor):
             extension=".pdf",
             size_bytes=size,
             metadata=metadata,
+            mtime_ns=st.st_mtime_ns,
         )
 
 
 # --- helpers ---
 
+@lru_cache(maxsize=1)
+def _pypdf():
+    """pypdf's (PdfReader, IndirectObject), imported on first use (registering this processor stays cheap)."""
+    from pypdf import PdfReader
+    from pypdf.generic import IndirectObject
+
+    return PdfReader, IndirectObject
+
+
+# A trailer (or xref stream dict) /Encrypt entry: an indirect reference or inline dict.
+# Linearized files repeat the trailer near the start, others keep it at the end.
+_ENCRYPT_ENTRY_RE = re.compile(rb"/Encrypt\s*(?:\d+\s+\d+\s+R|<<)")
+_ENCRYPT_HEAD_BYTES = 1024
+_ENCRYPT_TAIL_BYTES = 2048
+
+
+def _has_encrypt_marker(path: Path, size: int) -> bool:
+    """
+    Cheap pre-check for an encrypted PDF: look for an /Encrypt entry in the first
+    and last few KB. False when unsure; PdfReader then decides.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_ENCRYPT_HEAD_BYTES)
+            if _ENCRYPT_ENTRY_RE.search(head):
+                return True
+            if size > _ENCRYPT_HEAD_BYTES:
+                f.seek(max(size - _ENCRYPT_TAIL_BYTES, _ENCRYPT_HEAD_BYTES))
+                return _ENCRYPT_ENTRY_RE.search(f.read()) is not None
+    except OSError:
+        pass
+    return False
+
+
+# D:YYYYMMDDHHmmSSOHH'mm' -- every field after the year is optional (but only in
+# order), O is +, - or Z, and the apostrophes around the offset minutes may be missing.
+_PDF_DATE_RE = re.compile(
+    r"D?:?(\d{4})(?:(\d{2})(?:(\d{2})(?:(\d{2})(?:(\d{2})(?:(\d{2}))?)?)?)?)?"
+    r"(?:([+\-Z])(?:(\d{2})(?:'?(\d{2}))?)?)?'?"
+)
+
+
 def _pdf_date_to_iso(raw: Optional[str]) -> Optional[str]:
     """
     Parse PDF date strings like 'D:YYYYMMDDHHmmSS+HH'mm'' to ISO 8601.
@@ -152,58 +222,26 @@ def _pdf_date_to_iso(raw: Optional[str]) -> Optional[str]:
     """
     if not raw:
         return None
-    s = raw.strip()
-    if s.startswith("D:"):
-        s = s[2:]
-
-    # Minimal tolerant parse:
-    # YYYY MM DD HH mm SS O HH ' mm
-    # Lengths vary; we'll slice what we can find.
-    def take(n, default="00"):
-        nonlocal s
-        if len(s) >= n:
-            part, s = s[:n], s[n:]
-            return part
-        part, s = s, ""
-        return (part + default)[:n]
+    # Prefix match: trailing junk (odd digits, fractions, garbage) is ignored, as before
+    m = _PDF_DATE_RE.match(raw.strip())
+    if m is None:
+        return None
+    year, month, day, hour, minute, second, sign, off_h, off_m = m.groups()
 
     try:
-        year = int(take(4, "0000"))
-        month = int(take(2, "01"))
-        day = int(take(2, "01"))
-        hour = int(take(2, "00"))
-        minute = int(take(2, "00"))
-        second = int(take(2, "00"))
-
-        # Timezone offset if present: e.g., +05'30', -08'00'
+        # Timezone offset if present: e.g., +05'30', -08'00' ('Z' or none = UTC)
         tz = timezone.utc
-        if s:
-            sign = s[0]
-            if sign in "+-":
-                s = s[1:]
-                hh = 0
-                mm = 0
-                if "'" in s:
-                    # format HH'mm'
-                    try:
-                        hh_str, rest = s.split("'", 1)
-                        mm_str = rest.split("'")[0]
-                        hh = int(hh_str or "0")
-                        mm = int(mm_str or "0")
-                    except Exception:
-                        hh = mm = 0
-                else:
-                    # format HHmm (rare)
-                    hh = int((s[:2] or "0"))
-                    mm = int((s[2:4] or "0"))
-                delta = timedelta(hours=hh, minutes=mm)
-                if sign == "-":
-                    delta = -delta
-                tz = timezone(delta)
-
-        dt = datetime(year, month, day, hour, minute, second, tzinfo=tz)
+        if sign == "+" or sign == "-":
+            delta = timedelta(hours=int(off_h or 0), minutes=int(off_m or 0))
+            tz = timezone(-delta if sign == "-" else delta)
+
+        dt = datetime(
+            int(year), int(month or 1), int(day or 1),
+            int(hour or 0), int(minute or 0), int(second or 0),
+            tzinfo=tz,
+        )
         return dt.astimezone(timezone.utc).isoformat()
-    except Exception:
+    except (ValueError, OverflowError):
         return None
 
 
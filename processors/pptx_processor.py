@@ -24,37 +24,44 @@ Design (SOLID):
 - DIP: Checks depend on abstract text (string in metadata), not python-pptx.
 
 Implementation notes:
-- Use python-pptx for high-level properties (slides, shapes, notes, core props).
-- Count comments by streaming comment XML parts.
+- Use python-pptx for high-level properties (slides, shapes, core props).
+- Count comments by streaming comment XML parts; notes are detected from ZIP part names.
 - Use utils.text_extract.extract_pptx_text to build a single text sample
   (early-stopped at max_text_chars from config).
 """
 
 from __future__ import annotations
 
+import os
+import re
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, Optional
-from zipfile import ZipFile
-from xml.etree.ElementTree import iterparse
-
-from pptx import Presentation
-from pptx.exc import PackageNotFoundError as PptxPackageNotFoundError
+from typing import Any, Dict, Optional, Union
+from zipfile import ZipFile, ZipInfo
 
 from core.interfaces import FileProcessor
 from core.models import FileArtifact
 from core.registry import register_processor
 
 # NEW: text extraction helpers and config
-from utils.text_extract import extract_pptx_text, tokenize_words
+from utils.text_extract import extract_pptx_presentation_text, extract_pptx_text, count_words
 from infra.config_loader import load_config
 
 
 class PptxProcessor(FileProcessor):
+    def __init__(self) -> None:
+        # Snapshot the text-extraction settings once instead of per file
+        cfg = load_config()
+        self._extract_text = bool(cfg.get("enable_spelling", True) or cfg.get("enable_grammar", False))
+        self._max_text_chars = int(cfg.get("max_text_chars", 5_000_000))
+
     def supports(self):
         return [".pptx"]
 
-    def build_artifact(self, path: Path) -> FileArtifact:
-        size = path.stat().st_size
+    def build_artifact(self, path: Path, stat_result: Optional[os.stat_result] = None) -> FileArtifact:
+        st = stat_result or path.stat()  # reuse the discovery stat when given
+        size = st.st_size
         metadata: Dict[str, Any] = {
             "kind": "pptx",
             "slide_count": None,
@@ -73,26 +80,20 @@ class PptxProcessor(FileProcessor):
             # "text_extraction_error_detail": "...",  # set only on error
         }
 
+        # Read the package once: python-pptx and the comments scan both work from
+        # these bytes instead of each reopening the file.
+        try:
+            package: Optional[bytes] = path.read_bytes()
+        except OSError:
+            package = None  # each step reopens by path and reports its own error
+
         # 1) High-level facts via python-pptx (slides, shapes, core props)
+        prs = None
         try:
-            prs = Presentation(str(path))
+            prs = _pptx_presentation_class()(_package_source(path, package))
             slides = list(prs.slides)
             metadata["slide_count"] = len(slides)
             metadata["total_shapes"] = sum(len(s.shapes) for s in slides)
-            try:
-                # has_notes_slide is not always reliable across versions, so we guard
-                metadata["has_any_notes"] = any(
-                    getattr(s, "has_notes_slide", False) for s in slides
-                )
-            except Exception:
-                # Fallback: try creating notes_slide accessor
-                def _has_notes(slide):
-                    try:
-                        return slide.notes_slide is not None
-                    except Exception:
-                        return False
-
-                metadata["has_any_notes"] = any(_has_notes(s) for s in slides)
 
             core = prs.core_properties
             metadata["core_author"] = getattr(core, "author", None)
@@ -102,28 +103,40 @@ class PptxProcessor(FileProcessor):
             # Keep going; we can still count comments via ZIP scan and extract text separately.
             pass
 
-        # 2) Count comments via ZIP scan of /ppt/comments/comment*.xml (<p:cm>)
+        # 2) ZIP scan: count comments in /ppt/comments/comment*.xml (<p:cm>) and
+        #    detect notes from /ppt/notesSlides/notesSlide*.xml part names alone
         try:
-            with ZipFile(str(path)) as zf:
+            with ZipFile(_package_source(path, package)) as zf:
                 total = 0
-                for name in zf.namelist():
-                    if name.startswith("ppt/comments/comment") and name.endswith(".xml"):
-                        total += _count_tag_local(zf, name, "cm")
+                has_notes = False
+                # Helpers get the ZipInfo, so reading a part skips the name lookup
+                for info in zf.infolist():
+                    name = info.filename
+                    if not name.endswith(".xml"):
+                        continue
+                    if name.startswith("ppt/comments/comment"):
+                        total += _count_tag_local(zf, info, "cm")
+                    elif name.startswith("ppt/notesSlides/notesSlide"):
+                        has_notes = True
                 metadata["comments_count"] = total
-        except (PptxPackageNotFoundError, OSError, ValueError, KeyError, Exception) as exc:
+                metadata["has_any_notes"] = has_notes
+        except (OSError, ValueError, KeyError, Exception) as exc:
             metadata["read_error"] = True
             metadata["read_error_detail"] = str(exc) or exc.__class__.__name__
 
         # 3) NEW: Plain-text sample extraction (for spelling/grammar checks)
         # We attempt extraction even if earlier steps encountered issues, so text-only checks can still run.
         try:
-            cfg = load_config()
-            if cfg.get("enable_spelling", True) or cfg.get("enable_grammar", False):
-                max_chars = int(cfg.get("max_text_chars", 5_000_000))
-                sample = extract_pptx_text(path, max_chars)
+            if self._extract_text:
+                max_chars = self._max_text_chars
+                # Reuse the Presentation parsed in step 1; reopen only if that failed
+                if prs is not None:
+                    sample = extract_pptx_presentation_text(prs, max_chars)
+                else:
+                    sample = extract_pptx_text(path, max_chars)
                 metadata["text_sample"] = sample
                 metadata["text_length"] = len(sample)
-                metadata["token_count"] = len(tokenize_words(sample))
+                metadata["token_count"] = count_words(sample)
         except Exception as exc:
             metadata["text_sample"] = ""
             metadata["text_length"] = 0
@@ -136,11 +149,25 @@ class PptxProcessor(FileProcessor):
             extension=".pptx",
             size_bytes=size,
             metadata=metadata,
+            mtime_ns=st.st_mtime_ns,
         )
 
 
 # --- helpers ---
 
+@lru_cache(maxsize=1)
+def _pptx_presentation_class():
+    """python-pptx's Presentation, imported on first use (registering this processor stays cheap)."""
+    from pptx import Presentation
+
+    return Presentation
+
+
+def _package_source(path: Path, package: Optional[bytes]):
+    """A fresh in-memory file over the package bytes, or the path if reading failed."""
+    return BytesIO(package) if package is not None else os.fspath(path)
+
+
 def _safe_iso(dt) -> Optional[str]:
     try:
         return dt.isoformat() if dt is not None else None
@@ -148,21 +175,21 @@ def _safe_iso(dt) -> Optional[str]:
         return None
 
 
-def _count_tag_local(zf: ZipFile, member: str, local_name: str) -> int:
+def _count_tag_local(zf: ZipFile, member: Union[str, ZipInfo], local_name: str) -> int:
     """
     Count how many elements with the given local-name appear in an XML part.
     For PPTX comments we look for local-name 'cm' inside comment parts.
+
+    Only a count is needed, so this matches start tags in the raw bytes
+    (any namespace prefix) instead of building an element per XML node.
     """
-    count = 0
-    with zf.open(member) as fp:
-        for _event, elem in iterparse(fp, events=("end",)):
-            tag = elem.tag
-            if "}" in tag:
-                tag = tag.split("}", 1)[1]
-            if tag == local_name:
-                count += 1
-            elem.clear()
-    return count
+    return sum(1 for _ in _start_tag_re(local_name).finditer(zf.read(member)))
+
+
+@lru_cache(maxsize=None)
+def _start_tag_re(local_name: str) -> "re.Pattern[bytes]":
+    """Start tag '<local_name' or '<prefix:local_name' (not e.g. '<cmLst' for 'cm')."""
+    return re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?" + re.escape(local_name.encode()) + rb"(?=[\s/>])")
 
 
 # Register on import
@@ -62,22 +62,25 @@ New (Phase 3: for spelling now, grammar later)
 
 from __future__ import annotations
 
+import os
+import posixpath
+import re
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, Optional
-from zipfile import ZipFile, BadZipFile
-from xml.etree.ElementTree import iterparse
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple, Union
+from zipfile import ZipFile, ZipInfo, BadZipFile
+from xml.etree.ElementTree import fromstring
 
-# Third-party: used minimally, in read-only mode for core props & sheet states
-from openpyxl import load_workbook
-
-from services.xlsx_theme import resolve_theme_color, theme_rgb_map_from_path
+from services.xlsx_theme import resolve_theme_color, theme_rgb_map_from_zip
 
 from core.interfaces import FileProcessor
 from core.models import FileArtifact
 from core.registry import register_processor
 
 # NEW: spelling/grammar text extraction helpers and config
-from utils.text_extract import extract_xlsx_text, tokenize_words
+from utils.text_extract import extract_xlsx_text, extract_xlsx_workbook_text, count_words
+from utils.xml_utils import iter_elements, local_name
 from infra.config_loader import load_config
 
 
@@ -94,64 +97,71 @@ _ERROR_TOKENS = {
 }
 
 
+# Returns the workbook's theme index -> RGB map, parsing the theme part on first call
+ThemeMapLoader = Callable[[], Dict[int, str]]
+
+
 def _norm_rgb(rgb: str | None) -> str:
     """Normalize ARGB/RGB to last 6 hex chars; e.g. '00FFFF00' -> 'FFFF00'."""
     s = (rgb or "").upper()
     return s[-6:] if len(s) >= 6 else s
 
 
-def _color_obj_is_classic_yellow(color, theme_rgb_map: dict[int, str]) -> bool:
+def _color_attrs_are_classic_yellow(attrs: Mapping[str, str], theme_map: ThemeMapLoader) -> bool:
     """
-    Decide whether an openpyxl color object represents classic Excel yellow.
+    Decide whether a color element's attributes (<fgColor>, <bgColor>, <tabColor>)
+    represent classic Excel yellow.
 
     Classic yellow detection:
-    - Solid pattern with fg/bg rgb 'FFFF00'
+    - rgb 'FFFF00' (ARGB normalized)
     - indexed == 6
     - theme+tint resolves to 'FFFF00'
     """
-    if color is None:
-        return False
-
-    rgb_value = getattr(color, "rgb", None)
-    if isinstance(rgb_value, str) and _norm_rgb(rgb_value) == "FFFF00":
+    if _norm_rgb(attrs.get("rgb")) == "FFFF00":
         return True
 
-    idx = getattr(color, "indexed", None)
-    if idx is not None and str(idx) == "6":
+    idx = attrs.get("indexed")
+    if idx is not None and idx.strip() == "6":
         return True
 
-    theme_idx = getattr(color, "theme", None)
+    theme_idx = attrs.get("theme")
     if theme_idx is not None:
-        resolved = resolve_theme_color(theme_rgb_map, theme_idx, getattr(color, "tint", None))
+        resolved = resolve_theme_color(theme_map(), theme_idx, attrs.get("tint"))
         if resolved and _norm_rgb(resolved) == "FFFF00":
             return True
 
     return False
 
 
-def _is_classic_yellow_fill(fill, theme_rgb_map: dict[int, str]) -> bool:
-    """Return True if the cell fill is a 'solid' classic yellow (fg/bg)."""
-    try:
-        if getattr(fill, "patternType", None) != "solid":
-            return False
-        fg = getattr(fill, "fgColor", None)
-        bg = getattr(fill, "bgColor", None)
-        if _color_obj_is_classic_yellow(fg, theme_rgb_map):
-            return True
-        if _color_obj_is_classic_yellow(bg, theme_rgb_map):
-            return True
-        return False
-    except Exception:
-        return False
+def _is_classic_yellow_fill(fill, theme_map: ThemeMapLoader) -> bool:
+    """Return True if a styles.xml <fill> element is a 'solid' classic yellow pattern (fg/bg)."""
+    for pattern in fill:
+        if local_name(pattern.tag) != "patternFill" or pattern.attrib.get("patternType") != "solid":
+            continue
+        for color in pattern:
+            if local_name(color.tag) in ("fgColor", "bgColor") and _color_attrs_are_classic_yellow(
+                color.attrib, theme_map
+            ):
+                return True
+    return False
 
 
 class XlsxProcessor(FileProcessor):
+    def __init__(self) -> None:
+        # Snapshot the text-extraction settings once instead of per file
+        cfg = load_config()
+        self._extract_text = bool(cfg.get("enable_spelling", True) or cfg.get("enable_grammar", False))
+        self._max_text_chars = int(cfg.get("max_text_chars", 5_000_000))
+        # Presence-only audits stop the error counts at 1 (counts become "at least")
+        self._count_limit: Optional[int] = 1 if cfg.get("xlsx_presence_only", False) else None
+
     def supports(self):
         # LSP: mirrors other processors
         return [".xlsx"]
 
-    def build_artifact(self, path: Path) -> FileArtifact:
-        size = path.stat().st_size
+    def build_artifact(self, path: Path, stat_result: Optional[os.stat_result] = None) -> FileArtifact:
+        st = stat_result or path.stat()  # reuse the discovery stat when given
+        size = st.st_size
 
         # Default metadata. Populate defensively; keep the artifact useful even if some reads fail.
         metadata: Dict[str, Any] = {
@@ -166,6 +176,8 @@ class XlsxProcessor(FileProcessor):
             "error_cell_count": 0,
             "formula_ref_error_count": 0,
             "other_error_token_count": 0,
+            # True when formula/error counts stop at the first error hit (config xlsx_presence_only)
+            "counts_presence_only": self._count_limit is not None,
             "comments_count": 0,
             "threaded_comments_count": 0,
             "external_links_count": 0,
@@ -189,13 +201,15 @@ class XlsxProcessor(FileProcessor):
             # "text_extraction_error_detail": "...",
         }
 
-        theme_rgb_map = theme_rgb_map_from_path(path)
+        # Read the package once: the header sniff, openpyxl and the ZIP scans below all
+        # work from these bytes instead of each reopening the file.
+        package: Optional[bytes] = None
 
         # --- 1) Quick header sniff: distinguish OOXML ZIP vs OLE/encrypted container ---
         # Password-encrypted Excel typically uses OLE CF, not a plain ZIP. Plain XLSX starts with PK 0x03 0x04.
         try:
-            with path.open("rb") as fp:
-                magic = fp.read(8)
+            package = path.read_bytes()
+            magic = package[:8]
             if magic.startswith(b"\xD0\xCF\x11\xE0"):  # OLE Compound (encrypted or legacy)
                 metadata["password_encrypted_workbook"] = True
                 metadata["read_error"] = True
@@ -206,17 +220,30 @@ class XlsxProcessor(FileProcessor):
                     extension=".xlsx",
                     size_bytes=size,
                     metadata=metadata,
+                    mtime_ns=st.st_mtime_ns,
                 )
         except Exception as exc:
             # We can still try openpyxl/zip later; record a hint
             metadata["read_error"] = True
             metadata["read_error_detail"] = f"Header read failed: {exc.__class__.__name__}"
 
-        # --- 2) Use openpyxl for core props, sheet visibility, yellow detection ---
+        # One ZIP directory parse serves every part scan in step 3
         try:
-            # Use data_only=True to resolve cached values where possible.
-            # Note: We are NOT in read_only mode here because we need styles for fill/tab color inspection.
-            wb = load_workbook(filename=str(path), data_only=True)
+            zf: Optional[ZipFile] = ZipFile(_package_source(path, package))
+            zip_error: Optional[Exception] = None
+        except Exception as exc:
+            zf, zip_error = None, exc
+        infos = zf.infolist() if zf is not None else []
+
+        # --- 2) Use openpyxl (read-only) for core props and sheet visibility ---
+        wb = None
+        try:
+            # read_only streams worksheets on demand instead of building every cell up
+            # front; styles (yellow fills/tabs) are read from the XML in step 3 instead.
+            # data_only=True resolves cached values for the text sample in step 4.
+            wb = _openpyxl_load_workbook()(
+                filename=_package_source(path, package), read_only=True, data_only=True, keep_links=False
+            )
 
             # Core document properties (author/created/modified)
             props = getattr(wb, "properties", None)
@@ -245,36 +272,6 @@ class XlsxProcessor(FileProcessor):
             metadata["hidden_sheet_count"] = hidden
             metadata["very_hidden_sheet_count"] = very_hidden
 
-            # ---- Yellow sheet tabs (classic yellow) ----
-            yellow_tabs = []
-            for name in sheetnames:
-                try:
-                    ws = wb[name]
-                    tab = getattr(getattr(ws, "sheet_properties", None), "tabColor", None)
-                    if tab is not None and _color_obj_is_classic_yellow(tab, theme_rgb_map):
-                        yellow_tabs.append(name)
-                except Exception:
-                    continue
-            metadata["yellow_tab_sheets"] = yellow_tabs
-            metadata["yellow_tab_sheet_count"] = len(yellow_tabs)
-
-            # ---- Yellow cells (classic yellow) ----
-            yellow_cells = 0
-            try:
-                for ws in wb.worksheets:
-                    for row in ws.iter_rows():
-                        for cell in row:
-                            fill = getattr(cell, "fill", None)
-                            if fill and _is_classic_yellow_fill(fill, theme_rgb_map):
-                                yellow_cells += 1
-            except Exception as exc:
-                # Continue with partial counts; record a warning detail
-                metadata["read_error"] = True
-                prev = metadata.get("read_error_detail")
-                msg = f"yellow-cells-scan: {exc.__class__.__name__}"
-                metadata["read_error_detail"] = msg if not prev else f"{prev}; {msg}"
-            metadata["yellow_cell_count"] = yellow_cells
-
         except Exception as exc:
             # Not fatal: XML streaming (below) can still produce most counts
             metadata.setdefault("sheet_count", None)
@@ -285,49 +282,106 @@ class XlsxProcessor(FileProcessor):
 
         # --- 3) ZIP + streaming XML: formulas/errors/comments/external-links/connections/protection/VBA ---
         try:
-            with ZipFile(str(path)) as zf:
-                names = set(zf.namelist())
-
-                # VBA presence: unexpected in .xlsx (should be .xlsm)
-                if "xl/vbaProject.bin" in names:
-                    metadata["has_vba_project"] = True
-
-                # Workbook protection via <workbookProtection>
-                if "xl/workbook.xml" in names:
-                    metadata["workbook_structure_protected"] = _workbook_structure_is_protected(zf, "xl/workbook.xml")
-
-                # External links via workbook relationships
-                if "xl/_rels/workbook.xml.rels" in names:
-                    ext_count = _count_external_relationships(zf, "xl/_rels/workbook.xml.rels")
-                    metadata["external_links_count"] += ext_count
+            if zf is None:
+                raise zip_error or BadZipFile("not a ZIP package")
+            limit = self._count_limit
+            with zf:
+                # Sheet parts (worksheets, chartsheets, ...) resolved through workbook.xml.rels,
+                # in workbook order; part names are not guaranteed to be sheetN.xml
+                try:
+                    names_by_part = _worksheet_names_by_part(zf)
+                except Exception:
+                    names_by_part = {}  # unreadable workbook part: fall back to the usual names
 
-                # externalLinks parts also indicate external references
-                for n in names:
-                    if n.startswith("xl/externalLinks/") and n.endswith(".xml"):
+                # Yellow detection works on the raw XML: which cell styles (cellXfs index,
+                # the <c s="..."> attribute) have a classic-yellow fill, and which sheets
+                # have a yellow <tabColor>. The theme part is parsed only if a color uses it.
+                theme_map = _theme_map_loader(zf)
+                try:
+                    yellow_styles = _yellow_cell_style_ids(zf, theme_map)
+                except Exception as exc:
+                    # A broken styles part costs only the yellow-cell count, not the other scans
+                    yellow_styles = frozenset()
+                    metadata["read_error"] = True
+                    prev = metadata.get("read_error_detail")
+                    msg = f"yellow-cells-scan: {exc.__class__.__name__}"
+                    metadata["read_error_detail"] = msg if not prev else f"{prev}; {msg}"
+                yellow_tab_parts = []
+                yellow_cells = 0
+
+                # One pass over the directory; helpers get the ZipInfo, so no name lookups
+                for info in infos:
+                    n = info.filename
+
+                    # VBA presence: unexpected in .xlsx (should be .xlsm)
+                    if n == "xl/vbaProject.bin":
+                        metadata["has_vba_project"] = True
+                        continue
+                    if not n.endswith((".xml", ".rels")):
+                        continue
+
+                    is_sheet_part = (
+                        n in names_by_part
+                        if names_by_part
+                        else n.startswith("xl/worksheets/sheet") and n.endswith(".xml")
+                    )
+                    if is_sheet_part:
+                        # Decompress each sheet part once; both scans below run over these bytes
+                        data = zf.read(info)
+
+                        # Formulas and error cells/tokens (skipped once a presence-only
+                        # run has seen any error: the check's verdict cannot change)
+                        if not _any_reached(
+                            limit,
+                            metadata["error_cell_count"],
+                            metadata["formula_ref_error_count"],
+                            metadata["other_error_token_count"],
+                        ):
+                            f_count, e_count, ref_err, other_errs = _scan_worksheet_for_formulas_and_errors(data, limit)
+                            metadata["formula_count"] += f_count
+                            metadata["error_cell_count"] += e_count
+                            metadata["formula_ref_error_count"] += ref_err
+                            metadata["other_error_token_count"] += other_errs
+                        try:
+                            cells, tab_is_yellow = _scan_worksheet_for_yellow(data, yellow_styles, theme_map)
+                            yellow_cells += cells
+                            if tab_is_yellow:
+                                yellow_tab_parts.append(n)
+                        except Exception as exc:
+                            # Continue with partial counts; record a warning detail
+                            metadata["read_error"] = True
+                            prev = metadata.get("read_error_detail")
+                            msg = f"yellow-cells-scan: {exc.__class__.__name__}"
+                            metadata["read_error_detail"] = msg if not prev else f"{prev}; {msg}"
+                    elif n == "xl/workbook.xml":
+                        # Workbook protection via <workbookProtection>
+                        metadata["workbook_structure_protected"] = _workbook_structure_is_protected(zf, info)
+                    elif n == "xl/_rels/workbook.xml.rels":
+                        # External links via workbook relationships
+                        metadata["external_links_count"] += _count_external_relationships(zf, info)
+                    elif n.startswith("xl/externalLinks/") and n.endswith(".xml"):
+                        # externalLinks parts also indicate external references
                         metadata["external_links_count"] += 1
-
-                # Data connections
-                if "xl/connections.xml" in names:
-                    metadata["data_connections_count"] = _count_tag_local(zf, "xl/connections.xml", "connection")
-
-                # Comments (legacy)
-                for n in names:
-                    if n.startswith("xl/comments") and n.endswith(".xml"):
-                        metadata["comments_count"] += _count_tag_local(zf, n, "comment")
-
-                # Threaded comments (modern)
-                for n in names:
-                    if n.startswith("xl/threadedComments/") and n.endswith(".xml"):
-                        metadata["threaded_comments_count"] += _count_tag_local(zf, n, "threadedComment")
-
-                # Worksheet scans for formulas and error cells/tokens
-                for n in names:
-                    if n.startswith("xl/worksheets/sheet") and n.endswith(".xml"):
-                        f_count, e_count, ref_err, other_errs = _scan_worksheet_for_formulas_and_errors(zf, n)
-                        metadata["formula_count"] += f_count
-                        metadata["error_cell_count"] += e_count
-                        metadata["formula_ref_error_count"] += ref_err
-                        metadata["other_error_token_count"] += other_errs
+                    elif n == "xl/connections.xml":
+                        # Data connections
+                        metadata["data_connections_count"] = _count_tag_local(zf, info, "connection")
+                    elif n.startswith("xl/comments") and n.endswith(".xml"):
+                        # Comments (legacy)
+                        metadata["comments_count"] += _count_tag_local(zf, info, "comment")
+                    elif n.startswith("xl/threadedComments/") and n.endswith(".xml"):
+                        # Threaded comments (modern)
+                        metadata["threaded_comments_count"] += _count_tag_local(zf, info, "threadedComment")
+
+                metadata["yellow_cell_count"] = yellow_cells
+                if yellow_tab_parts:
+                    # Report sheet names in workbook order, as openpyxl lists them
+                    order = {part: i for i, part in enumerate(names_by_part)}
+                    yellow_tab_parts.sort(key=lambda part: order.get(part, len(order)))
+                    metadata["yellow_tab_sheets"] = [
+                        names_by_part.get(part) or posixpath.splitext(posixpath.basename(part))[0]
+                        for part in yellow_tab_parts
+                    ]
+                    metadata["yellow_tab_sheet_count"] = len(yellow_tab_parts)
 
         except (BadZipFile, OSError, ValueError, KeyError, Exception) as exc:
             metadata["read_error"] = True
@@ -338,25 +392,31 @@ class XlsxProcessor(FileProcessor):
         # --- 4) NEW: Plain-text sample extraction for spelling/grammar checks ---
         # We keep this separate from the structural scans above and do not flip read_error on extraction failure.
         try:
-            cfg = load_config()
-            if cfg.get("enable_spelling", True) or cfg.get("enable_grammar", False):
-                max_chars = int(cfg.get("max_text_chars", 5_000_000))
+            if self._extract_text:
+                max_chars = self._max_text_chars
                 # Your policy: include text from hidden sheets; skip formula texts entirely.
-                sample = extract_xlsx_text(
-                    path,
-                    max_chars=max_chars,
-                    include_hidden=True,
-                    skip_formulas=True,
-                )
+                # Reuse the read-only workbook opened in step 2; reopen only if that failed
+                if wb is not None:
+                    sample = extract_xlsx_workbook_text(wb, max_chars, include_hidden=True, skip_formulas=True)
+                else:
+                    sample = extract_xlsx_text(
+                        path,
+                        max_chars=max_chars,
+                        include_hidden=True,
+                        skip_formulas=True,
+                    )
                 metadata["text_sample"] = sample
                 metadata["text_length"] = len(sample)
-                metadata["token_count"] = len(tokenize_words(sample))
+                metadata["token_count"] = count_words(sample)
         except Exception as exc:
             metadata["text_sample"] = ""
             metadata["text_length"] = 0
             metadata["token_count"] = 0
             metadata["text_extraction_error"] = True
             metadata["text_extraction_error_detail"] = str(exc) or exc.__class__.__name__
+        finally:
+            if wb is not None:
+                wb.close()  # read-only workbooks keep the archive open until closed
 
         # Return the immutable artifact the rest of the system expects
         return FileArtifact(
@@ -364,12 +424,33 @@ class XlsxProcessor(FileProcessor):
             extension=".xlsx",
             size_bytes=size,
             metadata=metadata,
+            mtime_ns=st.st_mtime_ns,
         )
 
 
 # --- helpers (module-internal) -------------------------------------------------
 
 
+@lru_cache(maxsize=1)
+def _openpyxl_load_workbook():
+    """openpyxl's load_workbook, imported on first use (registering this processor stays cheap).
+
+    Third-party: used minimally, for core props, sheet states and the text sample.
+    """
+    from openpyxl import load_workbook
+
+    return load_workbook
+
+
+def _package_source(path: Path, package: Optional[bytes]):
+    """A fresh in-memory file over the package bytes, or the path if reading failed."""
+    if package is None:
+        return os.fspath(path)
+    source = BytesIO(package)
+    source.name = os.fspath(path)  # ZipFile.filename, so openpyxl errors still name the file
+    return source
+
+
 def _safe_iso(dt) -> Optional[str]:
     """Convert a datetime-like object to ISO 8601 if available, else None."""
     try:
@@ -378,46 +459,35 @@ def _safe_iso(dt) -> Optional[str]:
         return None
 
 
-def _local_name(tag: str) -> str:
-    """Strip the XML namespace from a tag: '{namespace}name' -> 'name'."""
-    if "}" in tag:
-        return tag.split("}", 1)[1]
-    return tag
-
-
-def _count_tag_local(zf: ZipFile, member: str, local_name: str) -> int:
+def _count_tag_local(zf: ZipFile, member: Union[str, ZipInfo], tag_name: str) -> int:
     """
     Count how many elements with the given local-name appear in an XML part.
 
-    We stream with iterparse(events=("end",)) and clear elements to keep memory
-    usage low for large sheets.
+    We stream the part and free elements as we go to keep memory usage low for
+    large sheets.
     """
-    count = 0
     with zf.open(member) as fp:
-        for _event, elem in iterparse(fp, events=("end",)):
-            if _local_name(elem.tag) == local_name:
-                count += 1
-            elem.clear()
-    return count
+        return sum(1 for _ in iter_elements(fp, frozenset((tag_name,))))
 
 
-def _workbook_structure_is_protected(zf: ZipFile, member: str) -> bool:
+def _workbook_structure_is_protected(zf: ZipFile, member: Union[str, ZipInfo]) -> bool:
     """
     Detect structure/windows protection in xl/workbook.xml via <workbookProtection>.
     We treat presence of the element (with typical attributes) as 'protected'.
     """
     protected = False
     with zf.open(member) as fp:
-        for _event, elem in iterparse(fp, events=("end",)):
-            if _local_name(elem.tag) == "workbookProtection":
-                if elem.attrib:
-                    protected = True
-                elem.clear()
-            else:
-                elem.clear()
+        for elem in iter_elements(fp, _WORKBOOK_PROTECTION_TAGS):
+            if elem.attrib:
+                protected = True
     return protected
 
 
+_WORKBOOK_PROTECTION_TAGS = frozenset(("workbookProtection",))
+_RELATIONSHIP_TAGS = frozenset(("Relationship",))
+_SHEET_TAGS = frozenset(("sheet",))
+
+
 def _looks_external_target(target: str) -> bool:
     """Heuristic to decide if a relationship target is external (URL or UNC path)."""
     t = (target or "").strip().lower()
@@ -429,7 +499,7 @@ def _looks_external_target(target: str) -> bool:
     )
 
 
-def _count_external_relationships(zf: ZipFile, member: str) -> int:
+def _count_external_relationships(zf: ZipFile, member: Union[str, ZipInfo]) -> int:
     """
     Count relationships in xl/_rels/workbook.xml.rels that are 'external':
     - TargetMode="External", or
@@ -437,19 +507,157 @@ def _count_external_relationships(zf: ZipFile, member: str) -> int:
     """
     count = 0
     with zf.open(member) as fp:
-        for _event, elem in iterparse(fp, events=("end",)):
-            if _local_name(elem.tag) == "Relationship":
-                mode = elem.attrib.get("TargetMode", "")
-                target = elem.attrib.get("Target", "")
-                if mode == "External" or _looks_external_target(target):
-                    count += 1
-            elem.clear()
+        for elem in iter_elements(fp, _RELATIONSHIP_TAGS):
+            mode = elem.attrib.get("TargetMode", "")
+            target = elem.attrib.get("Target", "")
+            if mode == "External" or _looks_external_target(target):
+                count += 1
     return count
 
 
-def _scan_worksheet_for_formulas_and_errors(zf: ZipFile, member: str) -> tuple[int, int, int, int]:
+_STYLES_PART = "xl/styles.xml"
+
+
+def _theme_map_loader(zf: ZipFile) -> ThemeMapLoader:
+    """
+    Lazy theme map for one package. Most fills and tab colors are explicit rgb or
+    indexed, so the theme part is parsed only when a color actually has theme="...".
+    """
+
+    @lru_cache(maxsize=1)
+    def load() -> Dict[int, str]:
+        try:
+            return theme_rgb_map_from_zip(zf, zf.namelist())
+        except Exception:
+            return {}
+
+    return load
+
+
+def _yellow_cell_style_ids(zf: ZipFile, theme_map: ThemeMapLoader) -> FrozenSet[int]:
+    """
+    Indexes into <cellXfs> (the style a cell's s="..." attribute selects) whose
+    fill is classic yellow. Empty when the workbook has no styles part.
+    """
+    try:
+        root = fromstring(zf.read(_STYLES_PART))
+    except KeyError:
+        return frozenset()
+
+    fills = []
+    xfs = []
+    for section in root:
+        lname = local_name(section.tag)
+        if lname == "fills":
+            fills = [child for child in section if local_name(child.tag) == "fill"]
+        elif lname == "cellXfs":
+            xfs = [child for child in section if local_name(child.tag) == "xf"]
+
+    yellow_fills = {i for i, fill in enumerate(fills) if _is_classic_yellow_fill(fill, theme_map)}
+    if not yellow_fills:
+        return frozenset()
+
+    yellow_styles = set()
+    for i, xf in enumerate(xfs):
+        try:
+            if int(xf.attrib.get("fillId", 0)) in yellow_fills:
+                yellow_styles.add(i)
+        except ValueError:
+            continue
+    return frozenset(yellow_styles)
+
+
+def _scan_worksheet_for_yellow(
+    data: bytes,
+    yellow_styles: FrozenSet[int],
+    theme_map: ThemeMapLoader,
+) -> Tuple[int, bool]:
     """
-    Stream a worksheet XML (xl/worksheets/sheet*.xml) and return:
+    Return (yellow_cell_count, tab_is_yellow) for a worksheet part's XML bytes.
+
+    A cell is yellow when its style index (s="...", default 0) is in yellow_styles.
+    Cells are counted by regex matches over the raw bytes, so there is no Python
+    work per cell; only the sheet's one <tabColor> has its attributes decoded.
+    """
+    yellow_cells = 0
+    if yellow_styles:
+        yellow_cells = len(_styled_cell_re(yellow_styles).findall(data))
+        if 0 in yellow_styles:
+            # Cells without an s attribute use style 0
+            yellow_cells += len(_CELL_TAG_RE.findall(data)) - len(_STYLED_CELL_RE.findall(data))
+
+    m = _TAB_COLOR_RE.search(data)
+    tab_is_yellow = m is not None and _color_attrs_are_classic_yellow(
+        {k.decode(): v.decode() for k, v in _ATTR_RE.findall(m.group(1))}, theme_map
+    )
+    return yellow_cells, tab_is_yellow
+
+
+# <c> start tags: all, those with an s="..." style attribute, and (per style set)
+# those whose style is in the set. Any namespace prefix, either quote style.
+_CELL_TAG_RE = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?c(?=[\s/>])")
+_STYLED_CELL_RE = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?c(?=\s)[^>]*?\ss\s*=")
+_TAB_COLOR_RE = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?tabColor(?=[\s/>])([^>]*)>")
+_ATTR_RE = re.compile(rb"""([\w:.-]+)\s*=\s*["']([^"']*)["']""")
+
+
+@lru_cache(maxsize=64)
+def _styled_cell_re(style_ids: FrozenSet[int]) -> "re.Pattern[bytes]":
+    """<c> start tags whose s="..." is one of style_ids."""
+    alternatives = b"|".join(str(i).encode() for i in sorted(style_ids))
+    return re.compile(
+        rb"<(?:[A-Za-z_][\w.-]*:)?c(?=\s)[^>]*?\ss\s*=\s*[\"'](?:" + alternatives + rb")[\"']"
+    )
+
+
+def _worksheet_names_by_part(zf: ZipFile) -> Dict[str, str]:
+    """
+    Map sheet part paths (worksheets and chartsheets) to sheet names, in workbook order:
+        "xl/worksheets/sheet1.xml" -> "Sheet1", "xl/chartsheets/sheet1.xml" -> "Chart1"
+    via <sheet name r:id> in xl/workbook.xml and its relationships' targets.
+    Empty when either part is missing.
+    """
+    if "xl/workbook.xml" not in zf.NameToInfo or "xl/_rels/workbook.xml.rels" not in zf.NameToInfo:
+        return {}
+
+    targets: Dict[str, str] = {}
+    with zf.open("xl/_rels/workbook.xml.rels") as fp:
+        for elem in iter_elements(fp, _RELATIONSHIP_TAGS):
+            rid = elem.attrib.get("Id")
+            target = elem.attrib.get("Target")
+            if rid and target:
+                # Targets are relative to xl/ unless absolute within the package
+                part = target[1:] if target.startswith("/") else posixpath.join("xl", target)
+                targets[rid] = posixpath.normpath(part)
+
+    names: Dict[str, str] = {}
+    with zf.open("xl/workbook.xml") as fp:
+        for elem in iter_elements(fp, _SHEET_TAGS):
+            # r:id, whichever relationships namespace (Transitional or Strict) binds 'r'
+            rid = next((v for k, v in elem.attrib.items() if k.endswith("}id")), None)
+            name = elem.attrib.get("name")
+            if rid in targets and name:
+                names[targets[rid]] = name
+    return names
+
+
+def _any_reached(limit: Optional[int], *counts: int) -> bool:
+    """True if there is a count limit and any count has reached it."""
+    return limit is not None and max(counts) >= limit
+
+
+# One pass over a worksheet's bytes: each <f>, <c> or <v> start tag (any namespace
+# prefix) with its attributes and, for non-empty elements, the text up to the next
+# tag. Worksheet <f>/<v> hold text only, so '[^<]*' is the whole element text.
+_WORKSHEET_TAG_RE = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?(f|c|v)(?=[\s/>])([^>]*)>([^<]*)")
+# t="e" (error-typed cell) among a <c> tag's attributes
+_ERROR_CELL_TYPE_RE = re.compile(rb"""(?:^|\s)t\s*=\s*["']\s*[eE]\s*["']""")
+_ERROR_TOKEN_BYTES = frozenset(tok.encode() for tok in _ERROR_TOKENS)
+
+
+def _scan_worksheet_for_formulas_and_errors(data: bytes, limit: Optional[int] = None) -> tuple[int, int, int, int]:
+    """
+    Scan a worksheet's XML bytes (xl/worksheets/sheet*.xml) and return:
       (formula_count, error_cell_count, formula_ref_error_count, other_error_token_count)
 
     We look for:
@@ -457,39 +665,41 @@ def _scan_worksheet_for_formulas_and_errors(zf: ZipFile, member: str) -> tuple[i
       - <c t="e">...</c> -> error-typed cells (error_cell_count)
       - '#REF!' inside formula text -> formula_ref_error_count
       - Other error tokens in formula text or cell value -> other_error_token_count
+
+    Only tag names, one attribute and element text matter, so this is a regex pass
+    over the raw bytes rather than an XML parse that builds an element per cell.
+    Error tokens contain no XML-escaped characters, so matching the escaped text is exact.
+
+    With a limit, the scan stops as soon as any error count reaches it; every count
+    is then a lower bound.
     """
     formula_count = 0
     error_cells = 0
     ref_err = 0
     other_errs = 0
-
-    with zf.open(member) as fp:
-        for _event, elem in iterparse(fp, events=("end",)):
-            lname = _local_name(elem.tag)
-
-            if lname == "f":
+    tokens = _ERROR_TOKEN_BYTES
+
+    for m in _WORKSHEET_TAG_RE.finditer(data):
+        lname, attrs, text = m.groups()
+
+        if lname == b"c":
+            if _ERROR_CELL_TYPE_RE.search(attrs):
+                error_cells += 1
+        else:
+            if attrs.endswith(b"/"):
+                text = b""  # self-closing (e.g. shared-formula <f t="shared" si="0"/>)
+            if lname == b"f":
                 formula_count += 1
-                text = (elem.text or "").strip()
-                if "#REF!" in text:
-                    ref_err += 1
-                if any(tok in text for tok in _ERROR_TOKENS):
-                    other_errs += 1
-                elem.clear()
-
-            elif lname == "c":
-                cell_type = (elem.attrib.get("t") or "").strip().lower()
-                if cell_type == "e":
-                    error_cells += 1
-                elem.clear()
-
-            elif lname == "v":
-                text = (elem.text or "").strip()
-                if any(tok == text for tok in _ERROR_TOKENS):
-                    other_errs += 1
-                elem.clear()
-
-            else:
-                elem.clear()
+                if b"#" in text:  # every error token starts with '#'
+                    if b"#REF!" in text:
+                        ref_err += 1
+                    if any(tok in text for tok in tokens):
+                        other_errs += 1
+            elif text.strip() in tokens:  # b"v"
+                other_errs += 1
+
+        if limit is not None and _any_reached(limit, error_cells, ref_err, other_errs):
+            break
 
     return formula_count, error_cells, ref_err, other_errs
 
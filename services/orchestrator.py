@@ -12,14 +12,18 @@ It does NOT import concrete processors or checks directly (DIP).
 """
 
 from __future__ import annotations
+import importlib
+import multiprocessing
+import os
 import uuid
 from collections import defaultdict
+from itertools import chain, islice
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple
 from pathlib import Path
-from typing import Callable, Iterable, Optional, Dict
-from core.registry import processors, checks
-from utils.path_utils import iter_target_files
+from typing import Callable, Iterable, Iterator, Optional, Dict
+from core.registry import processors, processor_for, check_classes, checks_for
+from utils.path_utils import iter_target_entries
 from core.models import (
     AggregateReport,
     CheckResult,
@@ -32,9 +36,16 @@ from core.models import (
 )
 
 # A tiny type alias for a UI-friendly progress callback:
-# on_progress(current_index, total_files, current_path)
+# on_progress(current_index, total_files, current_path); total_files is 0 while unknown
 ProgressFn = Callable[[int, int, Path], None]
 
+# Below this many files the cost of spawning workers (each re-imports the parsing
+# libraries) outweighs the parallel speedup, so we stay in-process.
+_MIN_FILES_FOR_POOL = 8
+
+# Files handed to a worker per IPC round-trip (amortizes pickling overhead).
+_POOL_CHUNKSIZE = 32
+
 
 class Orchestrator:
     """
@@ -44,12 +55,33 @@ class Orchestrator:
     Usage:
         orchestrator = Orchestrator(on_progress=my_progress_fn)
         report = orchestrator.run_scan("C:/docs")
+
+    Parallelism:
+        Parsing a document is CPU-bound and independent per file, so with
+        workers > 1 files are processed in a multiprocessing pool ("spawn"
+        context; Streamlit is not fork-safe). Workers re-import the plugin
+        modules that are registered here, then call `worker_init` (must be
+        picklable, e.g. functools.partial(set_modified_cutoff, dt)) so any
+        run-time settings the checks read are applied in the worker too.
     """
 
-    def __init__(self, on_progress: Optional[ProgressFn] = None) -> None:
+    def __init__(
+        self,
+        on_progress: Optional[ProgressFn] = None,
+        workers: int = 1,
+        worker_init: Optional[Callable[[], None]] = None,
+    ) -> None:
         self._on_progress = on_progress
-
-    def run_scan(self, folder: str | Path, exts: Optional[List[str]] = None) -> AggregateReport:
+        self._workers = max(1, int(workers or 1))
+        self._worker_init = worker_init
+
+    def run_scan(
+        self,
+        folder: str | Path,
+        exts: Optional[List[str]] = None,
+        total_hint: Optional[int] = None,
+        ignore_dirs: Optional[List[str]] = None,
+    ) -> AggregateReport:
         
         """
         Walk the folder, route files to processors, run checks, and return an AggregateReport.
@@ -62,52 +94,51 @@ class Orchestrator:
             Extension filter (dot-prefixed, case-insensitive). When provided, only files
             with these extensions are discovered and scanned. If None or empty, all
             supported files are considered.
+        total_hint : int | None, optional
+            Expected number of files. With workers, discovery is always streamed straight
+            into the pool (once the walk has found enough files to be worth one), so the
+            exact total is unknown while scanning; the hint is then reported as the
+            progress total. Only used for progress and chunk sizing; the walk itself
+            decides what is scanned.
+        ignore_dirs : list[str] | None, optional
+            Folder names to skip (config "ignore_dirs"); hidden folders are always skipped.
+            If None, utils.path_utils' defaults apply.
 
         - Converts unexpected processor/check exceptions into ERROR CheckResult entries.
         - Skips files with no matching processor (shouldn't happen if discovery filters are set).
         """
         root = Path(folder)
-        file_list = list(iter_target_files(root, exts=exts))
-        total = len(file_list)
-
-        proc_index = self._index_processors()
+        # (path, stat) pairs: the discovery stat is handed to processors so they don't stat again
         report = AggregateReport()
+        entries = _record_sizes(iter_target_entries(root, exts=exts, ignore_dirs=ignore_dirs), report.file_sizes)
+
+        if self._workers > 1:
+            # Peek at the walk: a tree smaller than the pool threshold is scanned in-process
+            file_list = list(islice(entries, _MIN_FILES_FOR_POOL))
+            if len(file_list) >= _MIN_FILES_FOR_POOL:
+                # Pipeline: the pool pulls the rest from the walk as it goes
+                # (disk I/O overlaps parsing); the total is unknown until the walk ends
+                self._run_pooled(chain(file_list, entries), total_hint, report)
+                return report
+        else:
+            file_list = list(entries)
+        total = len(file_list)
 
-        for i, fpath in enumerate(file_list, start=1):
+        for i, (fpath, st) in enumerate(file_list, start=1):
             # Inform the UI about progress if a callback was provided
             if self._on_progress:
                 self._on_progress(i, total, fpath)
-
-            ext = fpath.suffix.lower()
-            processor = proc_index.get(ext)
-
-            if processor is None:
-                # Defensive: discovery normally filters to known extensions.
-                report.results.append(
-                    CheckResult(
-                        file=fpath,
-                        check_name="No processor found",
-                        severity=Severity.WARNING,
-                        passed=False,
-                        message=f"No processor registered for extension: {ext}",
-                        extra={"extension": ext},
-                    )
-                )
-                continue
-
-            artifact = self._safe_build_artifact(processor, fpath, report)
-            if artifact is None:
-                # Error already recorded as a CheckResult
-                continue
-
-            # Run only checks that claim to apply to this extension
-            for chk in checks():
-                if self._check_applies(chk.applies_to(), ext):
-                    self._safe_run_check(chk, artifact, report)
+            report.results.extend(_scan_file(fpath, st))
 
         return report
 
-    def run_scan_v2(self, folder: str | Path, config_snapshot: Dict = None, exts: Optional[List[str]] = None) -> ScanReport:
+    def run_scan_v2(
+        self,
+        folder: str | Path,
+        config_snapshot: Dict = None,
+        exts: Optional[List[str]] = None,
+        total_hint: Optional[int] = None,
+    ) -> ScanReport:
         """
         File-centric scan that returns a ScanReport (header + files with verdicts).
 
@@ -116,17 +147,21 @@ class Orchestrator:
         folder : str | Path
             Root folder to scan.
         config_snapshot : dict | None
-            Runtime configuration snapshot.
+            Runtime configuration snapshot; its "ignore_dirs" prune the walk.
         exts : list[str] | None, optional
             Extension filter (dot-prefixed, case-insensitive). When provided, only files
             with these extensions are discovered and scanned. If None or empty, all
             supported files are considered.
+        total_hint : int | None, optional
+            Expected number of files; see run_scan.
         """
         start = datetime.now(timezone.utc)
         config_snapshot = dict(config_snapshot or {})
 
         # Reuse your v1 logic to get flat results
-        flat = self.run_scan(folder, exts=exts)  # AggregateReport
+        flat = self.run_scan(
+            folder, exts=exts, total_hint=total_hint, ignore_dirs=config_snapshot.get("ignore_dirs")
+        )  # AggregateReport
 
         # Group by file
         by_file: Dict[Path, List[CheckResult]] = defaultdict(list)
@@ -151,11 +186,13 @@ class Orchestrator:
             else:
                 verdict = FileVerdict.PASS_
 
-            # Try to get size quickly (filesystem) and extension
-            try:
-                size = file_path.stat().st_size
-            except OSError:
-                size = 0
+            # Size from the discovery stat; stat again only if that one failed
+            size = flat.file_sizes.get(file_path)
+            if size is None:
+                try:
+                    size = file_path.stat().st_size
+                except OSError:
+                    size = 0
             ext = file_path.suffix.lower()
 
             files_out.append(
@@ -193,60 +230,136 @@ class Orchestrator:
     
     # ---------- helpers ----------
 
-    def _index_processors(self) -> Dict[str, object]:
-        """
-        Build a mapping of extension -> processor instance for O(1) routing.
-        If multiple processors claim the same extension, the last one wins.
-        """
-        index: Dict[str, object] = {}
-        for p in processors():
-            for ext in p.supports():
-                index[ext.lower()] = p
-        return index
-
-    def _check_applies(self, targets: Iterable[str], ext: str) -> bool:
-        """
-        Return True if a check targets this extension.
-        '*' means "applies to all".
+    def _run_pooled(
+        self,
+        file_list: Iterable[Tuple[Path, Optional[os.stat_result]]],
+        total: Optional[int],
+        report: AggregateReport,
+    ) -> None:
         """
-        lowered = [t.lower() for t in targets]
-        return "*" in lowered or ext in lowered
+        Scan files in a process pool; results stream back per file (unordered)
+        and progress is reported as each file completes.
 
-    def _safe_build_artifact(
-        self, processor, fpath: Path, report: AggregateReport
-    ) -> Optional[FileArtifact]:
+        `file_list` may be a lazy iterator: the pool's task feeder consumes it in a
+        background thread, so workers start before discovery has finished. `total`
+        is then an estimate (or None if unknown, reported as 0), and progress never
+        reports more done than total.
         """
-        Build a FileArtifact and capture exceptions as structured ERROR results.
-        """
-        try:
-            return processor.build_artifact(fpath)
-        except Exception as exc:
-            report.results.append(
-                CheckResult(
-                    file=fpath,
-                    check_name="Artifact build failed",
-                    severity=Severity.ERROR,
-                    passed=False,
-                    message=str(exc) or exc.__class__.__name__,
-                    extra={"exception": exc.__class__.__name__},
-                )
+        ctx = multiprocessing.get_context("spawn")
+        n_workers = min(self._workers, total) if total else self._workers
+        chunksize = max(1, min(_POOL_CHUNKSIZE, (total or 0) // (n_workers * 4) or 1))
+        with ctx.Pool(
+            n_workers,
+            initializer=_init_worker,
+            initargs=(_plugin_modules(), self._worker_init),
+        ) as pool:
+            for i, (fpath, results) in enumerate(
+                pool.imap_unordered(_scan_one_file, file_list, chunksize=chunksize), start=1
+            ):
+                if self._on_progress:
+                    self._on_progress(i, max(total, i) if total else 0, fpath)
+                report.results.extend(results)
+
+
+def default_workers() -> int:
+    """A sensible pool size for interactive use: leave one core for the UI."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+# ---------- per-file pipeline (module-level so pool workers can pickle it) ----------
+
+def _record_sizes(
+    entries: Iterable[Tuple[Path, Optional[os.stat_result]]], sizes: Dict[Path, int]
+) -> Iterator[Tuple[Path, Optional[os.stat_result]]]:
+    """Pass (path, stat) entries through, noting each file's size on the way."""
+    for fpath, st in entries:
+        if st is not None:
+            sizes[fpath] = st.st_size
+        yield fpath, st
+
+
+def _scan_file(fpath: Path, st: Optional[os.stat_result]) -> List[CheckResult]:
+    """
+    Route one file to its processor, run the applicable checks, and return the results.
+    Unexpected processor/check exceptions become ERROR CheckResult entries.
+    """
+    ext = fpath.suffix.lower()
+    processor = processor_for(ext)  # O(1) registry index
+
+    if processor is None:
+        # Defensive: discovery normally filters to known extensions.
+        return [
+            CheckResult(
+                file=fpath,
+                check_name="No processor found",
+                severity=Severity.WARNING,
+                passed=False,
+                message=f"No processor registered for extension: {ext}",
+                extra={"extension": ext},
             )
-            return None
+        ]
 
-    def _safe_run_check(self, chk, artifact: FileArtifact, report: AggregateReport) -> None:
-        """
-        Run a check and capture exceptions as structured ERROR results.
-        """
-        try:
-            result = chk.run(artifact)
-        except Exception as exc:
-            # If the check crashes, we record that as an ERROR with the check's name.
-            result = CheckResult(
-                file=artifact.path,
-                check_name=f"{chk.name()}",
+    results: List[CheckResult] = []
+    artifact = _safe_build_artifact(processor, fpath, st, results)
+    if artifact is None:
+        # Error already recorded as a CheckResult
+        return results
+
+    # Run only checks that claim to apply to this extension (precomputed dispatch table)
+    for chk in checks_for(ext):
+        results.extend(_safe_run_check(chk, artifact))
+    return results
+
+
+def _safe_build_artifact(
+    processor, fpath: Path, st: Optional[os.stat_result], results: List[CheckResult]
+) -> Optional[FileArtifact]:
+    """
+    Build a FileArtifact and capture exceptions as structured ERROR results.
+    """
+    try:
+        return processor.build_artifact(fpath, st)
+    except Exception as exc:
+        results.append(
+            CheckResult(
+                file=fpath,
+                check_name="Artifact build failed",
                 severity=Severity.ERROR,
                 passed=False,
-                message=f"Check raised exception: {exc}",
+                message=str(exc) or exc.__class__.__name__,
                 extra={"exception": exc.__class__.__name__},
             )
-        report.results.append(result)
+        )
+        return None
+
+
+def _safe_run_check(chk, artifact: FileArtifact) -> List[CheckResult]:
+    """
+    Run a check (all of its results) and capture exceptions as structured ERROR results.
+    """
+    try:
+        return chk.run_many(artifact)
+    except Exception as exc:
+        # If the check crashes, we record that as an ERROR with the check's name.
+        return [CheckResult.crashed(artifact.path, chk.name, exc)]
+
+
+def _plugin_modules() -> List[str]:
+    """Modules whose import registers the current processors and checks."""
+    mods = {type(p).__module__ for p in processors()}
+    mods.update(cls.__module__ for cls in check_classes())
+    return sorted(mods)
+
+
+def _init_worker(plugin_modules: List[str], worker_init: Optional[Callable[[], None]]) -> None:
+    """Pool initializer: self-register plugins by import, then apply run-time settings."""
+    for mod in plugin_modules:
+        importlib.import_module(mod)
+    if worker_init is not None:
+        worker_init()
+
+
+def _scan_one_file(item: Tuple[Path, Optional[os.stat_result]]) -> Tuple[Path, List[CheckResult]]:
+    """Pool task: scan a single (path, stat) entry inside a worker process."""
+    fpath, st = item
+    return fpath, _scan_file(fpath, st)
@@ -23,6 +23,7 @@ from zipfile import ZipFile, BadZipFile
 from xml.etree.ElementTree import iterparse
 
 from services.xlsx_theme import resolve_theme_color, theme_rgb_map_from_zip
+from utils.xml_utils import local_name
 
 # Normalized 6-hex yellow and indexed yellow
 _YELLOW_6_HEX = {"FFFF00"}  # compare after normalization to last 6 hex chars
@@ -85,7 +86,7 @@ def _map_worksheet_parts_to_names(zf: ZipFile, names: set[str]) -> Dict[str, str
     if "xl/_rels/workbook.xml.rels" in names:
         with zf.open("xl/_rels/workbook.xml.rels") as fp:
             for _event, elem in iterparse(fp, events=("end",)):
-                if _local(elem.tag) == "Relationship":
+                if local_name(elem.tag) == "Relationship":
                     rid = elem.attrib.get("Id")
                     tgt = elem.attrib.get("Target", "")
                     if rid and tgt:
@@ -96,7 +97,7 @@ def _map_worksheet_parts_to_names(zf: ZipFile, names: set[str]) -> Dict[str, str
 
     with zf.open("xl/workbook.xml") as fp:
         for _event, elem in iterparse(fp, events=("end",)):
-            if _local(elem.tag) == "sheet":
+            if local_name(elem.tag) == "sheet":
                 name = elem.attrib.get("name")
                 rid = (
                     elem.attrib.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id")
@@ -135,7 +136,7 @@ def _parse_styles_for_yellow(
 
     with zf.open("xl/styles.xml") as fp:
         for _event, elem in iterparse(fp, events=("end",)):
-            tag = _local(elem.tag)
+            tag = local_name(elem.tag)
 
             if tag == "fills":
                 in_fills = True
@@ -147,9 +148,9 @@ def _parse_styles_for_yellow(
                 fill_id += 1
                 # Look for <patternFill patternType="solid"><fgColor/bgColor .../></patternFill>
                 for child in list(elem):
-                    if _local(child.tag) == "patternFill" and child.attrib.get("patternType") == "solid":
+                    if local_name(child.tag) == "patternFill" and child.attrib.get("patternType") == "solid":
                         for sub in list(child):
-                            if _local(sub.tag) in ("fgColor", "bgColor"):
+                            if local_name(sub.tag) in ("fgColor", "bgColor"):
                                 if _color_attrs_are_classic_yellow(sub.attrib, theme_rgb_map):
                                     yellow_fill_ids.add(fill_id)
                 elem.clear()
@@ -190,7 +191,7 @@ def _yield_sheet_cells_with_yellow(
 
     with zf.open(member) as fp:
         for _event, elem in iterparse(fp, events=("end",)):
-            if _local(elem.tag) == "c":  # <c r="B12" s="17" ...>
+            if local_name(elem.tag) == "c":  # <c r="B12" s="17" ...>
                 ref = elem.attrib.get("r")
                 s = elem.attrib.get("s")
                 if s is not None and ref:
@@ -210,13 +211,6 @@ def _yield_sheet_cells_with_yellow(
     return out
 
 
-def _local(tag: str) -> str:
-    """Strip XML namespace to get the local tag name."""
-    if "}" in tag:
-        return tag.split("}", 1)[1]
-    return tag
-
-
 def _normalize_rgb(rgb: str) -> str:
     """
     Normalize ARGB/RGB to last 6 hex digits so 'FFFFFFFF' -> 'FFFFFF', '00FFFF00' -> 'FFFF00'.
@@ -13,6 +13,8 @@ from typing import Dict, Iterable, Optional
 from zipfile import ZipFile, BadZipFile
 from xml.etree.ElementTree import ParseError, fromstring
 
+from utils.xml_utils import local_name
+
 _THEME_ORDER = [
     "lt1",
     "dk1",
@@ -30,12 +32,6 @@ _THEME_ORDER = [
 _THEME_TAG_TO_INDEX = {name: idx for idx, name in enumerate(_THEME_ORDER)}
 
 
-def _local_name(tag: str) -> str:
-    if "}" in tag:
-        return tag.split("}", 1)[1]
-    return tag
-
-
 def _normalize_rgb(value: str | None) -> str:
     s = (value or "").upper()
     return s[-6:] if len(s) >= 6 else s
@@ -74,7 +70,7 @@ def _extract_rgb_from_theme_elem(elem) -> Optional[str]:
     <a:sysClr lastClr="...">. Return whichever is available.
     """
     for child in list(elem):
-        lname = _local_name(child.tag)
+        lname = local_name(child.tag)
         if lname == "srgbClr":
             val = child.attrib.get("val")
             if val:
@@ -114,7 +110,7 @@ def theme_rgb_map_from_zip(zf: ZipFile, names: Iterable[str]) -> Dict[int, str]:
 
     clr_scheme = None
     for elem in root.iter():
-        if _local_name(elem.tag) == "clrScheme":
+        if local_name(elem.tag) == "clrScheme":
             clr_scheme = elem
             break
 
@@ -122,7 +118,7 @@ def theme_rgb_map_from_zip(zf: ZipFile, names: Iterable[str]) -> Dict[int, str]:
         return {}
 
     for child in clr_scheme:
-        lname = _local_name(child.tag)
+        lname = local_name(child.tag)
         if lname in _THEME_TAG_TO_INDEX:
             rgb = _extract_rgb_from_theme_elem(child)
             if rgb:
@@ -0,0 +1,63 @@
+# tests/test_config_loader.py
+"""Environment overrides in infra.config_loader."""
+
+import pytest
+
+from infra import config_loader
+from infra.config_loader import _parse_bool, _parse_int, invalidate_config, load_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_config():
+    # load_config() caches the environment; re-read it around every test
+    invalidate_config()
+    yield
+    invalidate_config()
+
+
+@pytest.mark.parametrize("val", ["1", "true", "TRUE", " yes ", "on"])
+def test_parse_bool_true(val):
+    assert _parse_bool(val) is True
+
+
+@pytest.mark.parametrize("val", ["0", "false", "no", "off", "", "maybe"])
+def test_parse_bool_false(val):
+    assert _parse_bool(val) is False
+
+
+@pytest.mark.parametrize("val, expected", [("10", 10), (" 42 ", 42), ("0", 0)])
+def test_parse_int_valid(val, expected):
+    assert _parse_int(val) == expected
+
+
+@pytest.mark.parametrize("val", ["", "abc", "-1", "1.5", "1e3"])
+def test_parse_int_invalid_keeps_default(val):
+    assert _parse_int(val) is None
+
+
+def test_env_overrides_scalars_and_lists(monkeypatch):
+    monkeypatch.setenv("XRAY_MAX_TEXT_CHARS", "1234")
+    monkeypatch.setenv("XRAY_ENABLE_SPELLING", "no")
+    monkeypatch.setenv("XRAY_LOG_LEVEL", " debug ")
+    monkeypatch.setenv("XRAY_IGNORE_DIRS", "node_modules, build ,,")
+    invalidate_config()
+    cfg = load_config()
+    assert cfg["max_text_chars"] == 1234
+    assert cfg["enable_spelling"] is False
+    assert cfg["log_level"] == "DEBUG"
+    assert cfg["ignore_dirs"] == ["node_modules", "build"]
+
+
+def test_invalid_int_env_keeps_default(monkeypatch):
+    monkeypatch.setenv("XRAY_MAX_TEXT_CHARS", "lots")
+    invalidate_config()
+    assert load_config()["max_text_chars"] == config_loader._DEFAULT["max_text_chars"]
+
+
+def test_load_config_returns_independent_copies():
+    cfg = load_config()
+    cfg["ignore_dirs"].append("mutated")
+    cfg["log_level"] = "ERROR"
+    again = load_config()
+    assert "mutated" not in again["ignore_dirs"]
+    assert again["log_level"] == config_loader._DEFAULT["log_level"]
@@ -0,0 +1,86 @@
+# tests/test_models.py
+"""Slotted, frozen report models: immutability and pickling (pool workers send them back)."""
+
+import dataclasses
+import pickle
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from core.models import (
+    AggregateReport,
+    CheckResult,
+    FileArtifact,
+    FileReport,
+    FileVerdict,
+    RunHeader,
+    ScanReport,
+    Severity,
+)
+
+
+def _result() -> CheckResult:
+    return CheckResult(
+        file=Path("a.docx"),
+        check_name="DOCX: no comments",
+        severity=Severity.ERROR,
+        passed=False,
+        message="Found 2 comment(s)",
+        extra={"comments_count": 2},
+    )
+
+
+def _scan_report() -> ScanReport:
+    now = datetime(2025, 1, 31, tzinfo=timezone.utc)
+    header = RunHeader(
+        schema_version="1.0-file-centric",
+        run_id="run",
+        root=Path("/data"),
+        started_at_utc=now,
+        finished_at_utc=now,
+        config_snapshot={"ignore_dirs": [".git"]},
+        total_files=1,
+        total_checks=1,
+        total_errors=1,
+        total_warnings=0,
+        total_infos=0,
+    )
+    file_report = FileReport(
+        file=Path("a.docx"),
+        extension=".docx",
+        size_bytes=10,
+        verdict=FileVerdict.FAIL,
+        errors=1,
+        warnings=0,
+        infos=0,
+        results=[_result()],
+    )
+    return ScanReport(header=header, files=[file_report])
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        FileArtifact(path=Path("a.pdf"), extension=".pdf", size_bytes=3, metadata={"pages": 2}, mtime_ns=5),
+        _result(),
+        AggregateReport(results=[_result()], file_sizes={Path("a.docx"): 10}),
+        _scan_report(),
+    ],
+    ids=lambda obj: type(obj).__name__,
+)
+def test_models_pickle_round_trip(obj):
+    assert pickle.loads(pickle.dumps(obj)) == obj
+
+
+def test_hot_models_are_slotted_and_frozen():
+    for obj in (_result(), FileArtifact(path=Path("a"), extension=".pdf", size_bytes=0)):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            setattr(obj, dataclasses.fields(obj)[0].name, None)
+
+
+def test_str_enums_compare_to_their_values():
+    assert Severity.ERROR == "ERROR"
+    assert FileVerdict.PASS_ == "PASS"
+    assert CheckResult.crashed(Path("a"), "x", ValueError("bad")).extra == {"exception": "ValueError"}
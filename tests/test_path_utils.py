@@ -0,0 +1,24 @@
+# tests/test_path_utils.py
+"""File discovery: extension filter and folder pruning shared by the UI and the scan."""
+
+from utils.path_utils import iter_target_entries, iter_target_names
+
+
+def _touch(root, *rel_paths):
+    for rel in rel_paths:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+
+
+def test_prunes_hidden_and_ignored_folders(tmp_path):
+    _touch(tmp_path, "a.docx", "sub/B.PDF", ".hidden/c.docx", "node_modules/d.pdf", "sub/notes.txt")
+    names = sorted(iter_target_names(tmp_path, [".docx", ".pdf"], ["node_modules"]))
+    assert names == ["B.PDF", "a.docx"]
+
+
+def test_entries_carry_the_discovery_stat(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"12345")
+    [(path, st)] = list(iter_target_entries(tmp_path, ["pdf"]))
+    assert path.name == "a.pdf"
+    assert st.st_size == 5
@@ -0,0 +1,39 @@
+# tests/test_pdf_dates.py
+"""PDF date strings (D:YYYYMMDDHHmmSS+HH'mm') -> ISO 8601 in UTC."""
+
+import pytest
+
+from processors.pdf_processor import _pdf_date_to_iso
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("D:20230102030405Z", "2023-01-02T03:04:05+00:00"),
+        ("D:20230102030405+05'30'", "2023-01-01T21:34:05+00:00"),
+        ("D:20230102030405-08'00'", "2023-01-02T11:04:05+00:00"),
+        ("20230102030405", "2023-01-02T03:04:05+00:00"),
+        ("D:2023", "2023-01-01T00:00:00+00:00"),
+        ("  D:202301  ", "2023-01-01T00:00:00+00:00"),
+    ],
+)
+def test_parses_full_and_partial_dates(raw, expected):
+    assert _pdf_date_to_iso(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        # Odd trailing digit: the complete fields are kept
+        ("D:2023010203040", "2023-01-02T03:04:00+00:00"),
+        ("D:20230102030405-08'00'xyz", "2023-01-02T11:04:05+00:00"),
+        ("D:20230102030405.123Z", "2023-01-02T03:04:05+00:00"),
+    ],
+)
+def test_ignores_trailing_characters(raw, expected):
+    assert _pdf_date_to_iso(raw) == expected
+
+
+@pytest.mark.parametrize("raw", [None, "", "junk", "D:20231302", "D:20230230"])
+def test_invalid_dates_return_none(raw):
+    assert _pdf_date_to_iso(raw) is None
@@ -0,0 +1,48 @@
+# tests/test_text_extract.py
+"""Text sampling and word counting helpers used by the spelling checks."""
+
+import pytest
+
+from utils.text_extract import _BoundedText, count_words, tokenize_words, unique_words
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "Hello world", "Don't stop: it's 42 o'clock!", "a\tb\nc  d", "123 456", "UPPER lower MiXeD"],
+)
+def test_count_words_matches_tokenizer(text):
+    assert count_words(text) == len(tokenize_words(text))
+
+
+def test_unique_words_lowercases_and_dedupes():
+    assert unique_words("The cat and THE Cat, don't") == {"the", "cat", "and", "don't"}
+    assert unique_words("") == set()
+
+
+def test_bounded_text_under_cap_keeps_everything():
+    buf = _BoundedText(100)
+    assert buf.add("hello ") is False
+    assert buf.add("world") is False
+    assert buf.text() == "hello world"
+
+
+def test_bounded_text_truncates_at_cap():
+    buf = _BoundedText(8)
+    assert buf.add("hello ") is False
+    assert buf.add("world") is True  # only "wo" fits
+    assert buf.add("more") is True   # already full
+    assert buf.text() == "hello wo"
+
+
+def test_bounded_text_normalizes_whitespace_and_skips_empty():
+    buf = _BoundedText(50)
+    assert buf.add("") is False
+    buf.add("  a\n\tb  ")
+    buf.add("c")
+    assert buf.text() == "a b c"
+
+
+def test_bounded_text_zero_cap():
+    buf = _BoundedText(0)
+    assert buf.add("x") is True
+    assert buf.text() == ""
@@ -0,0 +1,110 @@
+# tests/test_xlsx_checks.py
+"""XLSX rules: one registered check per rule, all reading the shared metadata view."""
+
+from pathlib import Path
+
+import pytest
+
+from checks import xlsx_checks
+from checks.xlsx_checks import (
+    XlsxCommentsCheck,
+    XlsxDataConnectionsCheck,
+    XlsxExternalLinksCheck,
+    XlsxFormulaErrorsCheck,
+    XlsxHiddenSheetsCheck,
+    XlsxVbaInXlsxCheck,
+    XlsxWorkbookProtectionCheck,
+    XlsxYellowCellsCheck,
+    XlsxYellowSheetTabsCheck,
+)
+from core import registry
+from core.models import FileArtifact, Severity
+
+RULES = (
+    XlsxHiddenSheetsCheck,
+    XlsxFormulaErrorsCheck,
+    XlsxExternalLinksCheck,
+    XlsxDataConnectionsCheck,
+    XlsxWorkbookProtectionCheck,
+    XlsxCommentsCheck,
+    XlsxVbaInXlsxCheck,
+    XlsxYellowCellsCheck,
+    XlsxYellowSheetTabsCheck,
+)
+
+
+def _artifact(**metadata) -> FileArtifact:
+    return FileArtifact(path=Path("book.xlsx"), extension=".xlsx", size_bytes=1, metadata=metadata)
+
+
+def _run_all(artifact: FileArtifact):
+    return [rule().run(artifact) for rule in RULES]
+
+
+def test_every_rule_is_registered_on_its_own():
+    registered = set(registry.check_classes())
+    assert all(rule in registered for rule in RULES)
+    assert len({rule.name for rule in RULES}) == len(RULES)
+
+
+def test_clean_workbook_passes_every_rule():
+    results = _run_all(_artifact())
+    assert [r.check_name for r in results] == [rule.name for rule in RULES]
+    assert all(r.passed and r.severity == Severity.INFO for r in results)
+
+
+def test_findings_fail_the_matching_rules():
+    art = _artifact(
+        hidden_sheet_count=1,
+        error_cell_count=2,
+        external_links_count=1,
+        has_vba_project=True,
+        yellow_tab_sheet_count=1,
+        yellow_tab_sheets=["Main"],
+    )
+    by_name = {r.check_name: r for r in _run_all(art)}
+    failed = {name for name, r in by_name.items() if not r.passed}
+    assert failed == {
+        XlsxHiddenSheetsCheck.name,
+        XlsxFormulaErrorsCheck.name,
+        XlsxExternalLinksCheck.name,
+        XlsxVbaInXlsxCheck.name,
+        XlsxYellowSheetTabsCheck.name,
+    }
+    assert by_name[XlsxYellowSheetTabsCheck.name].extra["yellow_tab_sheets"] == ["Main"]
+
+
+def test_unreadable_workbook_warns():
+    result = XlsxFormulaErrorsCheck().run(_artifact(read_error=True, read_error_detail="boom"))
+    assert not result.passed
+    assert result.severity == Severity.WARNING
+    assert result.extra["read_error_detail"] == "boom"
+
+
+def test_rules_share_one_metadata_view():
+    art = _artifact(comments_count=3)
+    view = xlsx_checks._xlsx_view(art)
+    _run_all(art)
+    # No rule rebuilt the view for the same artifact
+    assert xlsx_checks._xlsx_view(art) is view
+
+
+def test_passing_results_do_not_share_extra():
+    first, second = (XlsxYellowSheetTabsCheck().run(_artifact()) for _ in range(2))
+    first.extra["yellow_tab_sheets"].append("x")
+    assert second.extra["yellow_tab_sheets"] == []
+
+
+@pytest.mark.parametrize(
+    "presence_only, expected",
+    [
+        (False, "Formula issues: error_cells=0, #REF!=1, other_errors=0"),
+        (True, "Formula issues: error_cells=0, #REF!=1+, other_errors=0 (presence-only scan, stopped at the first error)"),
+    ],
+)
+def test_formula_message_marks_presence_only_hits(presence_only, expected):
+    result = XlsxFormulaErrorsCheck().run(
+        _artifact(formula_ref_error_count=1, counts_presence_only=presence_only)
+    )
+    assert result.message == expected
+    assert result.extra.get("counts_presence_only", False) is presence_only
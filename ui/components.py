@@ -105,9 +105,12 @@ def progress_widgets() -> Tuple[Callable[[int], None], Callable[[int, int, Path]
             status.info(f"Discovered {n} file(s). Starting scan…")
 
     def on_progress(i: int, n: int, path: Path) -> None:
+        # n == 0: total not known yet (files still being discovered while scanning)
         if n > 0:
             bar.progress(min(int(i / n * 100), 100))
-        status.write(f"[{i}/{n}] {path}")
+            status.write(f"[{i}/{n}] {path}")
+        else:
+            status.write(f"[{i}] {path}")
 
     return set_total, on_progress
 
@@ -5,18 +5,19 @@ Path utilities: discover target files for scanning.
 Goals:
 - Single responsibility: file discovery only (no parsing, no UI).
 - Windows-friendly, but cross-platform safe.
-- Fast directory walking with pruning (skip .git, venv, etc.).
+- Fast directory walking with pruning (skip hidden folders, venv, etc.).
 - Easy to extend: allow optional overrides for extensions and ignored dirs.
 
-Default target extensions: .docx, .pptx, .pdf
-Default ignored dirs: .git, __pycache__, venv
+Default target extensions: config "target_extensions"
+Default ignored dirs: .git, __pycache__, venv, ignore (callers pass config "ignore_dirs");
+hidden (dot-prefixed) folders are always skipped.
 """
 
 from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Iterable, Iterator, Optional, Set
+from typing import Iterable, Iterator, Optional, Set, Tuple
 
 # Pull default extensions from central config
 try:
@@ -47,7 +48,8 @@ def iter_target_files(
     exts : Optional[Iterable[str]]
         Allowed file extensions (case-insensitive). Defaults to .docx, .pptx, .pdf.
     ignore_dirs : Optional[Iterable[str]]
-        Directory names to skip entirely (case-insensitive). Defaults to .git, __pycache__, venv.
+        Directory names to skip entirely (case-insensitive). Defaults to .git, __pycache__,
+        venv, ignore. Hidden (dot-prefixed) directories are skipped in any case.
 
     Yields
     ------
@@ -56,30 +58,104 @@ def iter_target_files(
 
     Notes
     -----
-    - Uses os.walk(topdown=True) so we can prune directories in-place (fast).
+    - Walks with os.scandir so directory tests use the cached DirEntry type;
+      ignored directories are pruned before descending (fast).
     - Does not follow symlinks (safer; avoids infinite loops).
     - Normalizes extensions and ignore names to lowercase for consistent matching.
     """
+    for entry in _iter_matching_entries(root, exts, ignore_dirs):
+        yield Path(entry.path)
+
+
+def iter_target_entries(
+    root: Path | str,
+    exts: Optional[Iterable[str]] = None,
+    ignore_dirs: Optional[Iterable[str]] = None,
+) -> Iterator[Tuple[Path, Optional[os.stat_result]]]:
+    """
+    Like iter_target_files, but yield (path, stat_result) pairs.
+
+    The stat comes from DirEntry.stat(), which is cached on the entry (and free
+    on Windows, where readdir already returns it). Passing it on to processors
+    saves them a second stat() per file.
+    """
+    for entry in _iter_matching_entries(root, exts, ignore_dirs):
+        try:
+            st = entry.stat()
+        except OSError:
+            # Vanished or unreadable between listing and stat: let the processor report it
+            yield Path(entry.path), None
+            continue
+        yield Path(entry.path), st
+
+
+def iter_target_names(
+    root: Path | str,
+    exts: Optional[Iterable[str]] = None,
+    ignore_dirs: Optional[Iterable[str]] = None,
+) -> Iterator[str]:
+    """
+    Like iter_target_files, but yield bare file names (no Path built per file).
+
+    Same walk and pruning rules as the scan itself, so counts built from it
+    (e.g. the UI's discovery summary) match what the orchestrator visits.
+    """
+    for entry in _iter_matching_entries(root, exts, ignore_dirs):
+        yield entry.name
+
+
+# ---------- helpers (module-internal) ----------
+
+def _iter_matching_entries(
+    root: Path | str,
+    exts: Optional[Iterable[str]],
+    ignore_dirs: Optional[Iterable[str]],
+) -> Iterator[os.DirEntry]:
+    """
+    Shared scandir walk behind iter_target_files / iter_target_entries / iter_target_names.
+
+    Deliberately os.scandir rather than os.fwalk: since Python 3.5 scandir already
+    gives the file type from readdir, while fwalk scans with the same scandir and
+    adds an open() plus stat checks per directory, and yields bare names, so the
+    (path, stat) pairs handed to processors would cost an extra stat per file.
+    One walker also keeps the UI and the scan on the same pruning rules.
+    """
     root_path = Path(root).resolve()
-    allowed_exts = _normalize_exts(exts or _DEFAULT_EXTS)
+    # Sorted tuple: str.endswith(tuple) tests every extension in one C-level call
+    allowed_exts = tuple(sorted(_normalize_exts(exts or _DEFAULT_EXTS)))
     ignored = _normalize_names(ignore_dirs or _DEFAULT_IGNORES)
 
-    # Prune as we walk for speed.
-    for dirpath, dirnames, filenames in os.walk(
-        root_path, topdown=True, followlinks=False
-    ):
-        # In-place pruning of ignored directories (case-insensitive match on name).
-        # Example: if "venv" in ignored, any folder named "venv" is skipped (wherever it occurs).
-        dirnames[:] = [d for d in dirnames if d.lower() not in ignored]
+    stack = [str(root_path)]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            # Unreadable folder (permissions, vanished): skip it, like os.walk does
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    # Prune hidden and ignored names (case-insensitive) and never follow
+                    # directory symlinks. Example: if "venv" in ignored, any folder named
+                    # "venv" is skipped (wherever it occurs); so are ".git", ".cache", ...
+                    name = entry.name
+                    if not (entry.is_symlink() or name.startswith(".") or name.lower() in ignored):
+                        subdirs.append(entry.path)
+                    continue
+            except OSError:
+                continue
 
-        # Emit only target files by extension, case-insensitive.
-        for fname in filenames:
-            ext = _suffix_lower(fname)
-            if ext in allowed_exts:
-                yield Path(dirpath) / fname
+            # Emit only target files by extension, case-insensitive.
+            if entry.name.lower().endswith(allowed_exts):
+                yield entry
 
+        # Reverse so sub-folders are visited in listing order (stack is LIFO)
+        stack.extend(reversed(subdirs))
 
-# ---------- helpers (module-internal) ----------
 
 def _normalize_exts(exts: Iterable[str]) -> Set[str]:
     """
@@ -100,15 +176,3 @@ def _normalize_exts(exts: Iterable[str]) -> Set[str]:
 def _normalize_names(names: Iterable[str]) -> Set[str]:
     """Lowercase each name for case-insensitive comparisons."""
     return {str(n).lower() for n in names if str(n).strip()}
-
-
-def _suffix_lower(filename: str) -> str:
-    """
-    Fast, allocation-light way to get a lowercase suffix from a filename.
-    We avoid constructing a Path for each file for speed inside tight loops.
-    """
-    # Find last dot; if none, return empty string
-    idx = filename.rfind(".")
-    if idx == -1:
-        return ""
-    return filename[idx:].lower()
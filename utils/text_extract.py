@@ -12,19 +12,26 @@ Why this module (SOLID):
 Public API:
 - normalize_text(s: str) -> str
 - tokenize_words(s: str) -> list[str]
+- count_words(s: str) -> int
+- unique_words(s: str) -> set[str]
 - extract_docx_text(path, max_chars) -> str
+- extract_docx_document_text(doc, max_chars) -> str
 - extract_pptx_text(path, max_chars) -> str
+- extract_pptx_presentation_text(prs, max_chars) -> str
 - extract_xlsx_text(path, max_chars, include_hidden=True, skip_formulas=True) -> str
+- extract_xlsx_workbook_text(wb, max_chars, include_hidden=True, skip_formulas=True) -> str
 - extract_pdf_text(path, max_chars) -> str
+- extract_pdf_reader_text(reader, max_chars) -> str
 
 All extractors enforce the max_chars cap by stopping early.
 """
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
-from typing import Iterable, List, Optional, Union
+from typing import Iterable, List, Optional, Set, Union
 
 PathLike = Union[str, Path]
 
@@ -58,31 +65,61 @@ def tokenize_words(s: str) -> List[str]:
     """
     if not s:
         return []
-    return [m.group(0).lower() for m in _WORD_RE_EN.finditer(s)]
+    # findall on the module-level compiled pattern hands back plain strings (no Match objects)
+    return [w.lower() for w in _WORD_RE_EN.findall(s)]
+
+
+def count_words(s: str) -> int:
+    """Number of tokens tokenize_words(s) would return, without building the list."""
+    if not s:
+        return 0
+    # subn counts matches in C and allocates one (shorter) string, rather than a
+    # Match object per token (finditer) or a list of every token (findall)
+    return _WORD_RE_EN.subn("", s)[1]
+
+
+def unique_words(s: str) -> Set[str]:
+    """Distinct tokens of tokenize_words(s), built straight into a set (no token list)."""
+    if not s:
+        return set()
+    return {m.group(0).lower() for m in _WORD_RE_EN.finditer(s)}
 
 
 # ---------------- Internal helpers ----------------
 
 
-def _append_and_maybe_stop(chunks: List[str], to_add: str, max_chars: int) -> bool:
+class _BoundedText:
     """
-    Append 'to_add' to chunks if we haven't reached max_chars yet.
-    Returns True if we should stop (limit reached), False otherwise.
+    Collects text chunks until max_chars is reached; joined and normalized once at the end.
 
-    We avoid constantly joining the whole text; we only join once at the end.
+    The remaining budget is tracked as chunks arrive, so each add() is O(len(chunk))
+    instead of re-summing every chunk collected so far.
     """
-    if not to_add:
-        return False
-    current_len = sum(len(c) for c in chunks)
-    remaining = max_chars - current_len
-    if remaining <= 0:
-        return True  # already at or above cap
-    if len(to_add) <= remaining:
-        chunks.append(to_add)
-        return False
-    # Need only part of it
-    chunks.append(to_add[:remaining])
-    return True
+
+    __slots__ = ("_chunks", "_remaining")
+
+    def __init__(self, max_chars: int) -> None:
+        self._chunks: List[str] = []
+        self._remaining = max_chars
+
+    def add(self, to_add: str) -> bool:
+        """Append 'to_add' (truncated to the cap). Returns True once the cap is reached."""
+        if not to_add:
+            return False
+        remaining = self._remaining
+        if remaining <= 0:
+            return True  # already at or above cap
+        if len(to_add) <= remaining:
+            self._chunks.append(to_add)
+            self._remaining = remaining - len(to_add)
+            return False
+        # Need only part of it
+        self._chunks.append(to_add[:remaining])
+        self._remaining = 0
+        return True
+
+    def text(self) -> str:
+        return normalize_text("".join(self._chunks))
 
 
 def _safe_str(x) -> str:
@@ -104,28 +141,30 @@ def extract_docx_text(path: PathLike, max_chars: int) -> str:
     except ImportError as exc:
         raise RuntimeError("python-docx is required to extract DOCX text") from exc
 
-    p = Path(path)
-    chunks: List[str] = []
-    try:
-        doc = Document(str(p))
-
-        # Paragraphs
-        for para in doc.paragraphs:
-            if _append_and_maybe_stop(chunks, _safe_str(para.text) + "\n", max_chars):
-                return normalize_text("".join(chunks))
-
-        # Tables
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    if _append_and_maybe_stop(chunks, _safe_str(cell.text) + "\n", max_chars):
-                        return normalize_text("".join(chunks))
-
-    except Exception as exc:
-        # Propagate: processors catch and set metadata["read_error"]
-        raise
+    # Propagate errors: processors catch and set their error flags
+    return extract_docx_document_text(Document(os.fspath(path)), max_chars)
 
-    return normalize_text("".join(chunks))
+
+def extract_docx_document_text(doc, max_chars: int) -> str:
+    """
+    Same as extract_docx_text, for a python-docx Document the caller already opened
+    (saves re-reading and re-parsing the package).
+    """
+    sample = _BoundedText(max_chars)
+
+    # Paragraphs
+    for para in doc.paragraphs:
+        if sample.add(_safe_str(para.text) + "\n"):
+            return sample.text()
+
+    # Tables
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                if sample.add(_safe_str(cell.text) + "\n"):
+                    return sample.text()
+
+    return sample.text()
 
 
 def extract_pptx_text(path: PathLike, max_chars: int) -> str:
@@ -141,40 +180,41 @@ def extract_pptx_text(path: PathLike, max_chars: int) -> str:
     except ImportError as exc:
         raise RuntimeError("python-pptx is required to extract PPTX text") from exc
 
-    p = Path(path)
-    chunks: List[str] = []
-    try:
-        prs = Presentation(str(p))
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                # Text frames
-                try:
-                    if getattr(shape, "has_text_frame", False) and shape.text_frame:
-                        # shape.text could be used, but iterating paragraphs/runs gives finer control if needed later
-                        for para in shape.text_frame.paragraphs:
-                            text = "".join(run.text or "" for run in para.runs) if para.runs else (para.text or "")
-                            if _append_and_maybe_stop(chunks, _safe_str(text) + "\n", max_chars):
-                                return normalize_text("".join(chunks))
-                except Exception:
-                    # Ignore malformed shapes and continue
-                    pass
-
-                # Tables
-                try:
-                    if getattr(shape, "has_table", False):
-                        tbl = shape.table
-                        for r in tbl.rows:
-                            for c in r.cells:
-                                if _append_and_maybe_stop(chunks, _safe_str(c.text) + "\n", max_chars):
-                                    return normalize_text("".join(chunks))
-                except Exception:
-                    pass
+    # Propagate errors: processors catch and set their error flags
+    return extract_pptx_presentation_text(Presentation(os.fspath(path)), max_chars)
 
-    except Exception:
-        # Propagate for processor to handle
-        raise
 
-    return normalize_text("".join(chunks))
+def extract_pptx_presentation_text(prs, max_chars: int) -> str:
+    """
+    Same as extract_pptx_text, for a python-pptx Presentation the caller already opened.
+    """
+    sample = _BoundedText(max_chars)
+    for slide in prs.slides:
+        for shape in slide.shapes:
+            # Text frames
+            try:
+                if getattr(shape, "has_text_frame", False) and shape.text_frame:
+                    # shape.text could be used, but iterating paragraphs/runs gives finer control if needed later
+                    for para in shape.text_frame.paragraphs:
+                        text = "".join(run.text or "" for run in para.runs) if para.runs else (para.text or "")
+                        if sample.add(_safe_str(text) + "\n"):
+                            return sample.text()
+            except Exception:
+                # Ignore malformed shapes and continue
+                pass
+
+            # Tables
+            try:
+                if getattr(shape, "has_table", False):
+                    tbl = shape.table
+                    for r in tbl.rows:
+                        for c in r.cells:
+                            if sample.add(_safe_str(c.text) + "\n"):
+                                return sample.text()
+            except Exception:
+                pass
+
+    return sample.text()
 
 
 def extract_xlsx_text(
@@ -196,12 +236,27 @@ def extract_xlsx_text(
         raise RuntimeError("openpyxl is required to extract XLSX text") from exc
 
     p = Path(path)
-    chunks: List[str] = []
+    # read_only=True is memory-friendly; data_only=True returns evaluated values for formulas,
+    # but since we skip formulas by data_type check, this is just a safety.
+    wb = load_workbook(filename=str(p), read_only=True, data_only=True)
     try:
-        # read_only=True is memory-friendly; data_only=True returns evaluated values for formulas,
-        # but since we skip formulas by data_type check, this is just a safety.
-        wb = load_workbook(filename=str(p), read_only=True, data_only=True)
+        return extract_xlsx_workbook_text(wb, max_chars, include_hidden, skip_formulas)
+    finally:
+        wb.close()
+
 
+def extract_xlsx_workbook_text(
+    wb,
+    max_chars: int,
+    include_hidden: bool = True,
+    skip_formulas: bool = True,
+) -> str:
+    """
+    Same as extract_xlsx_text, for an openpyxl Workbook the caller already opened
+    (read_only=True, data_only=True). The caller closes it.
+    """
+    sample = _BoundedText(max_chars)
+    try:
         for ws in wb.worksheets:
             # Sheet visibility handling
             state = getattr(ws, "sheet_state", "visible")
@@ -223,8 +278,8 @@ def extract_xlsx_text(
 
                         # Only collect string-like content
                         if isinstance(val, str) and val.strip():
-                            if _append_and_maybe_stop(chunks, val + "\n", max_chars):
-                                return normalize_text("".join(chunks))
+                            if sample.add(val + "\n"):
+                                return sample.text()
                     except Exception:
                         # Ignore bad cells and keep going
                         continue
@@ -233,7 +288,7 @@ def extract_xlsx_text(
         # Propagate for processor to handle
         raise
 
-    return normalize_text("".join(chunks))
+    return sample.text()
 
 
 def extract_pdf_text(path: PathLike, max_chars: int) -> str:
@@ -248,30 +303,32 @@ def extract_pdf_text(path: PathLike, max_chars: int) -> str:
     """
     try:
         from pypdf import PdfReader
-        from pypdf.errors import PdfReadError
     except ImportError as exc:
         raise RuntimeError("pypdf is required to extract PDF text") from exc
 
-    p = Path(path)
-    chunks: List[str] = []
-    try:
-        reader = PdfReader(str(p))
-        if getattr(reader, "is_encrypted", False):
-            # Signal to caller; they will set metadata["read_error"]
-            raise PdfReadError("Encrypted PDF: cannot extract text")
-
-        for page in reader.pages:
-            try:
-                txt = page.extract_text() or ""
-                if txt:
-                    if _append_and_maybe_stop(chunks, txt + "\n", max_chars):
-                        return normalize_text("".join(chunks))
-            except Exception:
-                # Skip problematic pages
-                continue
+    # Propagate errors: processors catch and set their error flags
+    return extract_pdf_reader_text(PdfReader(os.fspath(path)), max_chars)
 
-    except Exception:
-        # Propagate for processor to handle
-        raise
 
-    return normalize_text("".join(chunks))
\ No newline at end of file
+def extract_pdf_reader_text(reader, max_chars: int) -> str:
+    """
+    Same as extract_pdf_text, for a pypdf PdfReader the caller already opened.
+    """
+    from pypdf.errors import PdfReadError
+
+    if getattr(reader, "is_encrypted", False):
+        # Signal to caller; they will set metadata["read_error"]
+        raise PdfReadError("Encrypted PDF: cannot extract text")
+
+    sample = _BoundedText(max_chars)
+    for page in reader.pages:
+        try:
+            txt = page.extract_text() or ""
+            if txt:
+                if sample.add(txt + "\n"):
+                    return sample.text()
+        except Exception:
+            # Skip problematic pages
+            continue
+
+    return sample.text()
@@ -0,0 +1,76 @@
+# utils/xml_utils.py
+"""
+XML helpers shared by the OOXML processors and services (DOCX, XLSX, themes).
+
+- local_name: strip the namespace from a tag ('{namespace}name' -> 'name').
+- iter_elements: stream the elements of an XML part whose local-name is in a
+  given set, freeing parsed elements as it goes (low memory on large parts).
+
+lxml is optional: when installed the tag filter runs inside the parser, so other
+elements never reach Python; the stdlib ElementTree fallback filters here instead.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, FrozenSet, Iterator, Tuple
+from xml.etree.ElementTree import iterparse
+
+try:  # lxml ships with python-docx/openpyxl; filters tags in C and parses faster than stdlib
+    from lxml.etree import iterparse as _lxml_iterparse
+except ImportError:  # pragma: no cover - fall back to the stdlib parser
+    _lxml_iterparse = None
+
+
+# Tag -> local-name. OOXML parts repeat a few dozen distinct tags on every element,
+# so after warm-up local_name is one dict lookup instead of a string split. Keyed on
+# the full tag, so any namespace (Transitional or Strict) works. Capped against odd input.
+_LOCAL_NAME_CACHE: Dict[str, str] = {}
+_LOCAL_NAME_CACHE_MAX = 4096
+
+
+def local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag: '{namespace}name' -> 'name'."""
+    r = _LOCAL_NAME_CACHE.get(tag)
+    if r is None:
+        r = tag.rpartition("}")[2]
+        if len(_LOCAL_NAME_CACHE) < _LOCAL_NAME_CACHE_MAX:
+            _LOCAL_NAME_CACHE[tag] = r
+    return r
+
+
+def iter_elements(fp, localnames: FrozenSet[str]) -> Iterator:
+    """
+    Yield the elements of an XML stream whose local-name is in localnames, in
+    document order ("end" events), freeing parsed elements as we go.
+
+    Callers read a yielded element's attributes before asking for the next one;
+    it is cleared afterwards.
+    """
+    if _lxml_iterparse is not None:
+        events = _lxml_iterparse(
+            fp, events=("end",), tag=_any_ns_tags(localnames), resolve_entities=False
+        )
+        for _event, elem in events:
+            yield elem
+            # lxml fast-iter: drop the element, then everything parsed before it. Unmatched
+            # elements never reach Python, but they are earlier siblings of the element or
+            # of one of its ancestors, so pruning along the ancestor chain frees them too.
+            elem.clear(keep_tail=True)
+            for node in chain((elem,), elem.iterancestors()):
+                while node.getprevious() is not None:
+                    del node.getparent()[0]
+        return
+
+    # 'events' = ("end",) is cheaper; clear elements as we go to save memory
+    for _event, elem in iterparse(fp, events=("end",)):
+        if local_name(elem.tag) in localnames:
+            yield elem
+        elem.clear()
+
+
+@lru_cache(maxsize=None)
+def _any_ns_tags(localnames: FrozenSet[str]) -> Tuple[str, ...]:
+    """lxml tag filters matching localnames in any namespace ('{*}name')."""
+    return tuple(sorted("{*}" + n for n in localnames))